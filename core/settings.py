@@ -115,6 +115,14 @@ DATABASES = {
 }
 DATABASES["default"]["TEST"] = {"NAME": "test_db"}
 
+# ────────────────────────────────────────────────────────────────────────────────
+#  CACHE  (local memory by default; set REDIS_URL to share it between workers)
+# ────────────────────────────────────────────────────────────────────────────────
+CACHES = {"default": {"BACKEND": "django.core.cache.backends.locmem.LocMemCache"}}
+if REDIS_URL := config("REDIS_URL", default=""):
+    CACHES["default"] = {"BACKEND": "django.core.cache.backends.redis.RedisCache", "LOCATION": REDIS_URL}
+FINANCE_CACHE_TIMEOUT = config("FINANCE_CACHE_TIMEOUT", cast=int, default=60 * 5)
+
 # ────────────────────────────────────────────────────────────────────────────────
 #  STATIC & WhiteNoise
 # ────────────────────────────────────────────────────────────────────────────────
@@ -143,6 +151,17 @@ REST_FRAMEWORK = {
     "ORDERING_PARAM": "ordering",
 }
 
+# How list pages compute `count`: "exact" | "cached" (per user, dropped on writes)
+# | "estimate" (PostgreSQL planner estimate above the threshold, exact below)
+FINANCE_PAGINATION_COUNT = config("FINANCE_PAGINATION_COUNT", default="exact")
+FINANCE_PAGINATION_ESTIMATE_THRESHOLD = 10_000
+# percentages of a budget's limit that emit a BudgetAlert (see finance.alerts)
+FINANCE_BUDGET_ALERT_THRESHOLDS = (80, 100)
+# a job still "running" this long after its claim belongs to a lost worker and is
+# re-queued (see finance.jobs), up to FINANCE_JOB_MAX_ATTEMPTS claims
+FINANCE_JOB_LEASE_SECONDS = config("FINANCE_JOB_LEASE_SECONDS", cast=int, default=60 * 60)
+FINANCE_JOB_MAX_ATTEMPTS = 3
+
 SPECTACULAR_SETTINGS = {
     "TITLE": "Personal Finance Tracker API",
     "VERSION": "0.1.0",
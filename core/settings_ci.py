@@ -76,6 +76,11 @@ DATABASES = {
     )
 }
 
+# ─────────────────────────── cache ──────────────────────────────────────────
+CACHES = {"default": {"BACKEND": "django.core.cache.backends.locmem.LocMemCache"}}
+if REDIS_URL := os.getenv("REDIS_URL"):
+    CACHES["default"] = {"BACKEND": "django.core.cache.backends.redis.RedisCache", "LOCATION": REDIS_URL}
+
 # ───────────────────────── static files / WhiteNoise ────────────────────────
 STATIC_URL = "/static/"
 STATIC_ROOT = BASE_DIR / "staticfiles"
@@ -84,7 +89,7 @@ STATICFILES_DIRS = [BASE_DIR / "static"]
 STORAGES = {
     "staticfiles": {
         "BACKEND": "whitenoise.storage.CompressedManifestStaticFilesStorage",
-    }
+    },
 }
 
 WHITENOISE_AUTOREFRESH = DEBUG  # auto-reload locally
@@ -122,6 +127,13 @@ REST_FRAMEWORK = {
     "ORDERING_PARAM": "ordering",
 }
 
+# How list pages compute `count`: "exact" | "cached" (per user, dropped on writes)
+# | "estimate" (PostgreSQL planner estimate above the threshold, exact below)
+FINANCE_PAGINATION_COUNT = os.getenv("FINANCE_PAGINATION_COUNT", "exact")
+FINANCE_PAGINATION_ESTIMATE_THRESHOLD = 10_000
+FINANCE_JOB_LEASE_SECONDS = 60 * 60
+FINANCE_JOB_MAX_ATTEMPTS = 3
+
 SPECTACULAR_SETTINGS = {
     "TITLE": "Personal Finance Tracker API",
     "VERSION": "0.1.0",
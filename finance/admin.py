@@ -1,7 +1,7 @@
 # finance/admin.py
 from django.contrib import admin
 
-from .models import Budget, Category, SavingsGoal, Transaction, Transfer
+from .models import Budget, Category, Job, SavingsGoal, Transaction, Transfer
 
 admin.site.register(Category)
 admin.site.register(Transaction)
@@ -9,6 +9,12 @@ admin.site.register(SavingsGoal)
 admin.site.register(Budget)
 
 
+@admin.register(Job)
+class JobAdmin(admin.ModelAdmin):
+    list_display = ("id", "user", "kind", "status", "progress", "attempts", "created", "finished_at")
+    list_filter = ("kind", "status")
+
+
 @admin.register(Transfer)
 class TransferAdmin(admin.ModelAdmin):
     list_display = (
@@ -0,0 +1,75 @@
+"""
+Budget threshold alerts, evaluated incrementally as the roll-up changes.
+
+`finance.rollups.flush()` hands every bucket it touched to `evaluate()`.
+Only expense buckets that grew in the *current* period matter; for those,
+the affected budgets and their period's roll-up totals are read (two
+indexed queries, independent of how many transactions exist) and a
+`BudgetAlert` is inserted for each threshold now reached. The unique
+(budget, threshold, period_start) constraint plus ``ignore_conflicts``
+makes re-crossing – or concurrent writers – a no-op.
+"""
+
+from __future__ import annotations
+
+from collections import defaultdict
+from datetime import date
+from decimal import Decimal
+from typing import Iterable, Tuple
+
+from django.conf import settings
+from django.db.models import Q
+from django.utils import timezone
+
+from .models import Budget, BudgetAlert, MonthlyCategoryTotal
+
+THRESHOLDS = tuple(sorted(getattr(settings, "FINANCE_BUDGET_ALERT_THRESHOLDS", (80, 100))))
+
+BucketKey = Tuple[int, int, int, int, str]  # (user_id, category_id, year, month, type)
+
+
+def evaluate(grown: Iterable[BucketKey]) -> int:
+    """Emit alerts for budgets affected by the `grown` buckets; returns how many thresholds are reached."""
+    grown = [key for key in grown if key[4] == "EX"]
+    today = timezone.localdate()
+    # a yearly budget also moves when an earlier month of this year grows
+    pairs = {(u, c) for u, c, year, month, _ in grown if year == today.year}
+    if not pairs:
+        return 0
+    this_month = {(u, c) for u, c, year, month, _ in grown if (year, month) == (today.year, today.month)}
+
+    match = Q()
+    for user_id, category_id in pairs:
+        match |= Q(user_id=user_id, category_id=category_id)
+    budgets = [b for b in Budget.objects.filter(match) if b.period == "Y" or (b.user_id, b.category_id) in this_month]
+    if not budgets:
+        return 0
+
+    spent = defaultdict(lambda: {"M": Decimal("0.00"), "Y": Decimal("0.00")})
+    totals = MonthlyCategoryTotal.objects.filter(
+        match, type="EX", year=today.year, month__lte=today.month
+    ).values_list("user_id", "category_id", "month", "total")
+    for user_id, category_id, month, total in totals:
+        bucket = spent[(user_id, category_id)]
+        bucket["Y"] += total
+        if month == today.month:
+            bucket["M"] += total
+
+    alerts = []
+    for budget in budgets:
+        used = spent[(budget.user_id, budget.category_id)][budget.period]
+        start = date(today.year, 1, 1) if budget.period == "Y" else today.replace(day=1)
+        alerts.extend(
+            BudgetAlert(
+                user_id=budget.user_id,
+                budget=budget,
+                threshold=threshold,
+                period_start=start,
+                spent=used,
+                limit=budget.limit,
+            )
+            for threshold in THRESHOLDS
+            if used * 100 >= budget.limit * threshold
+        )
+    BudgetAlert.objects.bulk_create(alerts, ignore_conflicts=True)
+    return len(alerts)
@@ -4,3 +4,6 @@ from django.apps import AppConfig
 class FinanceConfig(AppConfig):
     default_auto_field = "django.db.models.BigAutoField"
     name = "finance"
+
+    def ready(self):
+        from . import signals  # noqa: F401  (registers the receivers)
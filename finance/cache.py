@@ -0,0 +1,109 @@
+"""
+Per-user response cache for the read-heavy dashboard endpoints.
+
+Keys combine the endpoint, the user, the query string, today's date and a
+per-user *data version*. Every write to a model that feeds those endpoints
+bumps the version (see `finance.signals`), which makes all of the user's
+cached responses unreachable at once – no key scanning required.
+
+The version is a `DataVersion` row, bumped in the writing transaction: web
+workers, the scheduler and job workers all see it, even when each process
+keeps its responses in its own local-memory cache. Responses are stored
+through Django's cache framework: local-memory by default, any other
+backend (e.g. Redis via ``REDIS_URL``) through the ``CACHES`` setting.
+"""
+
+from __future__ import annotations
+
+import hashlib
+from typing import Callable, Dict
+
+from django.conf import settings
+from django.core.cache import caches
+from django.db.models import F
+from django.utils import timezone
+from rest_framework import status
+from rest_framework.response import Response
+
+from .models import DataVersion
+
+CACHE_ALIAS = getattr(settings, "FINANCE_CACHE_ALIAS", "default")
+CACHE_TIMEOUT = getattr(settings, "FINANCE_CACHE_TIMEOUT", 60 * 5)
+
+_STATS_KEYS = {"hits": "finance:stats:hits", "misses": "finance:stats:misses"}
+
+
+def _cache():
+    return caches[CACHE_ALIAS]
+
+
+def data_version(user_id) -> int:
+    return DataVersion.objects.filter(user_id=user_id).values_list("version", flat=True).first() or 0
+
+
+def bump_version(user_id) -> None:
+    """Invalidate every cached response of `user_id`, in every process."""
+    if DataVersion.objects.filter(user_id=user_id).update(version=F("version") + 1):
+        return
+    _, created = DataVersion.objects.get_or_create(user_id=user_id, defaults={"version": 1})
+    if not created:  # a concurrent writer created the row first
+        DataVersion.objects.filter(user_id=user_id).update(version=F("version") + 1)
+
+
+def _count(outcome: str) -> None:
+    key = _STATS_KEYS[outcome]
+    cache = _cache()
+    if not cache.add(key, 1, timeout=None):
+        try:
+            cache.incr(key)
+        except ValueError:  # evicted between add() and incr()
+            cache.set(key, 1, timeout=None)
+
+
+def stats() -> Dict[str, int]:
+    """Hit / miss counters since the cache was last cleared."""
+    values = _cache().get_many(list(_STATS_KEYS.values()))
+    return {outcome: values.get(key, 0) for outcome, key in _STATS_KEYS.items()}
+
+
+def remember(user_id, namespace: str, discriminator: str, compute: Callable[[], object]):
+    """
+    Memoise ``compute()`` for `user_id` until their data version changes.
+    Internal lookups; they stay out of the response-cache `stats()`.
+    """
+    digest = hashlib.md5(discriminator.encode(), usedforsecurity=False).hexdigest()
+    key = f"finance:{namespace}:{user_id}:{data_version(user_id)}:{digest}"
+    value = _cache().get(key)
+    if value is not None:
+        return value
+    value = compute()
+    _cache().set(key, value, CACHE_TIMEOUT)
+    return value
+
+
+def cache_key(request, namespace: str) -> str:
+    user_id = request.user.pk
+    query = repr(sorted(request.GET.lists()))  # order-insensitive
+    params = hashlib.md5(query.encode(), usedforsecurity=False).hexdigest()
+    return f"finance:{namespace}:{user_id}:{data_version(user_id)}:{timezone.localdate()}:{params}"
+
+
+def cached_response(request, namespace: str, build: Callable[[], Response]) -> Response:
+    """
+    Serve ``build()``'s payload from the cache when possible.
+    Only successful responses are stored; ``X-Cache`` tells which path was taken.
+    """
+    key = cache_key(request, namespace)
+    data = _cache().get(key)
+    if data is not None:
+        _count("hits")
+        response = Response(data)
+        response["X-Cache"] = "HIT"
+        return response
+
+    _count("misses")
+    response = build()
+    if response.status_code == status.HTTP_200_OK:
+        _cache().set(key, response.data, CACHE_TIMEOUT)
+    response["X-Cache"] = "MISS"
+    return response
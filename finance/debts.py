@@ -0,0 +1,45 @@
+"""
+Denormalised `Debt.total_paid` / `Debt.balance` maintenance.
+
+Payment writes adjust both columns with a single ``UPDATE … SET col = col ± x``
+(see `finance.signals`), so concurrent payments never lose an update and
+reads never aggregate payments. `reconcile()` recomputes the columns from
+the payment rows for repair (``manage.py reconcile_debts``).
+"""
+
+from __future__ import annotations
+
+from decimal import Decimal
+from typing import Optional
+
+from django.db.models import DecimalField, F, OuterRef, QuerySet, Subquery, Sum, Value
+from django.db.models.functions import Coalesce
+
+from .models import Debt, Payment
+
+
+def apply_payment(debt_id: Optional[int], amount: Decimal) -> None:
+    """Add `amount` (negative to reverse) to the debt's paid total and take it off its balance."""
+    if debt_id is None or not amount:
+        return
+    Debt.objects.filter(pk=debt_id).update(total_paid=F("total_paid") + amount, balance=F("balance") - amount)
+
+
+def paid_subquery():
+    money = DecimalField(max_digits=12, decimal_places=2)
+    paid = Payment.objects.filter(debt=OuterRef("pk")).order_by().values("debt").annotate(t=Sum("amount")).values("t")
+    return Coalesce(Subquery(paid, output_field=money), Value(Decimal("0.00")), output_field=money)
+
+
+def reconcile(debts: Optional[QuerySet] = None) -> int:
+    """Fix every debt whose stored columns drifted from its payments; returns how many were fixed."""
+    debts = Debt.objects.all() if debts is None else debts
+    actual = paid_subquery()
+    drifted = list(
+        debts.annotate(actual_paid=actual)
+        .exclude(total_paid=F("actual_paid"), balance=F("principal") - F("actual_paid"))
+        .values_list("pk", flat=True)
+    )
+    if drifted:
+        Debt.objects.filter(pk__in=drifted).update(total_paid=actual, balance=F("principal") - actual)
+    return len(drifted)
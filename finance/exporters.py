@@ -0,0 +1,106 @@
+"""
+Streaming export of a user's transactions.
+
+Rows are read as plain tuples with ``values_list(...).iterator(chunk_size)``
+– a server-side cursor on PostgreSQL – and encoded one line at a time into
+a `StreamingHttpResponse`, so memory stays flat however long the history.
+
+Supported formats
+─────────────────
+* **csv**   – header row; the ``date, amount, type, category, description``
+  columns are the ones `finance.importers` reads, so an export re-imports.
+  Text starting with ``= + - @`` (or tab / CR) is prefixed with ``'`` so
+  spreadsheets don't evaluate it as a formula.
+* **jsonl** – one JSON object per line (amounts as strings, ISO dates).
+"""
+
+from __future__ import annotations
+
+import csv
+import json
+from typing import Iterable, Iterator, Tuple
+
+from django.core.serializers.json import DjangoJSONEncoder
+from django.http import StreamingHttpResponse
+from rest_framework.exceptions import NotAcceptable
+from rest_framework.negotiation import DefaultContentNegotiation
+from rest_framework.renderers import BaseRenderer
+
+COLUMNS = ("id", "date", "type", "amount", "category", "description", "transfer")
+FIELDS = ("id", "date", "type", "amount", "category__name", "description", "transfer_id")
+CHUNK_SIZE = 2000
+FORMULA_PREFIXES = ("=", "+", "-", "@", "\t", "\r")
+
+
+class _Echo:
+    """File-like sink that hands each `csv.writer` line straight back."""
+
+    def write(self, value: str) -> str:
+        return value
+
+
+def _cell(value):
+    if isinstance(value, str) and value.startswith(FORMULA_PREFIXES):
+        return "'" + value
+    return value
+
+
+def csv_lines(rows: Iterable[Tuple]) -> Iterator[str]:
+    writer = csv.writer(_Echo())
+    yield writer.writerow(COLUMNS)
+    for row in rows:
+        yield writer.writerow([_cell(value) for value in row])
+
+
+def jsonl_lines(rows: Iterable[Tuple]) -> Iterator[str]:
+    for row in rows:
+        yield json.dumps(dict(zip(COLUMNS, row)), cls=DjangoJSONEncoder) + "\n"
+
+
+FORMATS = {
+    "csv": ("text/csv", csv_lines),
+    "jsonl": ("application/x-ndjson", jsonl_lines),
+}
+
+
+def stream(queryset, fmt: str) -> StreamingHttpResponse:
+    content_type, encode = FORMATS[fmt]
+    rows = queryset.values_list(*FIELDS).iterator(chunk_size=CHUNK_SIZE)
+    response = StreamingHttpResponse(encode(rows), content_type=f"{content_type}; charset=utf-8")
+    response["Content-Disposition"] = f'attachment; filename="transactions.{fmt}"'
+    return response
+
+
+# ─────────────────────────────── renderers ───────────────────────────────────
+class _ExportRenderer(BaseRenderer):
+    """
+    Lets DRF's ``?format=`` negotiation accept the export formats. Successful
+    exports bypass rendering (they stream); errors are rendered as JSON.
+    """
+
+    charset = "utf-8"
+
+    def render(self, data, accepted_media_type=None, renderer_context=None):
+        return b"" if data is None else json.dumps(data, cls=DjangoJSONEncoder).encode()
+
+
+class CSVRenderer(_ExportRenderer):
+    media_type = "text/csv"
+    format = "csv"
+
+
+class JSONLinesRenderer(_ExportRenderer):
+    media_type = "application/x-ndjson"
+    format = "jsonl"
+
+
+class ExportContentNegotiation(DefaultContentNegotiation):
+    """``?format=`` or a matching Accept header picks the export; anything else gets CSV."""
+
+    def select_renderer(self, request, renderers, format_suffix=None):
+        try:
+            return super().select_renderer(request, renderers, format_suffix)
+        except NotAcceptable:
+            if format_suffix or request.query_params.get(self.settings.URL_FORMAT_OVERRIDE):
+                raise  # an explicitly unknown format stays an error
+            return renderers[0], renderers[0].media_type
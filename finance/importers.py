@@ -0,0 +1,239 @@
+"""
+Bulk import of bank history.
+
+Parsers stream a text file and yield ``(line_no, raw_row)`` pairs without
+ever holding the whole file in memory; `import_transactions()` validates
+the rows, resolves their categories with one lookup per batch and writes
+them with `bulk_create`.
+
+Supported formats
+─────────────────
+* **csv** – header row with ``date, amount`` and optional ``type``,
+  ``category``, ``description`` columns. Without a ``type`` column the sign
+  of ``amount`` decides: negative → expense, positive → income.
+* **ofx** – ``<STMTTRN>`` blocks (SGML 1.x or XML 2.x).
+* **qif** – ``D``/``T``/``P``/``M``/``L`` records terminated by ``^``.
+
+Files must be UTF-8 (a BOM is allowed); uploads are checked with
+`check_encoding()` before they are queued (see `finance.jobs.attach_file`).
+"""
+
+from __future__ import annotations
+
+import codecs
+import csv
+import re
+from datetime import date, datetime
+from decimal import Decimal, InvalidOperation
+from itertools import islice
+from typing import IO, Callable, Dict, Iterable, Iterator, List, Optional, Tuple
+
+from django.core.exceptions import ValidationError
+from django.core.validators import DecimalValidator
+from django.db import transaction as db_tx
+
+from . import cache, rollups
+from .models import Category, Transaction
+
+RawRow = Tuple[int, Dict[str, str]]
+
+DEFAULT_BATCH_SIZE = 1000
+MAX_REPORTED_ERRORS = 100
+ENCODING = "utf-8-sig"
+
+_DATE_FORMATS = ("%Y-%m-%d", "%Y%m%d", "%m/%d/%Y", "%m/%d/%y", "%m/%d'%y", "%d.%m.%Y")
+_TYPE_ALIASES = {"in": "IN", "income": "IN", "credit": "IN", "ex": "EX", "expense": "EX", "debit": "EX"}
+_DESCRIPTION_MAX = Transaction._meta.get_field("description").max_length
+_AMOUNT_FIELD = Transaction._meta.get_field("amount")
+_AMOUNT_VALIDATOR = DecimalValidator(_AMOUNT_FIELD.max_digits, _AMOUNT_FIELD.decimal_places)
+_AMOUNT_QUANTUM = Decimal(1).scaleb(-_AMOUNT_FIELD.decimal_places)
+_CATEGORY_MAX = Category._meta.get_field("name").max_length
+
+
+# ─────────────────────────────── parsers ───────────────────────────────────
+def parse_csv(stream: IO[str]) -> Iterator[RawRow]:
+    reader = csv.DictReader(stream)
+    reader.fieldnames = [name.strip().lower() for name in reader.fieldnames or []]
+    for row in reader:
+        yield reader.line_num, {key: (value or "").strip() for key, value in row.items() if key}
+
+
+_OFX_TAG = re.compile(r"<(/?)(\w+)>([^<\r\n]*)")
+
+
+def parse_ofx(stream: IO[str]) -> Iterator[RawRow]:
+    current: Optional[Dict[str, str]] = None
+    for line_no, line in enumerate(stream, start=1):
+        for closing, tag, value in _OFX_TAG.findall(line):
+            tag = tag.upper()
+            if tag == "STMTTRN":
+                if closing and current is not None:
+                    yield line_no, _from_ofx(current)
+                current = None if closing else {}
+            elif current is not None and not closing:
+                current[tag] = value.strip()
+
+
+def _from_ofx(fields: Dict[str, str]) -> Dict[str, str]:
+    return {
+        "date": fields.get("DTPOSTED", "")[:8],
+        "amount": fields.get("TRNAMT", ""),
+        "description": fields.get("NAME") or fields.get("MEMO", ""),
+    }
+
+
+_QIF_FIELDS = {"D": "date", "T": "amount", "U": "amount", "P": "description", "M": "memo", "L": "category"}
+
+
+def parse_qif(stream: IO[str]) -> Iterator[RawRow]:
+    current: Dict[str, str] = {}
+    for line_no, line in enumerate(stream, start=1):
+        line = line.strip()
+        if not line or line.startswith("!"):
+            continue
+        if line == "^":
+            if current:
+                memo = current.pop("memo", "")
+                current.setdefault("description", memo)
+                yield line_no, current
+            current = {}
+        elif line[0] in _QIF_FIELDS:
+            current.setdefault(_QIF_FIELDS[line[0]], line[1:].strip())
+
+
+PARSERS = {"csv": parse_csv, "ofx": parse_ofx, "qif": parse_qif}
+
+
+# ─────────────────────────────── encoding ──────────────────────────────────
+def check_encoding(upload) -> None:
+    """Raise ValueError unless the whole upload decodes as UTF-8 (read chunk by chunk)."""
+    decoder = codecs.getincrementaldecoder(ENCODING)()
+    offset = 0
+    try:
+        for chunk in upload.chunks():
+            decoder.decode(chunk)
+            offset += len(chunk)
+        decoder.decode(b"", final=True)
+    except UnicodeDecodeError as exc:
+        raise ValueError(f"File is not UTF-8 encoded (invalid byte at offset {offset + exc.start}).") from None
+    finally:
+        upload.seek(0)
+
+
+# ─────────────────────────────── validation ────────────────────────────────
+def _parse_date(value: str) -> date:
+    try:
+        return date.fromisoformat(value)  # fast path for the common case
+    except ValueError:
+        pass
+    for fmt in _DATE_FORMATS[1:]:
+        try:
+            return datetime.strptime(value, fmt).date()
+        except ValueError:
+            continue
+    raise ValueError(f"Unrecognised date {value!r}.")
+
+
+def clean_row(raw: Dict[str, str]) -> Dict[str, object]:
+    """Validate one raw row → kwargs for `Transaction` (minus user/category)."""
+    try:
+        amount = Decimal(raw.get("amount", "").replace(",", ""))
+    except InvalidOperation:
+        raise ValueError(f"Invalid amount {raw.get('amount')!r}.") from None
+    if not amount or not amount.is_finite():
+        raise ValueError("Amount must be non-zero.")
+    try:
+        magnitude = abs(amount).quantize(_AMOUNT_QUANTUM)
+        _AMOUNT_VALIDATOR(magnitude)  # what the column holds – fail the row, not the insert
+    except InvalidOperation:
+        raise ValueError(f"Amount {raw['amount']!r} is too large.") from None
+    except ValidationError as exc:
+        raise ValueError(exc.messages[0]) from None
+
+    type_ = raw.get("type", "")
+    if type_:
+        try:
+            type_ = _TYPE_ALIASES[type_.lower()]
+        except KeyError:
+            raise ValueError(f"Unknown type {raw['type']!r}.") from None
+    else:
+        type_ = "EX" if amount < 0 else "IN"
+
+    category = raw.get("category", "")
+    if len(category) > _CATEGORY_MAX:
+        raise ValueError(f"Category name longer than {_CATEGORY_MAX} characters.")
+
+    return {
+        "date": _parse_date(raw.get("date", "")),
+        "amount": magnitude,
+        "type": type_,
+        "description": raw.get("description", "")[:_DESCRIPTION_MAX],
+        "category": category,
+    }
+
+
+def _categories_by_name(user, names: set) -> Dict[str, Category]:
+    """One lookup per batch; unknown names are created for the user."""
+    found = {c.name: c for c in Category.objects.filter(user=user, name__in=names)}
+    missing = names - found.keys()
+    if missing:
+        Category.objects.bulk_create([Category(user=user, name=name) for name in missing], ignore_conflicts=True)
+        found.update({c.name: c for c in Category.objects.filter(user=user, name__in=missing)})
+    return found
+
+
+# ─────────────────────────────── loader ────────────────────────────────────
+def import_transactions(
+    user,
+    rows: Iterable[RawRow],
+    default_category: Optional[Category] = None,
+    batch_size: int = DEFAULT_BATCH_SIZE,
+    on_progress: Optional[Callable[[int], None]] = None,
+) -> Dict[str, object]:
+    """
+    Insert every valid row for `user`; invalid rows are skipped and reported.
+    The whole import is one database transaction. `on_progress` is called
+    after each batch with the number of rows read so far.
+    """
+    imported, error_count = 0, 0
+    errors: List[Dict[str, object]] = []
+
+    def reject(line_no: int, message: str) -> None:
+        nonlocal error_count
+        error_count += 1
+        if len(errors) < MAX_REPORTED_ERRORS:
+            errors.append({"row": line_no, "error": message})
+
+    rows = iter(rows)
+    read = 0
+    deltas = rollups.collect()  # bulk_create bypasses the model signals
+    with db_tx.atomic():
+        while batch := list(islice(rows, batch_size)):
+            cleaned = []
+            for line_no, raw in batch:
+                try:
+                    cleaned.append((line_no, clean_row(raw)))
+                except ValueError as exc:
+                    reject(line_no, str(exc))
+
+            categories = _categories_by_name(user, {row["category"] for _, row in cleaned if row["category"]})
+            objs = []
+            for line_no, row in cleaned:
+                category = categories.get(row.pop("category")) or default_category
+                if category is None:
+                    reject(line_no, "No category given and no default category set.")
+                    continue
+                objs.append(Transaction(user=user, category=category, **row))
+
+            Transaction.objects.bulk_create(objs, batch_size=batch_size)
+            rollups.collect(added=objs, into=deltas)
+            imported += len(objs)
+            read += len(batch)
+            if on_progress:
+                on_progress(read)
+
+        rollups.flush(deltas)
+
+    if imported:
+        cache.bump_version(user.pk)
+    return {"imported": imported, "error_count": error_count, "errors": errors}
@@ -0,0 +1,242 @@
+"""
+Database-backed job queue for work that shouldn't block a request.
+
+Endpoints `enqueue()` a `Job` row and answer ``202 Accepted`` with its
+status URL (``/jobs/<id>/``); `manage.py run_jobs` workers `claim()` queued rows with
+``SELECT … FOR UPDATE SKIP LOCKED`` (the database is the only broker) and
+execute the handler registered for the job's `kind`.
+
+Files a job needs (bank exports to import) travel the same way: the web
+process `attach_file()`s them as `JobFileChunk` rows in the enqueuing
+transaction and the handler streams them back with `open_file()`, so web
+and worker need not share a disk.
+
+Handlers run inside their own transactions, so live progress is published
+through the cache (shared between web and worker processes when Redis is
+configured) and persisted on the row when the job finishes.
+
+A claim is a lease, renewed by every `report_progress()`: a job still
+``running`` ``FINANCE_JOB_LEASE_SECONDS`` after its last renewal belongs to a
+worker that died, and is claimed again until it has been tried
+``FINANCE_JOB_MAX_ATTEMPTS`` times. Only the latest claim may finish a job.
+Recurring posting and roll-up rebuilds are idempotent; an import is not, so
+it locks its job row and marks the job done in the import's own transaction
+– a crash rolls both back, and a stale worker finds the job is no longer its.
+"""
+
+from __future__ import annotations
+
+import io
+import logging
+from datetime import timedelta
+from itertools import count
+from typing import IO, Callable, Dict, Iterator, Optional
+
+from django.conf import settings
+from django.core.cache import caches
+from django.db import transaction as db_tx
+from django.db.models import Q
+from django.utils import timezone
+
+from . import cache, importers, posting, rollups
+from .models import Category, Job, JobFileChunk
+
+logger = logging.getLogger(__name__)
+
+HANDLERS: Dict[str, Callable[[Job], dict]] = {}
+
+FILE_CHUNK_SIZE = 256 * 1024
+
+LEASE = timedelta(seconds=getattr(settings, "FINANCE_JOB_LEASE_SECONDS", 60 * 60))
+MAX_ATTEMPTS = getattr(settings, "FINANCE_JOB_MAX_ATTEMPTS", 3)
+
+
+def handler(kind: str):
+    """Register the decorated function as the handler for `kind` jobs."""
+
+    def register(func):
+        HANDLERS[kind] = func
+        return func
+
+    return register
+
+
+# ───────────────────────────── Queue primitives ────────────────────────────────
+def enqueue(user, kind: str, **payload) -> Job:
+    if kind not in HANDLERS:
+        raise ValueError(f"Unknown job kind {kind!r}.")
+    return Job.objects.create(user=user, kind=kind, payload=payload)
+
+
+def claim() -> Optional[Job]:
+    """
+    Mark the oldest queued (or lease-expired) job as running and return it
+    (None when idle). Lost jobs out of attempts are failed instead.
+    """
+    while True:
+        with db_tx.atomic():
+            now = timezone.now()
+            job = (
+                Job.objects.select_for_update(skip_locked=True)
+                .filter(Q(status=Job.Status.QUEUED) | Q(status=Job.Status.RUNNING, started_at__lt=now - LEASE))
+                .order_by("id")
+                .first()
+            )
+            if job is None:
+                return None
+            if job.attempts >= MAX_ATTEMPTS:
+                logger.error("Job %s (%s) lost its worker %s times; giving up", job.pk, job.kind, job.attempts)
+                job.status, job.error, job.finished_at = Job.Status.FAILED, "Worker lost.", now
+                job.save(update_fields=["status", "error", "finished_at", "modified"])
+                continue
+            job.status = Job.Status.RUNNING
+            job.started_at = now
+            job.attempts += 1
+            job.save(update_fields=["status", "started_at", "attempts", "modified"])
+        return job
+
+
+class LostJob(Exception):
+    """The job was re-claimed by another worker after this one's lease ran out."""
+
+
+def run(job: Job) -> Job:
+    try:
+        result = HANDLERS[job.kind](job)
+    except Exception as exc:
+        logger.exception("Job %s (%s) failed", job.pk, job.kind)
+        finished = finish(job, Job.Status.FAILED, error=f"{type(exc).__name__}: {exc}")
+    else:
+        finished = finish(job, Job.Status.SUCCEEDED, result=result)
+    _progress_cache().delete(_progress_key(job.pk))
+    if not finished:  # the handler finished it itself, or another worker holds it now
+        job.refresh_from_db()
+    return job
+
+
+def _owned(job: Job):
+    """The job's row while this claim still holds it."""
+    return Job.objects.filter(pk=job.pk, status=Job.Status.RUNNING, attempts=job.attempts)
+
+
+def finish(job: Job, status: str, result=None, error: str = "") -> bool:
+    """
+    Record the outcome – and drop the job's files – unless the job was
+    finished already or re-claimed elsewhere. Returns whether it was recorded.
+    """
+    job.status, job.result, job.error, job.finished_at = status, result, error, timezone.now()
+    recorded = _owned(job).update(
+        status=status,
+        result=result,
+        error=error,
+        progress=job.progress,
+        finished_at=job.finished_at,
+        modified=job.finished_at,
+    )
+    if recorded:
+        job.file_chunks.all().delete()
+    return bool(recorded)
+
+
+def run_next() -> Optional[Job]:
+    job = claim()
+    return run(job) if job else None
+
+
+# ──────────────────────────────── Files ────────────────────────────────
+def attach_file(job: Job, upload) -> None:
+    """Store `upload` with `job`, one row per chunk – never the whole file in memory."""
+    upload.seek(0)
+    for seq, chunk in enumerate(iter(lambda: upload.read(FILE_CHUNK_SIZE), b"")):
+        JobFileChunk.objects.create(job=job, seq=seq, data=chunk)
+
+
+def open_file(job: Job, encoding: str) -> IO[str]:
+    """The job's file as a text stream, fetched a chunk at a time."""
+    return io.TextIOWrapper(io.BufferedReader(_ChunkReader(_chunks(job.pk))), encoding=encoding, newline="")
+
+
+def _chunks(job_id) -> Iterator[bytes]:
+    for seq in count():
+        data = JobFileChunk.objects.filter(job_id=job_id, seq=seq).values_list("data", flat=True).first()
+        if data is None:
+            return
+        yield bytes(data)
+
+
+class _ChunkReader(io.RawIOBase):
+    def __init__(self, chunks: Iterator[bytes]):
+        self._chunks = chunks
+        self._pending = memoryview(b"")
+
+    def readable(self) -> bool:
+        return True
+
+    def readinto(self, buffer) -> int:
+        while not self._pending:
+            chunk = next(self._chunks, None)
+            if chunk is None:
+                return 0
+            self._pending = memoryview(chunk)
+        size = min(len(buffer), len(self._pending))
+        buffer[:size] = self._pending[:size]
+        self._pending = self._pending[size:]
+        return size
+
+
+# ──────────────────────────────── Progress ────────────────────────────────
+def _progress_cache():
+    return caches[cache.CACHE_ALIAS]
+
+
+def _progress_key(job_id) -> str:
+    return f"finance:job:{job_id}:progress"
+
+
+def report_progress(job: Job, done: int) -> None:
+    """Publish progress and renew the claim's lease."""
+    job.progress = done
+    _progress_cache().set(_progress_key(job.pk), done, timeout=60 * 60)
+    job.started_at = timezone.now()
+    _owned(job).update(started_at=job.started_at)
+
+
+def progress(job: Job) -> int:
+    if job.status == Job.Status.RUNNING:
+        return _progress_cache().get(_progress_key(job.pk), job.progress)
+    return job.progress
+
+
+# ──────────────────────────────── Handlers ────────────────────────────────
+@handler("post_recurring")
+def _post_recurring(job: Job) -> dict:
+    today = timezone.localdate()
+    result = posting.post_for_user(job.user_id, today)
+    report_progress(job, result["rules"])
+    return {"posted": result["posted"], "date": str(today)}
+
+
+@handler("import_transactions")
+def _import_transactions(job: Job) -> dict:
+    payload = job.payload
+    category = Category.objects.filter(pk=payload.get("category"), user=job.user_id).first()
+    with db_tx.atomic():
+        # held until commit: no other worker can claim the job meanwhile
+        if _owned(job).select_for_update().values_list("pk", flat=True).first() is None:
+            raise LostJob(f"Job {job.pk} was claimed again.")
+        with open_file(job, importers.ENCODING) as stream:
+            result = importers.import_transactions(
+                job.user,
+                importers.PARSERS[payload["format"]](stream),
+                default_category=category,
+                on_progress=lambda n: report_progress(job, n),
+            )
+        finish(job, Job.Status.SUCCEEDED, result=result)  # commits with the rows
+    return result
+
+
+@handler("rebuild_rollups")
+def _rebuild_rollups(job: Job) -> dict:
+    written = rollups.rebuild(users=[job.user_id])
+    report_progress(job, written)
+    return {"rows": written}
@@ -0,0 +1,49 @@
+import time
+from pathlib import Path
+
+from django.contrib.auth import get_user_model
+from django.core.management.base import BaseCommand, CommandError
+
+from finance import importers
+from finance.models import Category
+
+
+class Command(BaseCommand):
+    help = "Stream-import a CSV / OFX / QIF bank export into one user's transactions."
+
+    def add_arguments(self, parser):
+        parser.add_argument("path")
+        parser.add_argument("--user", required=True, help="owner's email")
+        parser.add_argument("--format", choices=sorted(importers.PARSERS), help="defaults to the file extension")
+        parser.add_argument("--category", help="category name for rows without one (created if missing)")
+        parser.add_argument("--batch-size", type=int, default=importers.DEFAULT_BATCH_SIZE)
+
+    # ------------------------------------------------------------------ #
+    def handle(self, path, *args, user, format=None, category=None, batch_size, **kwargs):
+        owner = get_user_model().objects.filter(email=user).first()
+        if owner is None:
+            raise CommandError(f"No user with email {user!r}.")
+
+        fmt = format or Path(path).suffix.lstrip(".").lower()
+        if fmt not in importers.PARSERS:
+            raise CommandError("Cannot infer the format; pass --format csv|ofx|qif.")
+
+        default_category = Category.objects.get_or_create(user=owner, name=category)[0] if category else None
+
+        started = time.monotonic()
+        with open(path, encoding=importers.ENCODING, newline="") as stream:
+            result = importers.import_transactions(
+                owner,
+                importers.PARSERS[fmt](stream),
+                default_category=default_category,
+                batch_size=batch_size,
+            )
+        elapsed = time.monotonic() - started
+
+        for error in result["errors"]:
+            self.stderr.write(f"row {error['row']}: {error['error']}")
+        self.stdout.write(
+            self.style.SUCCESS(
+                f"✓ Imported {result['imported']} rows ({result['error_count']} rejected) in {elapsed:.2f}s."
+            )
+        )
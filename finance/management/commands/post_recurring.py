@@ -1,10 +1,19 @@
 import datetime as dt
+import time
+from concurrent.futures import ProcessPoolExecutor
+from functools import partial
 
-from dateutil.rrule import rrulestr
-from django.core.management.base import BaseCommand
-from django.db import transaction as db_tx
+import django
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connections
 
-from finance.models import RecurringTransaction, Transaction
+from finance import posting
+
+
+def _init_worker():
+    # forked children must open their own connections; spawned ones need the app registry
+    django.setup()
+    connections.close_all()
 
 
 class Command(BaseCommand):
@@ -12,63 +21,39 @@ class Command(BaseCommand):
 
     def add_arguments(self, parser):
         parser.add_argument("--dry-run", action="store_true")
+        parser.add_argument("--batch-size", type=int, default=posting.DEFAULT_BATCH_SIZE)
+        parser.add_argument("--workers", type=int, default=1, help="Shard users across N processes.")
 
     # ------------------------------------------------------------------ #
-    def handle(self, *args, dry_run=False, **kwargs):
-        today = dt.date.today()
-        due_qs = (
-            RecurringTransaction.objects.filter(active=True, next_occurrence__lte=today)
-            .select_related("user", "category")
-            .order_by("next_occurrence")
-        )
+    def handle(self, *args, dry_run=False, batch_size=posting.DEFAULT_BATCH_SIZE, workers=1, **kwargs):
+        if workers < 1:
+            raise CommandError("--workers must be at least 1.")
+        if batch_size < 1:
+            raise CommandError("--batch-size must be at least 1.")
 
-        if not due_qs.exists():
+        today = dt.date.today()
+        if not posting.due_rules(today).exists():
             self.stdout.write(self.style.SUCCESS("Nothing due today."))
             return
 
-        with db_tx.atomic():
-            for r in due_qs:
-                while r.active and r.next_occurrence <= today:
-                    self._post_once(r, dry_run)
-
-                    # ensure it's a plain *date* before looping again
-                    if isinstance(r.next_occurrence, dt.datetime):
-                        r.next_occurrence = r.next_occurrence.date()
-
-            if dry_run:
-                db_tx.set_rollback(True)
-
-        self.stdout.write(self.style.SUCCESS("✓ Finished."))
-        if dry_run:
-            self.stdout.write(self.style.WARNING(" (dry-run: rolled back)"))
-
-    # ------------------------------------------------------------------ #
-    def _post_once(self, r: RecurringTransaction, dry_run: bool):
-        if not dry_run:
-            Transaction.objects.create(
-                user=r.user,
-                category=r.category,
-                amount=r.amount,
-                type=r.type,
-                description=r.description,
-                date=r.next_occurrence,
+        started = time.monotonic()
+        run = partial(posting.post_shard, workers=workers, today=today, batch_size=batch_size, dry_run=dry_run)
+        if workers == 1:
+            results = [run(0)]
+        else:
+            connections.close_all()  # never share a socket with the children
+            with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker) as pool:
+                results = list(pool.map(run, range(workers)))
+        elapsed = time.monotonic() - started
+
+        totals = {key: sum(r[key] for r in results) for key in results[0]}
+        self.stdout.write(
+            self.style.SUCCESS(
+                f"✓ Posted {totals['posted']} transactions for {totals['rules']} rules "
+                f"({totals['users']} users, {workers} workers) in {elapsed:.2f}s."
             )
-
-        # ----- make sure dtstart is a datetime ------------------------
-        dt_start = (
-            r.next_occurrence
-            if isinstance(r.next_occurrence, dt.datetime)
-            else dt.datetime.combine(r.next_occurrence, dt.time.min)
         )
-
-        rule = rrulestr(r.rrule, dtstart=dt_start)
-        next_dt = rule.after(dt_start)  # datetime | None
-        next_date = next_dt.date() if next_dt else None
-
-        if next_date is None or (r.end_date and next_date > r.end_date):
-            r.active = False
-        else:
-            r.next_occurrence = next_date  # store as *date*
-
-        if not dry_run:
-            r.save(update_fields=["next_occurrence", "active"])
+        if totals["failed"]:
+            self.stderr.write(self.style.ERROR(f"✗ {totals['failed']} users failed; see the log for details."))
+        if dry_run:
+            self.stdout.write(self.style.WARNING(" (dry-run: nothing written)"))
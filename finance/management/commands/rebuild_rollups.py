@@ -0,0 +1,22 @@
+from django.contrib.auth import get_user_model
+from django.core.management.base import BaseCommand, CommandError
+
+from finance import rollups
+
+
+class Command(BaseCommand):
+    help = "Recompute the monthly per-category roll-up table from raw transactions."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--user", help="only rebuild this user's totals (email)")
+
+    # ------------------------------------------------------------------ #
+    def handle(self, *args, user=None, **kwargs):
+        users = None
+        if user:
+            users = get_user_model().objects.filter(email=user)
+            if not users.exists():
+                raise CommandError(f"No user with email {user!r}.")
+
+        written = rollups.rebuild(users)
+        self.stdout.write(self.style.SUCCESS(f"✓ Rebuilt {written} monthly totals."))
@@ -0,0 +1,24 @@
+from django.contrib.auth import get_user_model
+from django.core.management.base import BaseCommand, CommandError
+
+from finance import debts
+from finance.models import Debt
+
+
+class Command(BaseCommand):
+    help = "Recompute Debt.total_paid / Debt.balance from payments and fix any drift."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--user", help="only reconcile this user's debts (email)")
+
+    # ------------------------------------------------------------------ #
+    def handle(self, *args, user=None, **kwargs):
+        qs = Debt.objects.all()
+        if user:
+            users = get_user_model().objects.filter(email=user)
+            if not users.exists():
+                raise CommandError(f"No user with email {user!r}.")
+            qs = qs.filter(user__in=users)
+
+        fixed = debts.reconcile(qs)
+        self.stdout.write(self.style.SUCCESS(f"✓ Reconciled {fixed} debts."))
@@ -0,0 +1,38 @@
+import signal
+import threading
+
+from django.core.management.base import BaseCommand
+from django.db import connections
+
+from finance import jobs
+
+
+class Command(BaseCommand):
+    help = "Worker for the database-backed job queue (imports, recurring posting, roll-up rebuilds)."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--once", action="store_true", help="Drain the queue, then exit.")
+        parser.add_argument("--poll", type=float, default=2.0, help="Seconds to wait when the queue is empty.")
+
+    # ------------------------------------------------------------------ #
+    def handle(self, *args, once=False, poll=2.0, **kwargs):
+        stop = threading.Event()
+        if not once:
+            signal.signal(signal.SIGTERM, lambda *_: stop.set())
+            signal.signal(signal.SIGINT, lambda *_: stop.set())
+
+        processed = 0
+        while not stop.is_set():
+            job = jobs.run_next()
+            if job is None:
+                if once:
+                    break
+                connections.close_all()  # don't hold an idle connection while waiting
+                stop.wait(poll)
+                continue
+
+            processed += 1
+            style = self.style.SUCCESS if job.status == job.Status.SUCCEEDED else self.style.ERROR
+            self.stdout.write(style(f"Job {job.pk} {job.kind}: {job.status}"))
+
+        self.stdout.write(f"Processed {processed} jobs.")
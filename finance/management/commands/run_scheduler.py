@@ -0,0 +1,110 @@
+import datetime as dt
+import logging
+import signal
+import threading
+import time
+from typing import Dict, Tuple
+
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connections
+from django.db.models import Min
+from django.utils import timezone
+
+from finance import posting
+from finance.models import RecurringTransaction
+
+logger = logging.getLogger(__name__)
+
+RETRY_BASE = 30.0  # seconds before the first retry of a user whose posting failed or was locked
+RETRY_MAX = 60 * 60.0
+
+
+class Command(BaseCommand):
+    help = (
+        "Long-running recurring-posting scheduler: posts every due rule, then sleeps until the "
+        "earliest next_occurrence (capped by --max-sleep so newly added rules are picked up). "
+        "A user whose rules fail or stay locked is retried with exponential backoff."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--once", action="store_true", help="Run a single pass and exit.")
+        parser.add_argument("--max-sleep", type=float, default=300.0, help="Upper bound in seconds between passes.")
+        parser.add_argument("--batch-size", type=int, default=posting.DEFAULT_BATCH_SIZE)
+
+    # ------------------------------------------------------------------ #
+    def handle(self, *args, once=False, max_sleep=300.0, batch_size=posting.DEFAULT_BATCH_SIZE, **kwargs):
+        if batch_size < 1:
+            raise CommandError("--batch-size must be at least 1.")
+        self._stop = threading.Event()
+        self._backoff: Dict[int, Tuple[int, float]] = {}  # user id → (misses in a row, retry at monotonic)
+        if not once:
+            signal.signal(signal.SIGTERM, lambda *_: self._stop.set())
+            signal.signal(signal.SIGINT, lambda *_: self._stop.set())
+
+        while not self._stop.is_set():
+            self.run_pass(batch_size)
+            if once:
+                break
+            delay = self.seconds_until_due(max_sleep, exclude_users=self._backoff)
+            if self._backoff:
+                next_retry = min(at for _, at in self._backoff.values()) - time.monotonic()
+                delay = min(delay, max(1.0, next_retry))
+            connections.close_all()  # don't hold an idle connection while asleep
+            self._stop.wait(delay)
+
+        self.stdout.write("Scheduler stopped.")
+
+    def run_pass(self, batch_size):
+        today = timezone.localdate()
+        started = time.monotonic()
+        waiting = {user_id for user_id, (_, at) in self._backoff.items() if at > started}
+        user_ids = [
+            user_id
+            for user_id in posting.due_rules(today).values_list("user_id", flat=True).distinct().order_by("user_id")
+            if user_id not in waiting
+        ]
+        if not user_ids:
+            return
+
+        posted = rules = failed = 0
+        for user_id in user_ids:
+            try:
+                result = posting.post_for_user(user_id, today, batch_size=batch_size)
+            except Exception:
+                logger.exception("Posting recurring transactions failed for user %s", user_id)
+                failed += 1
+                self.back_off(user_id)
+                continue
+            posted += result["posted"]
+            rules += result["rules"]
+            if result["rules"]:
+                self._backoff.pop(user_id, None)
+            else:  # every due rule locked by another poster
+                self.back_off(user_id)
+
+        self.stdout.write(
+            self.style.SUCCESS(
+                f"✓ Posted {posted} transactions for {rules} rules in {time.monotonic() - started:.2f}s."
+            )
+        )
+        if failed:
+            self.stderr.write(self.style.ERROR(f"✗ {failed} users failed; see the log for details."))
+
+    def back_off(self, user_id: int) -> None:
+        misses = self._backoff.get(user_id, (0, 0.0))[0] + 1
+        delay = min(RETRY_BASE * 2 ** (misses - 1), RETRY_MAX)
+        self._backoff[user_id] = (misses, time.monotonic() + delay)
+
+    @staticmethod
+    def seconds_until_due(max_sleep: float, exclude_users=()) -> float:
+        """
+        Seconds until local midnight of the earliest active next_occurrence, within
+        [1, max_sleep]; rules of `exclude_users` (backing off) are left out.
+        """
+        rules = RecurringTransaction.objects.filter(active=True).exclude(user_id__in=list(exclude_users))
+        earliest = rules.aggregate(at=Min("next_occurrence"))["at"]
+        if earliest is None:
+            return max_sleep
+        wake = timezone.make_aware(dt.datetime.combine(earliest, dt.time.min))
+        # due rules of users not backing off: just added, or the day rolled over mid-pass
+        return min(max(1.0, (wake - timezone.now()).total_seconds()), max_sleep)
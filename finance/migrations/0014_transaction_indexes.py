@@ -0,0 +1,49 @@
+# Generated by Django 4.2.23 on 2026-10-17 02:13
+
+import django.db.models.deletion
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+        ("finance", "0013_remove_transfer_transfer_transaction_transfer_and_more"),
+    ]
+
+    operations = [
+        migrations.AlterModelOptions(
+            name="transaction",
+            options={},
+        ),
+        migrations.AlterField(
+            model_name="transaction",
+            name="user",
+            field=models.ForeignKey(
+                blank=True,
+                db_index=False,
+                null=True,
+                on_delete=django.db.models.deletion.CASCADE,
+                related_name="transactions",
+                to=settings.AUTH_USER_MODEL,
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="transaction",
+            index=models.Index(fields=["user", "date", "id"], name="tx_user_date_idx"),
+        ),
+        migrations.AddIndex(
+            model_name="transaction",
+            index=models.Index(fields=["user", "category", "type", "date"], name="tx_user_cat_type_date_idx"),
+        ),
+        migrations.AddIndex(
+            model_name="transaction",
+            index=models.Index(
+                condition=models.Q(("transfer__isnull", True)),
+                fields=["user", "date"],
+                include=("type", "category", "amount"),
+                name="tx_user_date_notr_idx",
+            ),
+        ),
+    ]
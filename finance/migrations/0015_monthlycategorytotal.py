@@ -0,0 +1,71 @@
+# Generated by Django 4.2.23 on 2026-10-17 02:15
+
+from decimal import Decimal
+
+import django.db.models.deletion
+from django.conf import settings
+from django.db import migrations, models
+
+
+def backfill_rollup(apps, schema_editor):
+    from django.db.models import Count, Sum
+    from django.db.models.functions import ExtractMonth, ExtractYear
+
+    Transaction = apps.get_model("finance", "Transaction")
+    MonthlyCategoryTotal = apps.get_model("finance", "MonthlyCategoryTotal")
+    grouped = (
+        Transaction.objects.filter(transfer__isnull=True, user__isnull=False)
+        .annotate(year=ExtractYear("date"), month=ExtractMonth("date"))
+        .values("user_id", "category_id", "year", "month", "type")
+        .annotate(total=Sum("amount"), count=Count("id"))
+        .order_by()
+    )
+    MonthlyCategoryTotal.objects.bulk_create([MonthlyCategoryTotal(**row) for row in grouped], batch_size=1000)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+        ("finance", "0014_transaction_indexes"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="MonthlyCategoryTotal",
+            fields=[
+                ("id", models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name="ID")),
+                ("year", models.PositiveSmallIntegerField()),
+                ("month", models.PositiveSmallIntegerField()),
+                ("type", models.CharField(choices=[("IN", "Income"), ("EX", "Expense")], max_length=2)),
+                ("total", models.DecimalField(decimal_places=2, default=Decimal("0.00"), max_digits=14)),
+                ("count", models.IntegerField(default=0)),
+                (
+                    "category",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="monthly_totals",
+                        to="finance.category",
+                    ),
+                ),
+                (
+                    "user",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="monthly_totals",
+                        to=settings.AUTH_USER_MODEL,
+                    ),
+                ),
+            ],
+            options={
+                "indexes": [models.Index(fields=["user", "year", "month"], name="rollup_user_month_idx")],
+            },
+        ),
+        migrations.AddConstraint(
+            model_name="monthlycategorytotal",
+            constraint=models.UniqueConstraint(
+                fields=("user", "category", "year", "month", "type"), name="unique_monthly_category_total"
+            ),
+        ),
+        migrations.RunPython(backfill_rollup, migrations.RunPython.noop),
+    ]
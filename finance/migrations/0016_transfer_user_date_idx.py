@@ -0,0 +1,17 @@
+# Generated by Django 4.2.23 on 2026-10-17 02:28
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("finance", "0015_monthlycategorytotal"),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="transfer",
+            index=models.Index(fields=["user", "date", "id"], name="transfer_user_date_idx"),
+        ),
+    ]
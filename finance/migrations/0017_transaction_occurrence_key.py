@@ -0,0 +1,35 @@
+# Generated by Django 4.2.23 on 2026-10-17 02:41
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("finance", "0016_transfer_user_date_idx"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="transaction",
+            name="occurrence",
+            field=models.DateField(blank=True, null=True),
+        ),
+        migrations.AddField(
+            model_name="transaction",
+            name="recurring",
+            field=models.ForeignKey(
+                blank=True,
+                db_index=False,
+                null=True,
+                on_delete=django.db.models.deletion.SET_NULL,
+                related_name="postings",
+                to="finance.recurringtransaction",
+            ),
+        ),
+        migrations.AddConstraint(
+            model_name="transaction",
+            constraint=models.UniqueConstraint(fields=("recurring", "occurrence"), name="unique_recurring_occurrence"),
+        ),
+    ]
@@ -0,0 +1,17 @@
+# Generated by Django 4.2.23 on 2026-10-17 02:44
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("finance", "0017_transaction_occurrence_key"),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="recurringtransaction",
+            index=models.Index(fields=["active", "next_occurrence"], name="recurring_active_next_idx"),
+        ),
+    ]
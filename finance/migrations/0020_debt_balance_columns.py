@@ -0,0 +1,38 @@
+# Generated by Django 4.2.23 on 2026-10-17 02:53
+
+from decimal import Decimal
+
+from django.db import migrations, models
+
+
+def backfill_balances(apps, schema_editor):
+    from django.db.models import DecimalField, F, OuterRef, Subquery, Sum, Value
+    from django.db.models.functions import Coalesce
+
+    Debt = apps.get_model("finance", "Debt")
+    Payment = apps.get_model("finance", "Payment")
+    money = DecimalField(max_digits=12, decimal_places=2)
+    paid = Payment.objects.filter(debt=OuterRef("pk")).order_by().values("debt").annotate(t=Sum("amount")).values("t")
+    total_paid = Coalesce(Subquery(paid, output_field=money), Value(Decimal("0.00")), output_field=money)
+    Debt.objects.update(total_paid=total_paid, balance=F("principal") - total_paid)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("finance", "0019_job"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="debt",
+            name="balance",
+            field=models.DecimalField(decimal_places=2, default=Decimal("0.00"), editable=False, max_digits=12),
+        ),
+        migrations.AddField(
+            model_name="debt",
+            name="total_paid",
+            field=models.DecimalField(decimal_places=2, default=Decimal("0.00"), editable=False, max_digits=12),
+        ),
+        migrations.RunPython(backfill_balances, migrations.RunPython.noop),
+    ]
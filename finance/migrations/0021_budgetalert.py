@@ -0,0 +1,59 @@
+# Generated by Django 4.2.23 on 2026-10-17 03:06
+
+import django.db.models.deletion
+import django_extensions.db.fields
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+        ("finance", "0020_debt_balance_columns"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="BudgetAlert",
+            fields=[
+                ("id", models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name="ID")),
+                (
+                    "created",
+                    django_extensions.db.fields.CreationDateTimeField(auto_now_add=True, verbose_name="created"),
+                ),
+                (
+                    "modified",
+                    django_extensions.db.fields.ModificationDateTimeField(auto_now=True, verbose_name="modified"),
+                ),
+                ("threshold", models.PositiveSmallIntegerField(help_text="% of the limit")),
+                ("period_start", models.DateField()),
+                ("spent", models.DecimalField(decimal_places=2, max_digits=14)),
+                ("limit", models.DecimalField(decimal_places=2, max_digits=10)),
+                (
+                    "budget",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE, related_name="alerts", to="finance.budget"
+                    ),
+                ),
+                (
+                    "user",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="budget_alerts",
+                        to=settings.AUTH_USER_MODEL,
+                    ),
+                ),
+            ],
+            options={
+                "ordering": ("-id",),
+                "indexes": [models.Index(fields=["user", "id"], name="alert_user_id_idx")],
+            },
+        ),
+        migrations.AddConstraint(
+            model_name="budgetalert",
+            constraint=models.UniqueConstraint(
+                fields=("budget", "threshold", "period_start"), name="unique_budget_alert_per_period"
+            ),
+        ),
+    ]
@@ -0,0 +1,32 @@
+# Generated by Django 4.2.23 on 2026-10-17 04:12
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("finance", "0023_dataversion"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="JobFileChunk",
+            fields=[
+                ("id", models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name="ID")),
+                ("seq", models.PositiveIntegerField()),
+                ("data", models.BinaryField()),
+                (
+                    "job",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE, related_name="file_chunks", to="finance.job"
+                    ),
+                ),
+            ],
+        ),
+        migrations.AddConstraint(
+            model_name="jobfilechunk",
+            constraint=models.UniqueConstraint(fields=("job", "seq"), name="unique_job_file_chunk"),
+        ),
+    ]
@@ -4,14 +4,15 @@ from __future__ import annotations
 from datetime import date
 from decimal import Decimal
 
-from dateutil.rrule import rrulestr
 from django.conf import settings
 from django.core.exceptions import ValidationError
 from django.db import models
-from django.db.models import Sum, UniqueConstraint
+from django.db.models import F, Index, Q, Sum, UniqueConstraint
 from django.utils import timezone
 from django_extensions.db.models import TimeStampedModel
 
+from .recurrence import compile_rule
+
 
 # ─────────────────────────────── Categories ────────────────────────────────
 class Category(TimeStampedModel):
@@ -49,6 +50,7 @@ class Transaction(TimeStampedModel):
         related_name="transactions",
         null=True,
         blank=True,
+        db_index=False,  # covered by the composite indexes below
     )
 
     # link back to a transfer when this row was produced by a Transfer action
@@ -60,6 +62,38 @@ class Transaction(TimeStampedModel):
         blank=True,
     )
 
+    # occurrence key of rows posted from a RecurringTransaction – makes posting idempotent
+    recurring = models.ForeignKey(
+        "RecurringTransaction",
+        on_delete=models.SET_NULL,
+        related_name="postings",
+        null=True,
+        blank=True,
+        db_index=False,  # covered by unique_recurring_occurrence
+    )
+    occurrence = models.DateField(null=True, blank=True)
+
+    class Meta:
+        constraints = [
+            # NULLs never collide, so hand-entered rows are unaffected
+            UniqueConstraint(fields=["recurring", "occurrence"], name="unique_recurring_occurrence"),
+        ]
+        # Every hot path starts with `filter(user=...)`, so each index leads
+        # with `user`; the plain FK index on `user` would only duplicate them.
+        indexes = [
+            # list views, date ranges and (date, id) ordering
+            Index(fields=["user", "date", "id"], name="tx_user_date_idx"),
+            # budget usage & category/type filters
+            Index(fields=["user", "category", "type", "date"], name="tx_user_cat_type_date_idx"),
+            # summary & analytics: transfers are never counted, so keep them out
+            Index(
+                fields=["user", "date"],
+                include=["type", "category", "amount"],  # PostgreSQL only → index-only scans
+                condition=Q(transfer__isnull=True),
+                name="tx_user_date_notr_idx",
+            ),
+        ]
+
     def __str__(self) -> str:  # pragma: no cover
         desc = f"{self.description} " if self.description else ""
         sign = "+" if self.type == self.Type.INCOME else "-"
@@ -67,6 +101,50 @@ class Transaction(TimeStampedModel):
         return f"{desc}{value} {self.category}"
 
 
+# ─────────────────────────── Monthly roll-ups ──────────────────────────────
+class MonthlyCategoryTotal(models.Model):
+    """
+    Pre-aggregated non-transfer transactions per user, category, month & type.
+    Kept in sync by `finance.signals`; rebuild with `manage.py rebuild_rollups`.
+    """
+
+    user = models.ForeignKey(settings.AUTH_USER_MODEL, on_delete=models.CASCADE, related_name="monthly_totals")
+    category = models.ForeignKey(Category, on_delete=models.CASCADE, related_name="monthly_totals")
+    year = models.PositiveSmallIntegerField()
+    month = models.PositiveSmallIntegerField()
+    type = models.CharField(max_length=2, choices=Transaction.Type.choices)
+    total = models.DecimalField(max_digits=14, decimal_places=2, default=Decimal("0.00"))
+    count = models.IntegerField(default=0)
+
+    class Meta:
+        constraints = [
+            UniqueConstraint(
+                fields=["user", "category", "year", "month", "type"],
+                name="unique_monthly_category_total",
+            )
+        ]
+        indexes = [Index(fields=["user", "year", "month"], name="rollup_user_month_idx")]
+
+    def __str__(self) -> str:  # pragma: no cover
+        return f"{self.category} {self.year}-{self.month:02d} {self.type}: {self.total} ({self.count})"
+
+
+class DataVersion(models.Model):
+    """
+    Per-user counter in the keys of `finance.cache`. It lives in the database
+    so a bump from any process (web worker, scheduler, job worker) is seen
+    by all of them, whichever cache backend holds the responses.
+    """
+
+    user = models.OneToOneField(
+        settings.AUTH_USER_MODEL, on_delete=models.CASCADE, primary_key=True, related_name="finance_data_version"
+    )
+    version = models.PositiveBigIntegerField(default=0)
+
+    def __str__(self) -> str:  # pragma: no cover
+        return f"{self.user_id} v{self.version}"
+
+
 # ───────────────────────────── Savings Goals ───────────────────────────────
 class SavingsGoal(TimeStampedModel):
     name = models.CharField(max_length=64)
@@ -119,12 +197,16 @@ class RecurringTransaction(models.Model):
     class Meta:
         unique_together = ("user", "description", "rrule")
         ordering = ("next_occurrence",)
+        indexes = [
+            # due-rule scans & the scheduler's "earliest next occurrence" probe
+            Index(fields=["active", "next_occurrence"], name="recurring_active_next_idx"),
+        ]
 
     # validation
     def clean(self):
         super().clean()
         try:
-            rrulestr(self.rrule, dtstart=date.today())
+            compile_rule(self.rrule, date.today())
         except (ValueError, TypeError):
             raise ValidationError({"rrule": "Invalid RRULE string."})
 
@@ -139,8 +221,8 @@ class RecurringTransaction(models.Model):
 class Budget(TimeStampedModel):
     """
     A spending envelope for a single category & period.
-    List views annotate the query-set, but detail views (and factory_boy)
-    rely on these fallback properties.
+    List views annotate the query-set, but create responses (and factory_boy)
+    rely on these fallback properties, which share one memoized aggregate.
     """
 
     PERIODS = [("M", "Monthly"), ("Y", "Yearly")]
@@ -159,24 +241,30 @@ class Budget(TimeStampedModel):
         return f"{self.category} – {self.limit} ({self.get_period_display()})"
 
     # ─────────────────── computed helpers ────────────────────── #
+    def save(self, *args, **kwargs):
+        super().save(*args, **kwargs)
+        self.__dict__.pop("_amount_spent", None)  # category / period may have changed
+
+    def spent_in(self, on: date) -> Decimal:
+        """Expenses in the period containing `on` – its month, or its year for yearly budgets."""
+        buckets = MonthlyCategoryTotal.objects.filter(
+            user_id=self.user_id, category_id=self.category_id, type="EX", year=on.year
+        )
+        if self.period != "Y":
+            buckets = buckets.filter(month=on.month)
+        return buckets.aggregate(t=Sum("total"))["t"] or Decimal("0.00")
+
     @property
     def amount_spent(self) -> Decimal:
-        """Monthly expenses for this user *and* category."""
-        today = timezone.localdate()
-        total = Transaction.objects.filter(
-            user=self.user,
-            category=self.category,
-            type="EX",
-            date__year=today.year,
-            date__month=today.month,
-            transfer__isnull=True,  # don’t count category-to-category transfers
-        ).aggregate(t=Sum("amount"))["t"]
-        return total or Decimal("0.00")
+        """Current-period expenses; computed once per instance unless annotated (see `BudgetViewSet`)."""
+        if "_amount_spent" not in self.__dict__:
+            self.__dict__["_amount_spent"] = self.spent_in(timezone.localdate())
+        return self.__dict__["_amount_spent"]
 
     @amount_spent.setter
-    def amount_spent(self, _):
-        # dummy setter so annotation assignment won’t explode
-        pass
+    def amount_spent(self, value):
+        # keep the annotated value – remaining / percent_used derive from it
+        self.__dict__["_amount_spent"] = value
 
     @property
     def remaining(self) -> Decimal:
@@ -205,6 +293,9 @@ class Budget(TimeStampedModel):
 
 
 # ───────────────────────────────── Debts and Payments ──────────────────────────────────
+_DEBT_MAINTAINED = ("total_paid", "balance")
+
+
 class Debt(TimeStampedModel):
     user = models.ForeignKey(settings.AUTH_USER_MODEL, on_delete=models.CASCADE, related_name="debts")
     name = models.CharField(max_length=64)
@@ -214,13 +305,31 @@ class Debt(TimeStampedModel):
     opened_date = models.DateField(blank=True, null=True)
     category = models.ForeignKey(Category, on_delete=models.SET_NULL, null=True, blank=True)
 
+    # denormalised from payments by `finance.debts`; repair with `manage.py reconcile_debts`
+    total_paid = models.DecimalField(max_digits=12, decimal_places=2, default=Decimal("0.00"), editable=False)
+    balance = models.DecimalField(max_digits=12, decimal_places=2, default=Decimal("0.00"), editable=False)
+
     class Meta:
         ordering = ("-created",)
 
-    @property
-    def balance(self):
-        paid = self.payments.aggregate(t=Sum("amount"))["t"] or Decimal("0.00")
-        return self.principal - paid
+    def save(self, *args, **kwargs):
+        if self._state.adding:
+            self.total_paid = self.total_paid or Decimal("0.00")
+            self.balance = self.principal - self.total_paid
+            return super().save(*args, **kwargs)
+
+        # total_paid / balance belong to payment writes (`finance.debts`) – never
+        # overwrite them from a possibly stale instance
+        update_fields = kwargs.get("update_fields")
+        if update_fields is None:
+            update_fields = [
+                f.name for f in self._meta.concrete_fields if not f.primary_key and f.name not in _DEBT_MAINTAINED
+            ]
+            kwargs["update_fields"] = update_fields
+        super().save(*args, **kwargs)
+        if "principal" in update_fields:
+            Debt.objects.filter(pk=self.pk).update(balance=F("principal") - F("total_paid"))
+            self.refresh_from_db(fields=_DEBT_MAINTAINED)
 
 
 class Payment(TimeStampedModel):
@@ -248,6 +357,7 @@ class Transfer(TimeStampedModel):
 
     class Meta:
         ordering = ("-date", "-id")
+        indexes = [Index(fields=["user", "date", "id"], name="transfer_user_date_idx")]  # keyset pages
 
     def clean(self):
         if self.source_category_id and self.destination_category_id:
@@ -256,3 +366,79 @@ class Transfer(TimeStampedModel):
 
     def __str__(self) -> str:  # pragma: no cover
         return f"Transfer {self.amount} {self.source_category} → {self.destination_category} on {self.date}"
+
+
+# ─────────────────────────────── Background jobs ────────────────────────────────
+class Job(TimeStampedModel):
+    """
+    A unit of deferred work, queued in the database and executed by
+    `manage.py run_jobs` (handlers live in `finance.jobs`).
+    """
+
+    class Status(models.TextChoices):
+        QUEUED = "queued", "Queued"
+        RUNNING = "running", "Running"
+        SUCCEEDED = "succeeded", "Succeeded"
+        FAILED = "failed", "Failed"
+
+    user = models.ForeignKey(settings.AUTH_USER_MODEL, on_delete=models.CASCADE, related_name="jobs")
+    kind = models.CharField(max_length=32)
+    status = models.CharField(max_length=9, choices=Status.choices, default=Status.QUEUED)
+    payload = models.JSONField(default=dict, blank=True)
+    result = models.JSONField(null=True, blank=True)
+    error = models.TextField(blank=True)
+    progress = models.PositiveIntegerField(default=0)  # units processed so far (rows, rules, …)
+    attempts = models.PositiveSmallIntegerField(default=0)  # claims so far; a lost worker's job is re-claimed
+    started_at = models.DateTimeField(null=True, blank=True)
+    finished_at = models.DateTimeField(null=True, blank=True)
+
+    class Meta:
+        ordering = ("-id",)
+        indexes = [
+            # workers dequeue the oldest queued job
+            Index(fields=["id"], condition=Q(status="queued"), name="job_queued_idx"),
+        ]
+
+    def __str__(self) -> str:  # pragma: no cover
+        return f"Job {self.pk} {self.kind} ({self.status})"
+
+
+class JobFileChunk(models.Model):
+    """
+    A slice of a file handed to a job (e.g. a bank export to import), read
+    back in `seq` order by the worker – the database is the one store web
+    and worker processes are guaranteed to share.
+    """
+
+    job = models.ForeignKey(Job, on_delete=models.CASCADE, related_name="file_chunks")
+    seq = models.PositiveIntegerField()
+    data = models.BinaryField()
+
+    class Meta:
+        constraints = [UniqueConstraint(fields=["job", "seq"], name="unique_job_file_chunk")]
+
+
+# ─────────────────────────────── Budget alerts ────────────────────────────────
+class BudgetAlert(TimeStampedModel):
+    """
+    A budget crossed `threshold` % of its limit during the period starting on
+    `period_start`. Emitted once per (budget, threshold, period) by
+    `finance.alerts` as roll-up buckets change.
+    """
+
+    user = models.ForeignKey(settings.AUTH_USER_MODEL, on_delete=models.CASCADE, related_name="budget_alerts")
+    budget = models.ForeignKey(Budget, on_delete=models.CASCADE, related_name="alerts")
+    threshold = models.PositiveSmallIntegerField(help_text="% of the limit")
+    period_start = models.DateField()
+    spent = models.DecimalField(max_digits=14, decimal_places=2)
+    limit = models.DecimalField(max_digits=10, decimal_places=2)
+
+    class Meta:
+        ordering = ("-id",)
+        constraints = [
+            UniqueConstraint(fields=["budget", "threshold", "period_start"], name="unique_budget_alert_per_period")
+        ]
+        indexes = [Index(fields=["user", "id"], name="alert_user_id_idx")]  # newest-first feed
+
+    def __str__(self) -> str:  # pragma: no cover
+        return f"{self.budget} reached {self.threshold}% ({self.spent}/{self.limit})"
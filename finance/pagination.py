@@ -1,10 +1,193 @@
 # finance/pagination.py
-from rest_framework.pagination import PageNumberPagination
+import base64
+import json
+from functools import partial
+
+from django.conf import settings
+from django.core.exceptions import ValidationError as DjangoValidationError
+from django.core.paginator import Paginator as DjangoPaginator
+from django.db import connections
+from django.db.models import Q
+from django.utils.functional import cached_property
+from rest_framework.exceptions import NotFound
+from rest_framework.pagination import BasePagination, PageNumberPagination
+from rest_framework.response import Response
+from rest_framework.utils.urls import replace_query_param
+
+from . import cache
+
+
+class CountingPaginator(DjangoPaginator):
+    """
+    Django paginator whose `count` can avoid a full COUNT(*):
+      • "exact"    – plain ``queryset.count()`` (Django's behaviour)
+      • "cached"   – per-user count, cached until the user's data changes
+      • "estimate" – PostgreSQL planner estimate once it exceeds `threshold`
+    """
+
+    def __init__(self, object_list, per_page, *, mode="exact", user_id=None, threshold=10_000, **kwargs):
+        super().__init__(object_list, per_page, **kwargs)
+        self.mode, self.user_id, self.threshold = mode, user_id, threshold
+
+    @cached_property
+    def count(self):
+        queryset = self.object_list
+        if self.mode == "cached" and self.user_id:
+            sql, params = queryset.query.sql_with_params()
+            return cache.remember(self.user_id, "count", f"{sql}{params!r}", queryset.count)
+        if self.mode == "estimate":
+            estimate = planner_estimate(queryset)
+            if estimate is not None and estimate >= self.threshold:
+                return estimate
+        return queryset.count()
+
+
+def planner_estimate(queryset):
+    """Row estimate from PostgreSQL's planner (None on other databases)."""
+    connection = connections[queryset.db]
+    if connection.vendor != "postgresql":
+        return None
+    sql, params = queryset.query.sql_with_params()
+    with connection.cursor() as cursor:
+        cursor.execute(f"EXPLAIN (FORMAT JSON) {sql}", params)
+        plan = cursor.fetchone()[0]
+    if isinstance(plan, str):
+        plan = json.loads(plan)
+    return int(plan[0]["Plan"]["Plan Rows"])
 
 
 class StandardResultsSetPagination(PageNumberPagination):
-    """Global default for every DRF list endpoint."""
+    """
+    Global default for every DRF list endpoint.
+    ``FINANCE_PAGINATION_COUNT`` (or a view's ``pagination_count``) picks how
+    `count` is computed – see `CountingPaginator`.
+    """
 
     page_size = 20  # ← one page = 20 objects
     page_size_query_param = "page_size"  # allow ?page_size=XXX overrides
     max_page_size = 100  # upper-bound the override
+
+    def paginate_queryset(self, queryset, request, view=None):
+        self.view = view
+        return super().paginate_queryset(queryset, request, view)
+
+    @property
+    def django_paginator_class(self):
+        user = getattr(self.request, "user", None)
+        return partial(
+            CountingPaginator,
+            mode=getattr(self.view, "pagination_count", None)
+            or getattr(settings, "FINANCE_PAGINATION_COUNT", "exact"),
+            user_id=user.pk if user is not None and user.is_authenticated else None,
+            threshold=getattr(settings, "FINANCE_PAGINATION_ESTIMATE_THRESHOLD", 10_000),
+        )
+
+
+class KeysetPagination(BasePagination):
+    """
+    Keyset ("seek") pagination over a unique, descending column tuple.
+
+    The cursor encodes the last row's values, and the next page is
+    ``WHERE (date, id) < (cursor)`` – no COUNT(*) and no OFFSET, so deep pages
+    cost the same as the first and concurrent inserts never shift rows
+    between pages. Views pick the tuple with ``cursor_ordering``.
+    """
+
+    cursor_query_param = "cursor"
+    page_size = StandardResultsSetPagination.page_size
+    page_size_query_param = "page_size"
+    max_page_size = StandardResultsSetPagination.max_page_size
+    ordering = ("-date", "-id")
+
+    def paginate_queryset(self, queryset, request, view=None):
+        ordering = getattr(view, "cursor_ordering", self.ordering)
+        assert all(field.startswith("-") for field in ordering), "keyset ordering must be descending"
+        self.fields = [field[1:] for field in ordering]
+        self.model = queryset.model
+        self.request = request
+
+        queryset = queryset.order_by(*ordering)
+        position = self.decode_cursor(request)
+        if position is not None:
+            queryset = queryset.filter(self._before(position))
+
+        size = self.get_page_size(request)
+        rows = list(queryset[: size + 1])
+        self.has_next = len(rows) > size
+        self.page = rows[:size]
+        return self.page
+
+    def get_page_size(self, request):
+        try:
+            size = int(request.query_params[self.page_size_query_param])
+        except (KeyError, ValueError):
+            return self.page_size
+        return min(max(size, 1), self.max_page_size)
+
+    def _before(self, values) -> Q:
+        # (a, b) < (x, y)  ⇔  a < x  OR  (a = x AND b < y)
+        condition, equal = Q(), {}
+        for field, value in zip(self.fields, values):
+            condition |= Q(**equal, **{f"{field}__lt": value})
+            equal[field] = value
+        return condition
+
+    # ----------------------------------------------------------------- cursor
+    def decode_cursor(self, request):
+        encoded = request.query_params.get(self.cursor_query_param)
+        if not encoded:
+            return None  # `?cursor=` → first page
+        try:
+            values = json.loads(base64.urlsafe_b64decode(encoded.encode()))
+        except (TypeError, ValueError):
+            raise NotFound("Invalid cursor.") from None
+        if not isinstance(values, list) or len(values) != len(self.fields):
+            raise NotFound("Invalid cursor.")
+        try:
+            # typed like the columns they are compared with – a crafted value must not reach the query
+            values = [self.model._meta.get_field(field).to_python(value) for field, value in zip(self.fields, values)]
+        except (DjangoValidationError, TypeError, ValueError):
+            raise NotFound("Invalid cursor.") from None
+        if None in values:
+            raise NotFound("Invalid cursor.")
+        return values
+
+    def encode_cursor(self, obj) -> str:
+        values = [getattr(obj, field) for field in self.fields]
+        raw = json.dumps([v.isoformat() if hasattr(v, "isoformat") else v for v in values])
+        return base64.urlsafe_b64encode(raw.encode()).decode()
+
+    def get_next_link(self):
+        if not self.has_next:
+            return None
+        url = self.request.build_absolute_uri()
+        return replace_query_param(url, self.cursor_query_param, self.encode_cursor(self.page[-1]))
+
+    def get_paginated_response(self, data):
+        return Response({"next": self.get_next_link(), "results": data})
+
+    def get_paginated_response_schema(self, schema):
+        return {
+            "type": "object",
+            "required": ["results"],
+            "properties": {"next": {"type": "string", "nullable": True, "format": "uri"}, "results": schema},
+        }
+
+
+class CursorOptInMixin:
+    """
+    Let list endpoints switch to `KeysetPagination` when the client sends
+    ``?cursor=`` (empty for the first page); page numbers stay the default.
+    """
+
+    cursor_ordering = KeysetPagination.ordering
+
+    @property
+    def paginator(self):
+        if not hasattr(self, "_paginator"):
+            request = getattr(self, "request", None)
+            if request is not None and KeysetPagination.cursor_query_param in request.query_params:
+                self._paginator = KeysetPagination()
+            else:
+                return super().paginator
+        return self._paginator
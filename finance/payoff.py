@@ -0,0 +1,90 @@
+"""
+Snowball / avalanche debt-payoff simulation.
+
+All debts are advanced together one month at a time over parallel lists
+(balance, monthly rate, minimum payment), so a plan costs
+``months × debts`` cheap Decimal operations and no per-payment objects.
+Each month:
+
+1. interest accrues on every open balance (rounded to cents);
+2. every open debt receives its minimum payment (capped at its balance);
+3. the rest of the budget – the extra amount plus the minimums freed by
+   debts already paid off – goes to open debts in strategy order:
+   smallest balance first (snowball) or highest rate first (avalanche).
+"""
+
+from __future__ import annotations
+
+from decimal import ROUND_HALF_UP, Decimal
+from typing import Dict, List, Sequence
+
+STRATEGIES = ("avalanche", "snowball")
+MAX_MONTHS = 30 * 12
+
+CENT = Decimal("0.01")
+ZERO = Decimal("0.00")
+
+
+def _cents(value: Decimal) -> Decimal:
+    return value.quantize(CENT, rounding=ROUND_HALF_UP)
+
+
+def simulate(debts: Sequence, extra: Decimal, strategy: str) -> Dict[str, object]:
+    """
+    Plan the payoff of `debts` (objects with id, name, balance, interest_rate
+    and minimum_payment) paying the sum of minimums plus `extra` each month.
+    """
+    ids = [d.id for d in debts]
+    balance = [Decimal(d.balance) for d in debts]
+    rate = [Decimal(d.interest_rate) / 1200 for d in debts]
+    minimum = [Decimal(d.minimum_payment) for d in debts]
+    budget = sum(minimum, ZERO) + extra
+
+    def priority(i: int):
+        # reads the current month's balances
+        return (balance[i], i) if strategy == "snowball" else (-rate[i], balance[i], i)
+
+    n = len(ids)
+    interest_paid = [ZERO] * n
+    payoff_month: List[object] = [None if b > 0 else 0 for b in balance]
+    totals_balance: List[Decimal] = []
+    totals_interest: List[Decimal] = []
+    totals_paid: List[Decimal] = []
+
+    month = 0
+    while month < MAX_MONTHS and any(b > 0 for b in balance):
+        month += 1
+        interest = [_cents(b * r) if b > 0 else ZERO for b, r in zip(balance, rate)]
+        balance = [b + i for b, i in zip(balance, interest)]
+        interest_paid = [p + i for p, i in zip(interest_paid, interest)]
+
+        pay = [min(m, b) if b > 0 else ZERO for m, b in zip(minimum, balance)]
+        left = budget - sum(pay, ZERO)
+        for i in sorted((i for i in range(n) if balance[i] - pay[i] > 0), key=priority):
+            if left <= 0:
+                break
+            top_up = min(left, balance[i] - pay[i])
+            pay[i] += top_up
+            left -= top_up
+        balance = [b - p for b, p in zip(balance, pay)]
+
+        for i in range(n):
+            if payoff_month[i] is None and balance[i] <= 0:
+                payoff_month[i] = month
+        totals_balance.append(sum(balance, ZERO))
+        totals_interest.append(sum(interest, ZERO))
+        totals_paid.append(sum(pay, ZERO))
+
+    return {
+        "strategy": strategy,
+        "monthly_budget": budget,
+        "months": month,
+        "paid_off": all(b <= 0 for b in balance),
+        "total_interest": sum(interest_paid, ZERO),
+        "total_paid": sum(totals_paid, ZERO),
+        "debts": [
+            {"id": ids[i], "name": debts[i].name, "payoff_month": payoff_month[i], "interest": interest_paid[i]}
+            for i in range(n)
+        ],
+        "schedule": {"balance": totals_balance, "interest": totals_interest, "paid": totals_paid},
+    }
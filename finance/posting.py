@@ -0,0 +1,153 @@
+"""
+Set-based posting of due `RecurringTransaction`s.
+
+`post_due()` walks the due rules in primary-key batches, expands each with
+the recurrence engine and writes the batch with one `bulk_create` for the
+transactions plus one `bulk_update` for the rules' `next_occurrence` /
+`active` – instead of a round-trip per occurrence and per rule. Each posted
+row carries its occurrence key (``recurring``, ``occurrence``), which is
+unique, so a retried or crashed run never posts the same occurrence twice.
+
+`post_shard()` is the unit of work for the parallel `post_recurring
+--workers N` mode: it handles the users with ``user_id % N == shard``, one
+transaction per user, locking that user's rules with ``SELECT … FOR UPDATE
+SKIP LOCKED`` so overlapping workers or cron runs never post a rule twice.
+"""
+
+from __future__ import annotations
+
+import logging
+from datetime import date
+from typing import Dict
+
+from django.db import IntegrityError
+from django.db import transaction as db_tx
+from django.utils import timezone
+
+from . import cache, recurrence, rollups
+from .models import RecurringTransaction, Transaction
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_BATCH_SIZE = 500
+
+
+def due_rules(today: date):
+    return RecurringTransaction.objects.filter(active=True, next_occurrence__lte=today)
+
+
+def post_due(rules, today: date, batch_size: int = DEFAULT_BATCH_SIZE, dry_run: bool = False) -> Dict[str, int]:
+    """
+    Post every missed occurrence of the due rules in `rules` (a queryset).
+    Returns ``{"posted": <transactions>, "rules": <rules advanced>}``; with
+    `dry_run` nothing is written but the counts are the same.
+    """
+    posted = advanced = 0
+    deltas = rollups.collect()  # bulk writes bypass the model signals
+    users = set()
+    last_pk = 0
+
+    while batch := list(rules.filter(pk__gt=last_pk).order_by("pk")[:batch_size]):
+        last_pk = batch[-1].pk
+        now = timezone.now()
+        earliest = min(r.next_occurrence for r in batch)
+        transactions = []
+
+        for r in batch:
+            dates, next_occurrence = recurrence.due_occurrences(r.rrule, r.next_occurrence, today, r.end_date)
+            transactions.extend(
+                Transaction(
+                    user_id=r.user_id,
+                    category_id=r.category_id,
+                    amount=r.amount,
+                    type=r.type,
+                    description=r.description,
+                    date=day,
+                    recurring_id=r.pk,
+                    occurrence=day,
+                )
+                for day in dates
+            )
+            if next_occurrence is None:
+                r.active = False
+            else:
+                r.next_occurrence = next_occurrence
+            r.updated = now  # auto_now isn't applied by bulk_update
+
+        # drop occurrences an earlier (crashed or concurrent) run already posted
+        transactions = _unposted(transactions, batch, earliest)
+        advanced += len(batch)
+        if dry_run:
+            posted += len(transactions)
+            continue
+
+        transactions = _insert(transactions, batch, earliest, batch_size)
+        posted += len(transactions)
+        RecurringTransaction.objects.bulk_update(batch, ["next_occurrence", "active", "updated"])
+        rollups.collect(added=transactions, into=deltas)
+        users.update(r.user_id for r in batch)
+
+    rollups.flush(deltas)
+    for user_id in users:
+        cache.bump_version(user_id)
+    return {"posted": posted, "rules": advanced}
+
+
+def _unposted(transactions, rules, earliest: date):
+    done = set(
+        Transaction.objects.filter(recurring__in=rules, occurrence__gte=earliest).values_list(
+            "recurring_id", "occurrence"
+        )
+    )
+    return [t for t in transactions if (t.recurring_id, t.occurrence) not in done] if done else transactions
+
+
+def _insert(transactions, rules, earliest: date, batch_size: int):
+    """
+    `bulk_create` the occurrences and return those actually written. If a
+    concurrent run committed some of them since the check, the occurrence
+    key constraint rejects the batch: drop what it posted and try again.
+    """
+    while True:
+        try:
+            with db_tx.atomic():
+                return Transaction.objects.bulk_create(transactions, batch_size=batch_size)
+        except IntegrityError:
+            remaining = _unposted(transactions, rules, earliest)
+            if len(remaining) == len(transactions):
+                raise  # not an occurrence clash
+            for t in remaining:
+                t.pk = None  # ids handed out by the rolled-back insert
+            transactions = remaining
+
+
+def post_for_user(user_id: int, today: date, batch_size: int = DEFAULT_BATCH_SIZE, dry_run: bool = False):
+    """Post one user's due rules in their own transaction, skipping rows another worker holds."""
+    with db_tx.atomic():
+        rules = due_rules(today).filter(user_id=user_id).select_for_update(skip_locked=True)
+        return post_due(rules, today, batch_size=batch_size, dry_run=dry_run)
+
+
+def post_shard(
+    shard: int, workers: int, today: date, batch_size: int = DEFAULT_BATCH_SIZE, dry_run: bool = False
+) -> Dict[str, int]:
+    """
+    Post every due rule owned by users in `shard` of `workers`. A failing
+    user is logged and counted; it does not roll back the others.
+    """
+    totals = {"posted": 0, "rules": 0, "users": 0, "failed": 0}
+    user_ids = due_rules(today).values_list("user_id", flat=True).distinct().order_by("user_id")
+
+    for user_id in user_ids:
+        if user_id % workers != shard:
+            continue
+        try:
+            result = post_for_user(user_id, today, batch_size=batch_size, dry_run=dry_run)
+        except Exception:
+            logger.exception("Posting recurring transactions failed for user %s", user_id)
+            totals["failed"] += 1
+            continue
+        totals["posted"] += result["posted"]
+        totals["rules"] += result["rules"]
+        totals["users"] += 1
+    return totals
@@ -0,0 +1,66 @@
+"""
+Recurrence engine for `RecurringTransaction` rules.
+
+Each distinct RRULE string is parsed once (LRU-cached) and re-anchored on a
+rule's `next_occurrence` with `rrule.replace()`. `due_occurrences()` then
+expands every missed occurrence with a single `between()` call, so catching
+up after a long outage costs one parse per rule string instead of one per
+occurrence.
+"""
+
+from __future__ import annotations
+
+from datetime import date, datetime, time
+from functools import lru_cache
+from typing import List, Optional, Tuple
+
+from dateutil.rrule import rrule, rrulestr
+
+_ANCHOR = datetime(2000, 1, 1)  # placeholder dtstart; every use re-anchors
+
+
+@lru_cache(maxsize=1024)
+def _parse(rule: str):
+    return rrulestr(rule, dtstart=_ANCHOR)
+
+
+@lru_cache(maxsize=4096)
+def compile_rule(rule: str, dtstart: date):
+    """
+    RRULE string → dateutil rule anchored at `dtstart` (midnight).
+    Raises ValueError / TypeError for invalid strings.
+    """
+    start = datetime.combine(dtstart, time.min)
+    parsed = _parse(rule)
+    if isinstance(parsed, rrule):
+        return parsed.replace(dtstart=start)
+    return rrulestr(rule, dtstart=start)  # multi-rule sets can't be re-anchored
+
+
+def due_occurrences(
+    rule: str, start: date, until: date, end_date: Optional[date] = None
+) -> Tuple[List[date], Optional[date]]:
+    """
+    Expand a rule whose next occurrence is `start`.
+
+    Returns ``(due, next_occurrence)``:
+      • due – `start` (the stored occurrence is always due) followed by every
+        occurrence up to `until`, never past `end_date`
+      • next_occurrence – first occurrence after `until`, or None once the
+        rule is exhausted or past `end_date`
+    """
+    if start > until:
+        return [], start
+
+    compiled = compile_rule(rule, start)
+    last = min(until, end_date) if end_date else until
+    due = [start]
+    if last > start:
+        window = compiled.between(datetime.combine(start, time.max), datetime.combine(last, time.max), inc=True)
+        due.extend(dt.date() for dt in window)
+
+    following = compiled.after(datetime.combine(until, time.max))
+    next_occurrence = following.date() if following else None
+    if next_occurrence and end_date and next_occurrence > end_date:
+        next_occurrence = None
+    return due, next_occurrence
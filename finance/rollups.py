@@ -0,0 +1,182 @@
+"""
+Maintenance of the `MonthlyCategoryTotal` roll-up table.
+
+* `record()`  – fold added / removed transactions into per-bucket deltas and
+                apply them (used by the model signals); `collect()` +
+                `flush()` do the same across many batches and `deferred()`
+                buffers signal-driven records into one flush
+* a lone bucket is one ``UPDATE … SET total = total + x``; many buckets are
+  written set-based: one locked read of the touched rows, one `bulk_update`
+  and one `bulk_create` per chunk of buckets
+* every flush hands the buckets that grew to `finance.alerts`
+* `rebuild()` – recompute the table from the raw transactions (and drop
+                the rebuilt users' cached responses)
+* `month_range_q()` – translate a date window into a (year, month) filter
+
+Transfer legs are never counted by summaries or budgets, so they are kept
+out of the roll-up entirely.
+"""
+
+from __future__ import annotations
+
+import operator
+import threading
+from collections import defaultdict
+from contextlib import contextmanager
+from datetime import date
+from decimal import Decimal
+from functools import reduce
+from typing import Iterable, Optional
+
+from django.db import IntegrityError
+from django.db import transaction as db_tx
+from django.db.models import Count, F, Q, Sum
+from django.db.models.functions import ExtractMonth, ExtractYear
+
+from . import alerts, cache
+from .models import MonthlyCategoryTotal, Transaction
+
+# the only Transaction columns the roll-up depends on
+TRACKED_FIELDS = ("user_id", "category_id", "date", "type", "amount", "transfer_id")
+BUCKET_FIELDS = ("user_id", "category_id", "year", "month", "type")
+FLUSH_CHUNK = 500
+
+_local = threading.local()
+
+
+def _as_date(value) -> date:
+    return date.fromisoformat(value) if isinstance(value, str) else value
+
+
+def collect(added: Iterable[Transaction] = (), removed: Iterable[Transaction] = (), into: Optional[dict] = None):
+    """Fold rows into per-bucket ``[amount, count]`` deltas (accumulating into `into`)."""
+    deltas = into if into is not None else defaultdict(lambda: [Decimal("0.00"), 0])
+    for sign, rows in ((1, added), (-1, removed)):
+        for tx in rows:
+            if tx.transfer_id or not tx.user_id:
+                continue
+            day = _as_date(tx.date)
+            bucket = deltas[(tx.user_id, tx.category_id, day.year, day.month, tx.type)]
+            bucket[0] += sign * Decimal(str(tx.amount))
+            bucket[1] += sign
+    return deltas
+
+
+def flush(deltas: dict) -> None:
+    """Apply collected deltas, then check budget alerts for the buckets that grew."""
+    changes = [(key, amount, count) for key, (amount, count) in deltas.items() if amount or count]
+    if len(changes) == 1:
+        key, amount, count = changes[0]
+        _apply(dict(zip(BUCKET_FIELDS, key)), amount, count)
+    else:
+        while changes:
+            _apply_many(changes[:FLUSH_CHUNK])
+            changes = changes[FLUSH_CHUNK:]
+    alerts.evaluate(key for key, (amount, _) in deltas.items() if amount > 0)
+
+
+def record(added: Iterable[Transaction] = (), removed: Iterable[Transaction] = ()) -> None:
+    """Apply the net effect of `added` / `removed` rows (or buffer it inside `deferred()`)."""
+    buffer = getattr(_local, "deltas", None)
+    if buffer is not None:
+        collect(added, removed, into=buffer)
+    else:
+        flush(collect(added, removed))
+
+
+@contextmanager
+def deferred():
+    """
+    Buffer every `record()` made inside the block – e.g. the per-row signals
+    of a bulk delete – and apply them as one delta per bucket on exit.
+    """
+    if getattr(_local, "deltas", None) is not None:  # already buffering
+        yield
+        return
+    _local.deltas = collect()
+    try:
+        yield
+        flush(_local.deltas)
+    finally:
+        _local.deltas = None
+
+
+def _apply(key: dict, amount: Decimal, count: int) -> None:
+    changes = {"total": F("total") + amount, "count": F("count") + count}
+    if MonthlyCategoryTotal.objects.filter(**key).update(**changes):
+        return
+    if count <= 0:
+        # nothing to decrement (e.g. the bucket was cascade-deleted with its category)
+        return
+    try:
+        with db_tx.atomic():
+            MonthlyCategoryTotal.objects.create(**key, total=amount, count=count)
+    except IntegrityError:
+        # a concurrent writer created the bucket first
+        MonthlyCategoryTotal.objects.filter(**key).update(**changes)
+
+
+def _apply_many(changes) -> None:
+    """Add ``(key, amount, count)`` deltas to their buckets with a constant number of statements."""
+    with db_tx.atomic():
+        while changes:
+            keys = reduce(operator.or_, (Q(**dict(zip(BUCKET_FIELDS, key))) for key, _, _ in changes))
+            existing = {
+                tuple(getattr(row, field) for field in BUCKET_FIELDS): row
+                for row in MonthlyCategoryTotal.objects.select_for_update().filter(keys)
+            }
+            created = []
+            for key, amount, count in changes:
+                row = existing.get(key)
+                if row is not None:
+                    row.total += amount
+                    row.count += count
+                elif count > 0:  # nothing to decrement (e.g. the bucket was cascade-deleted with its category)
+                    created.append(MonthlyCategoryTotal(**dict(zip(BUCKET_FIELDS, key)), total=amount, count=count))
+            MonthlyCategoryTotal.objects.bulk_update(existing.values(), ["total", "count"])
+            if not created:
+                return
+            try:
+                with db_tx.atomic():
+                    MonthlyCategoryTotal.objects.bulk_create(created)
+                return
+            except IntegrityError:
+                # a concurrent writer created some of these buckets first: redo the rest as updates
+                changes = [change for change in changes if change[0] not in existing]
+
+
+def rebuild(users: Optional[Iterable] = None) -> int:
+    """Recompute every bucket (optionally only for `users`); returns the number of rows written."""
+    transactions = Transaction.objects.filter(transfer__isnull=True, user__isnull=False)
+    totals = MonthlyCategoryTotal.objects.all()
+    if users is not None:
+        transactions = transactions.filter(user__in=users)
+        totals = totals.filter(user__in=users)
+
+    grouped = (
+        transactions.annotate(year=ExtractYear("date"), month=ExtractMonth("date"))
+        .values("user_id", "category_id", "year", "month", "type")
+        .annotate(total=Sum("amount"), count=Count("id"))
+        .order_by()
+    )
+
+    with db_tx.atomic():
+        touched = set(totals.values_list("user_id", flat=True).distinct())
+        totals.delete()
+        created = MonthlyCategoryTotal.objects.bulk_create(
+            [MonthlyCategoryTotal(**row) for row in grouped.iterator()],
+            batch_size=1000,
+        )
+    for user_id in touched.union(row.user_id for row in created):
+        cache.bump_version(user_id)
+    return len(created)
+
+
+def month_range_q(start: Optional[date] = None, end: Optional[date] = None) -> Q:
+    """Buckets whose month falls inside [start, end] (either bound optional)."""
+    q = Q()
+    if start:
+        q &= Q(year__gt=start.year) | Q(year=start.year, month__gte=start.month)
+    if end:
+        q &= Q(year__lt=end.year) | Q(year=end.year, month__lte=end.month)
+    return q
@@ -10,26 +10,111 @@ Sections
 4.  Budgets / Envelopes
 5.  Debts & Payments
 6.  Category-to-Category Transfers
+7.  Background Jobs
 """
 
 from __future__ import annotations
 
+import copy
 from decimal import Decimal
 from typing import Any, Dict
 
-from dateutil.rrule import rrulestr
-from django.core.exceptions import FieldDoesNotExist
 from django.db import transaction as db_tx
-from django.db.models import F
+from django.db.models import Case, Value, When, prefetch_related_objects
 from django.shortcuts import get_object_or_404
 from django.utils import timezone
 from rest_framework import serializers
 
-from .models import Budget, Category, Debt, Payment, RecurringTransaction, SavingsGoal, Transaction, Transfer
+from . import cache, importers, jobs, rollups
+from .models import (
+    Budget,
+    BudgetAlert,
+    Category,
+    Debt,
+    Job,
+    Payment,
+    RecurringTransaction,
+    SavingsGoal,
+    Transaction,
+    Transfer,
+)
+from .recurrence import compile_rule
 
 # ─────────────────────────────── 1. Transactions ──────────────────────────────
 
 
+class TransactionListSerializer(serializers.ListSerializer):
+    """
+    Batch writes for `TransactionViewSet`:
+      • create          → one `bulk_create`
+      • partial update  → one `bulk_update` (each item carries its ``id``)
+    Categories are resolved – and ownership checked – with one query per batch.
+    """
+
+    def to_internal_value(self, data):
+        if isinstance(data, list):
+            user = self.context["request"].user
+            self.context["categories"] = Category.objects.filter(
+                user=user, pk__in=_candidate_ids(data, ("category", "category_id"))
+            ).in_bulk()
+            if self.instance is not None:
+                self._instances = {obj.pk: obj for obj in self.instance}
+                self._seen = set()
+        return super().to_internal_value(data)
+
+    def run_child_validation(self, data):
+        if self.instance is None:
+            return super().run_child_validation(data)
+
+        pk = data.get("id") if isinstance(data, dict) else None
+        if not isinstance(pk, int) or pk not in self._instances:
+            raise serializers.ValidationError({"id": "Unknown transaction."})
+        if pk in self._seen:
+            raise serializers.ValidationError({"id": "Duplicate transaction id."})
+        self._seen.add(pk)
+        self.child.instance = self._instances[pk]
+        self.child.initial_data = data
+        return {**super().run_child_validation(data), "id": pk}
+
+    def create(self, validated_data):
+        objs = [Transaction(**self.child.prepare(attrs)) for attrs in validated_data]
+        with db_tx.atomic():
+            Transaction.objects.bulk_create(objs)
+            rollups.record(added=objs)  # bulk writes bypass the model signals
+        _bump_cache(objs)
+        return objs
+
+    def update(self, instances, validated_data):
+        now = timezone.now()
+        changed, previous, fields = [], [], {"modified"}
+        for attrs in validated_data:
+            obj = self._instances[attrs.pop("id")]
+            previous.append(copy.copy(obj))
+            attrs = self.child.prepare(attrs, creating=False)
+            for field, value in attrs.items():
+                setattr(obj, field, value)
+            obj.modified = now
+            fields.update(attrs)
+            changed.append(obj)
+
+        with db_tx.atomic():
+            Transaction.objects.bulk_update(changed, sorted(fields))
+            rollups.record(added=changed, removed=previous)
+        _bump_cache(changed)
+        return changed
+
+
+def _candidate_ids(data, keys) -> list:
+    """Primary keys worth looking up from a batch payload; bad values are left to field validation."""
+    values = (item.get(key) for item in data if isinstance(item, dict) for key in keys)
+    return list({pk for pk in values if isinstance(pk, (int, str)) and str(pk).isdigit()})
+
+
+def _bump_cache(transactions) -> None:
+    for user_id in {tx.user_id for tx in transactions if tx.user_id}:
+        cache.bump_version(user_id)
+
+
 class TransactionSerializer(serializers.ModelSerializer):
     # allow either alias when POSTing
     category_id = serializers.IntegerField(write_only=True, required=False)
@@ -51,10 +136,16 @@ class TransactionSerializer(serializers.ModelSerializer):
             "transfer",
         )
         read_only_fields = ["id", "transfer"]
+        list_serializer_class = TransactionListSerializer
 
     # field-level validation
     def _resolve_category(self, value: int) -> Category:
-        return get_object_or_404(Category, pk=value)
+        batch = self.context.get("categories")  # pre-fetched by TransactionListSerializer
+        if batch is None:
+            return get_object_or_404(Category, pk=value)
+        if value not in batch:
+            raise serializers.ValidationError("Unknown category.")
+        return batch[value]
 
     def validate_category_id(self, value):
         return self._resolve_category(value)
@@ -67,15 +158,28 @@ class TransactionSerializer(serializers.ModelSerializer):
             raise serializers.ValidationError("Amount must be positive.")
         return value
 
+    def validate(self, attrs):
+        if self.instance is None and not (attrs.get("category") or attrs.get("category_id")):
+            raise serializers.ValidationError({"category_id": "This field is required."})
+        return attrs
+
     # create hook
-    def create(self, validated: Dict[str, Any]):
+    def prepare(self, validated: Dict[str, Any], creating: bool = True) -> Dict[str, Any]:
+        """Fold the category aliases into `category` and attach the request user."""
         cat = validated.pop("category", None) or validated.pop("category_id", None)
-        validated["category_id"] = cat.pk if hasattr(cat, "pk") else cat
+        if cat is not None:
+            validated["category_id"] = cat.pk if hasattr(cat, "pk") else cat
 
         request = self.context.get("request")
-        if request and getattr(request, "user", None) and request.user.is_authenticated:
+        if creating and request and getattr(request, "user", None) and request.user.is_authenticated:
             validated["user"] = request.user
-        return super().create(validated)
+        return validated
+
+    def create(self, validated: Dict[str, Any]):
+        return super().create(self.prepare(validated))
+
+    def update(self, instance: Transaction, validated: Dict[str, Any]):
+        return super().update(instance, self.prepare(validated, creating=False))
 
     def to_representation(self, instance: Transaction):
         rep = super().to_representation(instance)
@@ -84,6 +188,35 @@ class TransactionSerializer(serializers.ModelSerializer):
         return rep
 
 
+class TransactionImportSerializer(serializers.Serializer):
+    """Input for `POST /transactions/import/` (multipart)."""
+
+    file = serializers.FileField()
+    format = serializers.ChoiceField(choices=sorted(importers.PARSERS), required=False)
+    category = serializers.IntegerField(required=False, help_text="default category for rows without one")
+
+    def validate_file(self, value):
+        try:
+            importers.check_encoding(value)
+        except ValueError as exc:
+            raise serializers.ValidationError(str(exc))
+        return value
+
+    def validate_category(self, value):
+        category = Category.objects.filter(pk=value, user=self.context["request"].user).first()
+        if category is None:
+            raise serializers.ValidationError("Unknown category.")
+        return category
+
+    def validate(self, attrs):
+        if "format" not in attrs:
+            extension = attrs["file"].name.rsplit(".", 1)[-1].lower()
+            if extension not in importers.PARSERS:
+                raise serializers.ValidationError({"format": "Cannot infer the format; pass csv, ofx or qif."})
+            attrs["format"] = extension
+        return attrs
+
+
 class CategorySerializer(serializers.ModelSerializer):
     class Meta:
         model = Category
@@ -148,7 +281,7 @@ class RecurringTransactionSerializer(serializers.ModelSerializer):
 
     def validate_rrule(self, value):
         try:
-            rrulestr(value, dtstart=timezone.now())
+            compile_rule(value, timezone.localdate())
         except Exception as exc:  # noqa: BLE001
             raise serializers.ValidationError("Invalid RRULE string.") from exc
         return value
@@ -199,16 +332,12 @@ class BudgetSerializer(serializers.ModelSerializer):
         validated["user"] = req.user if req else self.context["request_user"]
         return super().create(validated)
 
-    def to_representation(self, instance):
-        rep = super().to_representation(instance)
-        # Fallback to model properties if annotations weren't present
-        if rep.get("amount_spent") is None:
-            rep["amount_spent"] = f"{instance.amount_spent:.2f}"
-        if rep.get("remaining") is None:
-            rep["remaining"] = f"{instance.remaining:.2f}"
-        if rep.get("percent_used") is None:
-            rep["percent_used"] = float(instance.percent_used)
-        return rep
+
+class BudgetAlertSerializer(serializers.ModelSerializer):
+    class Meta:
+        model = BudgetAlert
+        fields = ["id", "budget", "threshold", "period_start", "spent", "limit", "created"]
+        read_only_fields = fields
 
 
 # ──────────────────────────────── 5. Debts & Payments ─────────────────────────
@@ -222,9 +351,12 @@ class DebtSerializer(serializers.ModelSerializer):
             "name",
             "principal",
             "balance",
+            "total_paid",
             "interest_rate",
+            "minimum_payment",
+            "opened_date",
         ]
-        read_only_fields = ["id", "balance"]
+        read_only_fields = ["id", "balance", "total_paid"]
 
     def validate_principal(self, value):
         if value <= 0:
@@ -253,28 +385,83 @@ class PaymentSerializer(serializers.ModelSerializer):
         debt_pk = getattr(debt_value, "pk", debt_value)
         debt = get_object_or_404(Debt, pk=debt_pk, user=request_user)
 
+        # the debt's total_paid / balance columns follow via `finance.signals`
         with db_tx.atomic():
             validated["debt"] = debt
             validated["user"] = request_user
-            payment = super().create(validated)
-
-            # If Debt has a *real* balance column, update it; otherwise skip.
-            try:
-                Debt._meta.get_field("balance")  # raises if not a concrete field
-            except FieldDoesNotExist:
-                pass
-            else:
-                Debt.objects.filter(pk=debt.pk).update(balance=F("balance") - payment.amount)
+            return super().create(validated)
 
-        return payment
+    def update(self, instance, validated):
+        if "debt" in validated:
+            validated["debt"] = get_object_or_404(Debt, pk=validated["debt"].pk, user=self.context["request"].user)
+        with db_tx.atomic():
+            return super().update(instance, validated)
 
 
 # ───────────────────────────── 6. Category-to-Category Transfer ───────────────
 
 
+def _transfer_legs(transfer: Transfer):
+    """The mirrored pair of a transfer: EX on the source, IN on the destination."""
+    return [
+        Transaction(
+            user_id=transfer.user_id,
+            category_id=category_id,
+            amount=transfer.amount,
+            type=type_,
+            description=transfer.description,
+            date=transfer.date,
+            transfer=transfer,
+        )
+        for category_id, type_ in ((transfer.source_category_id, "EX"), (transfer.destination_category_id, "IN"))
+    ]
+
+
+class TransferCategoryField(serializers.PrimaryKeyRelatedField):
+    """Resolves from the batch pre-fetched by `TransferListSerializer` when there is one."""
+
+    def to_internal_value(self, data):
+        batch = self.context.get("categories")
+        if batch is None:
+            return super().to_internal_value(data)
+        try:
+            return batch[int(data)]
+        except (KeyError, TypeError, ValueError):
+            self.fail("does_not_exist", pk_value=data)
+
+
+class TransferListSerializer(serializers.ListSerializer):
+    """
+    Bulk create for `TransferViewSet` (a JSON list on POST): one query for all
+    categories (owned by the user), one `bulk_create` for the transfers and
+    one for every mirrored transaction.
+    """
+
+    def to_internal_value(self, data):
+        if isinstance(data, list):
+            self.context["categories"] = Category.objects.filter(
+                user=self.context["request"].user,
+                pk__in=_candidate_ids(data, ("source_category", "destination_category")),
+            ).in_bulk()
+        return super().to_internal_value(data)
+
+    def create(self, validated_data):
+        user = self.context["request"].user
+        transfers = [
+            Transfer(user=user, **{**attrs, "description": attrs.get("description") or ""}) for attrs in validated_data
+        ]
+        with db_tx.atomic():
+            Transfer.objects.bulk_create(transfers)
+            Transaction.objects.bulk_create([leg for t in transfers for leg in _transfer_legs(t)])
+        # bulk writes bypass the model signals; transfers never reach the roll-up
+        cache.bump_version(user.pk)
+        prefetch_related_objects(transfers, "transactions")
+        return transfers
+
+
 class TransferSerializer(serializers.ModelSerializer):
-    source_category = serializers.PrimaryKeyRelatedField(queryset=Category.objects.all())
-    destination_category = serializers.PrimaryKeyRelatedField(queryset=Category.objects.all())
+    source_category = TransferCategoryField(queryset=Category.objects.all())
+    destination_category = TransferCategoryField(queryset=Category.objects.all())
 
     class Meta:
         model = Transfer
@@ -287,6 +474,7 @@ class TransferSerializer(serializers.ModelSerializer):
             "description",
         ]
         read_only_fields = ["id"]
+        list_serializer_class = TransferListSerializer
 
     # amount-level validation (attaches error to "amount")
     def validate_amount(self, value: Decimal) -> Decimal:
@@ -310,117 +498,76 @@ class TransferSerializer(serializers.ModelSerializer):
         return attrs
 
     def create(self, validated):
-        user = self.context["request"].user
-        src: Category = validated["source_category"]
-        dst: Category = validated["destination_category"]
-        amount: Decimal = validated["amount"]
-        date = validated["date"]
-        desc = validated.get("description") or ""  # avoid NULL in CharField
-
+        transfer = Transfer(
+            user=self.context["request"].user,
+            source_category=validated["source_category"],
+            destination_category=validated["destination_category"],
+            amount=validated["amount"],
+            date=validated["date"],
+            description=validated.get("description") or "",  # avoid NULL in CharField
+        )
         with db_tx.atomic():
-            transfer = Transfer.objects.create(
-                user=user,
-                source_category=src,
-                destination_category=dst,
-                amount=amount,
-                date=date,
-                description=desc,
-            )
-            # mirror as EX (out) and IN (in)
-            Transaction.objects.bulk_create(
-                [
-                    Transaction(
-                        user=user,
-                        category=src,
-                        amount=amount,
-                        type="EX",
-                        description=desc,
-                        date=date,
-                        transfer=transfer,
-                    ),
-                    Transaction(
-                        user=user,
-                        category=dst,
-                        amount=amount,
-                        type="IN",
-                        description=desc,
-                        date=date,
-                        transfer=transfer,
-                    ),
-                ]
-            )
+            transfer.save()
+            Transaction.objects.bulk_create(_transfer_legs(transfer))  # mirror as EX (out) and IN (in)
         return transfer
 
     def update(self, instance: Transfer, validated):
         """
-        Keep the two mirrored transactions in sync with updates to the Transfer.
-        Also 'heal' the pair if one side is missing.
+        Keep the two mirrored transactions in sync with updates to the Transfer:
+        one UPDATE for the transfer and one for both legs (each side gets its
+        category via CASE). The pair is only 'healed' when a side is missing.
         """
         # normalize description (CharField is NOT NULL)
         if "description" in validated and validated["description"] is None:
             validated["description"] = ""
 
-        # apply incoming changes to the transfer
-        for field in (
-            "source_category",
-            "destination_category",
-            "amount",
-            "date",
-            "description",
-        ):
-            if field in validated:
-                setattr(instance, field, validated[field])
-        instance.save()
-
-        user = instance.user
-        src = instance.source_category
-        dst = instance.destination_category
-        amt = instance.amount
-        date = instance.date
-        desc = instance.description or ""
+        for field, value in validated.items():
+            setattr(instance, field, value)
 
         with db_tx.atomic():
-            # load existing linked transactions
-            existing = {t.type: t for t in instance.transactions.all()}
-
-            # create missing sides if necessary
-            if "EX" not in existing:
-                existing["EX"] = Transaction.objects.create(
-                    user=user,
-                    category=src,
-                    amount=amt,
-                    type="EX",
-                    description=desc,
-                    date=date,
-                    transfer=instance,
-                )
-            if "IN" not in existing:
-                existing["IN"] = Transaction.objects.create(
-                    user=user,
-                    category=dst,
-                    amount=amt,
-                    type="IN",
-                    description=desc,
-                    date=date,
-                    transfer=instance,
-                )
-
-            # update common fields on both
-            Transaction.objects.filter(pk__in=[existing["EX"].pk, existing["IN"].pk]).update(
-                amount=amt, date=date, description=desc
+            instance.save()
+            synced = instance.transactions.update(
+                amount=instance.amount,
+                date=instance.date,
+                description=instance.description or "",
+                category=Case(
+                    When(type="EX", then=Value(instance.source_category_id)),
+                    default=Value(instance.destination_category_id),
+                ),
             )
-
-            # ensure categories are on the correct sides
-            if existing["EX"].category_id != src.id:
-                existing["EX"].category = src
-                existing["EX"].save(update_fields=["category"])
-            if existing["IN"].category_id != dst.id:
-                existing["IN"].category = dst
-                existing["IN"].save(update_fields=["category"])
+            if synced < 2:
+                present = set(instance.transactions.values_list("type", flat=True))
+                Transaction.objects.bulk_create([leg for leg in _transfer_legs(instance) if leg.type not in present])
 
         return instance
 
     def to_representation(self, instance: Transfer):
         rep = super().to_representation(instance)
-        rep["transactions"] = [tx.id for tx in instance.transactions.order_by("id")]
+        # `.all()` reuses TransferViewSet's prefetch; sorting keeps un-prefetched instances in id order too
+        rep["transactions"] = sorted(tx.id for tx in instance.transactions.all())
         return rep
+
+
+# ─────────────────────────────── 7. Background Jobs ───────────────────────────
+
+
+class JobSerializer(serializers.ModelSerializer):
+    progress = serializers.SerializerMethodField()
+
+    class Meta:
+        model = Job
+        fields = [
+            "id",
+            "kind",
+            "status",
+            "progress",
+            "result",
+            "error",
+            "created",
+            "started_at",
+            "finished_at",
+        ]
+        read_only_fields = fields
+
+    def get_progress(self, obj: Job) -> int:
+        return jobs.progress(obj)
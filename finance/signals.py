@@ -0,0 +1,78 @@
+"""
+Model signal handlers for the **finance** app (wired up in `FinanceConfig.ready`).
+
+* keeps the `MonthlyCategoryTotal` roll-up in step with single-row
+  Transaction writes. Transfer rows never reach the roll-up (see
+  `finance.rollups`), so Transfer create/update need no handler of their own.
+* keeps the denormalised `Debt.total_paid` / `Debt.balance` in step with
+  Payment create / update / delete (see `finance.debts`).
+* bumps the owner's cache version whenever any of their finance data
+  changes, invalidating cached responses and list counts (see `finance.cache`).
+"""
+
+from django.db.models.signals import post_delete, post_save, pre_save
+from django.dispatch import receiver
+
+from . import cache, debts, rollups
+from .models import Budget, Category, Debt, Payment, RecurringTransaction, SavingsGoal, Transaction, Transfer
+
+
+# ───────────────────────────── monthly roll-up ─────────────────────────────
+@receiver(pre_save, sender=Transaction)
+def remember_previous_transaction(sender, instance, raw=False, **kwargs):
+    # snapshot the stored row so post_save can subtract what it contributed
+    instance._rollup_previous = None
+    if raw or instance._state.adding:
+        return
+    instance._rollup_previous = sender.objects.filter(pk=instance.pk).only(*rollups.TRACKED_FIELDS).first()
+
+
+@receiver(post_save, sender=Transaction)
+def sync_rollup_on_save(sender, instance, raw=False, **kwargs):
+    if raw:
+        return
+    previous = getattr(instance, "_rollup_previous", None)
+    rollups.record(added=[instance], removed=[previous] if previous is not None else [])
+
+
+@receiver(post_delete, sender=Transaction)
+def sync_rollup_on_delete(sender, instance, **kwargs):
+    rollups.record(removed=[instance])
+
+
+# ───────────────────────────── debt balances ─────────────────────────────
+@receiver(pre_save, sender=Payment)
+def remember_previous_payment(sender, instance, raw=False, **kwargs):
+    instance._debt_previous = None
+    if raw or instance._state.adding:
+        return
+    instance._debt_previous = sender.objects.filter(pk=instance.pk).values("debt_id", "amount").first()
+
+
+@receiver(post_save, sender=Payment)
+def sync_debt_on_save(sender, instance, raw=False, **kwargs):
+    if raw:
+        return
+    previous = getattr(instance, "_debt_previous", None)
+    if previous and previous["debt_id"] == instance.debt_id:
+        debts.apply_payment(instance.debt_id, instance.amount - previous["amount"])
+        return
+    if previous:
+        debts.apply_payment(previous["debt_id"], -previous["amount"])
+    debts.apply_payment(instance.debt_id, instance.amount)
+
+
+@receiver(post_delete, sender=Payment)
+def sync_debt_on_delete(sender, instance, **kwargs):
+    debts.apply_payment(instance.debt_id, -instance.amount)
+
+
+# ─────────────────────────── cache invalidation ────────────────────────────
+def invalidate_user_cache(sender, instance, **kwargs):
+    if instance.user_id:
+        cache.bump_version(instance.user_id)
+
+
+for _model in (Transaction, Transfer, SavingsGoal, Budget, Category, RecurringTransaction, Debt, Payment):
+    post_save.connect(invalidate_user_cache, sender=_model, dispatch_uid=f"cache-{_model.__name__}-save")
+    post_delete.connect(invalidate_user_cache, sender=_model, dispatch_uid=f"cache-{_model.__name__}-delete")
@@ -2,8 +2,21 @@
 from django.urls import path
 from rest_framework.routers import DefaultRouter
 
-from .views import BudgetViewSet, CategoryViewSet, SavingsGoalViewSet, TransactionViewSet, TransferViewSet, summary
-from .views_recurring import RecurringTransactionViewSet, post_due_recurring_transactions
+from .views import (
+    BudgetAlertViewSet,
+    BudgetViewSet,
+    CategoryViewSet,
+    JobViewSet,
+    SavingsGoalViewSet,
+    TransactionViewSet,
+    TransferViewSet,
+    cache_stats,
+    rebuild_rollups,
+    summary,
+    timeseries,
+)
+from .views_debt import DebtViewSet, PaymentViewSet
+from .views_recurring import RecurringTransactionViewSet, cash_flow_forecast, post_due_recurring_transactions
 
 router = DefaultRouter()
 router.register("categories", CategoryViewSet, basename="categories")
@@ -12,10 +25,18 @@ router.register("goals", SavingsGoalViewSet, basename="goals")
 router.register("budgets", BudgetViewSet, basename="budgets")
 router.register("transfers", TransferViewSet, basename="transfers")
 router.register("recurrings", RecurringTransactionViewSet, basename="recurrings")  # ← add
+router.register("jobs", JobViewSet, basename="jobs")
+router.register("alerts", BudgetAlertViewSet, basename="alerts")
+router.register("debts", DebtViewSet, basename="debts")
+router.register("payments", PaymentViewSet, basename="payments")
 
 app_name = "finance"
 urlpatterns = [
     path("summary/", summary, name="summary"),  # ← add
     path("post-recurring/", post_due_recurring_transactions, name="post-recurring"),  # ← add
+    path("analytics/timeseries/", timeseries, name="analytics-timeseries"),
+    path("forecast/", cash_flow_forecast, name="forecast"),
+    path("rollups/rebuild/", rebuild_rollups, name="rollups-rebuild"),
+    path("cache-stats/", cache_stats, name="cache-stats"),
 ]
 urlpatterns += router.urls
@@ -1,23 +1,44 @@
 # finance/views.py
+from collections import defaultdict
+from datetime import date, timedelta
 from decimal import Decimal
 
-from django.db.models import DecimalField, ExpressionWrapper, F, FloatField, OuterRef, Subquery, Sum, Value
-from django.db.models.functions import Coalesce
+from django.db import transaction as db_tx
+from django.db.models import (
+    Count,
+    DecimalField,
+    ExpressionWrapper,
+    F,
+    FloatField,
+    Prefetch,
+    Q,
+    Sum,
+    Value,
+)
+from django.db.models.functions import Coalesce, TruncDay, TruncMonth, TruncWeek
+from django.urls import reverse
 from django.utils import timezone
 from django_filters.rest_framework import DjangoFilterBackend
-from rest_framework import viewsets
-from rest_framework.decorators import api_view, permission_classes
+from rest_framework import serializers, status, viewsets
+from rest_framework.decorators import action, api_view, permission_classes
+from rest_framework.fields import empty
 from rest_framework.filters import OrderingFilter, SearchFilter
-from rest_framework.permissions import IsAuthenticated
+from rest_framework.parsers import FormParser, MultiPartParser
+from rest_framework.permissions import IsAdminUser, IsAuthenticated
 from rest_framework.response import Response
 
+from . import cache, exporters, jobs, rollups
 from .filters import BudgetFilter, CategoryFilter, SavingsGoalFilter, TransactionFilter, TransferFilter
-from .models import Budget, Category, SavingsGoal, Transaction, Transfer
+from .models import Budget, BudgetAlert, Category, Job, MonthlyCategoryTotal, SavingsGoal, Transaction, Transfer
+from .pagination import CursorOptInMixin
 from .permissions import IsOwnerOrReadOnly
 from .serializers import (
+    BudgetAlertSerializer,
     BudgetSerializer,
     CategorySerializer,
+    JobSerializer,
     SavingsGoalSerializer,
+    TransactionImportSerializer,
     TransactionSerializer,
     TransferSerializer,
 )
@@ -41,10 +62,14 @@ class CategoryViewSet(viewsets.ModelViewSet):
 
 
 # ───────────────────────────── Transaction CRUD ───────────────────────────────
-class TransactionViewSet(viewsets.ModelViewSet):
+MAX_BULK_ITEMS = 1000  # per bulk create / update / delete request
+
+
+class TransactionViewSet(CursorOptInMixin, viewsets.ModelViewSet):
     """
     Standard CRUD endpoint for `Transaction`.
     Default ordering: newest first (id ↓).
+    ``?cursor=`` switches to keyset pagination on (date ↓, id ↓).
     """
 
     serializer_class = TransactionSerializer
@@ -59,9 +84,79 @@ class TransactionViewSet(viewsets.ModelViewSet):
     def get_queryset(self):
         return Transaction.objects.filter(user=self.request.user).order_by(*self.ordering)
 
+    def get_serializer(self, *args, **kwargs):
+        # a JSON list on POST → bulk create through TransactionListSerializer
+        if isinstance(kwargs.get("data"), list):
+            kwargs.update(many=True, max_length=MAX_BULK_ITEMS)
+        return super().get_serializer(*args, **kwargs)
+
     def perform_create(self, serializer):
         serializer.save(user=self.request.user)
 
+    @action(detail=False, methods=["patch", "delete"], url_path="bulk")
+    def bulk(self, request):
+        """
+        PATCH  → partial update of many rows: ``[{"id": 1, "amount": "9.99"}, …]``
+        DELETE → delete many rows: ``{"ids": [1, 2, 3]}``
+        """
+        if request.method == "DELETE":
+            ids = request.data.get("ids") if isinstance(request.data, dict) else None
+            if not isinstance(ids, list) or len(ids) > MAX_BULK_ITEMS:
+                raise serializers.ValidationError({"ids": f"Expected a list of at most {MAX_BULK_ITEMS} ids."})
+            with db_tx.atomic(), rollups.deferred():
+                deleted = self.get_queryset().filter(pk__in=[pk for pk in ids if str(pk).isdigit()]).delete()[0]
+            return Response({"deleted": deleted})
+
+        ids = (
+            [item.get("id") for item in request.data if isinstance(item, dict)]
+            if isinstance(request.data, list)
+            else []
+        )
+        serializer = self.get_serializer(
+            self.get_queryset().filter(pk__in=[pk for pk in ids if str(pk).isdigit()]),
+            data=request.data,
+            many=True,
+            partial=True,
+            max_length=MAX_BULK_ITEMS,
+        )
+        serializer.is_valid(raise_exception=True)
+        serializer.save()
+        return Response(serializer.data)
+
+    @action(
+        detail=False,
+        methods=["get"],
+        url_path="export",
+        renderer_classes=[exporters.CSVRenderer, exporters.JSONLinesRenderer],
+        content_negotiation_class=exporters.ExportContentNegotiation,
+        pagination_class=None,
+    )
+    def export(self, request):
+        """
+        Stream every transaction matching the list filters / search / ordering
+        as ``?format=csv`` (default) or ``?format=jsonl`` – no pagination.
+        """
+        return exporters.stream(self.filter_queryset(self.get_queryset()), request.accepted_renderer.format)
+
+    @action(detail=False, methods=["post"], url_path="import", parser_classes=[MultiPartParser, FormParser])
+    def import_file(self, request):
+        """
+        Queue a bulk load of a CSV / OFX / QIF bank export (see `finance.importers`).
+        Answers 202 with the job; its result reports invalid (skipped) rows as
+        ``{"row": n, "error": "..."}``.
+        """
+        params = TransactionImportSerializer(data=request.data, context={"request": request})
+        params.is_valid(raise_exception=True)
+        data = params.validated_data
+
+        category = data.get("category")
+        with db_tx.atomic():  # a worker must never see the job without its file
+            job = jobs.enqueue(
+                request.user, "import_transactions", format=data["format"], category=category.pk if category else None
+            )
+            jobs.attach_file(job, data["file"])
+        return accepted_job(job)
+
 
 # ─────────────────────────── Savings-Goal CRUD ───────────────────────────────
 class SavingsGoalViewSet(viewsets.ModelViewSet):
@@ -81,6 +176,34 @@ class SavingsGoalViewSet(viewsets.ModelViewSet):
 
 
 # ───────────────────────────── Finance summary ───────────────────────────────
+def query_param(request, name, field, default=empty):
+    """
+    Validate ``?name=`` with a serializer ``field`` (all values for a
+    ``ListField``); a 400 is keyed by ``name`` like a body error would be.
+    """
+    value = request.GET.getlist(name) if isinstance(field, serializers.ListField) else request.GET.get(name, default)
+    try:
+        return field.run_validation(value)
+    except serializers.ValidationError as exc:
+        raise serializers.ValidationError({name: exc.detail})
+
+
+def _date_param(request, name):
+    """Parse an optional ``?name=YYYY-MM-DD`` query param (400 on bad input)."""
+    return query_param(request, name, serializers.DateField()) if request.GET.get(name) else None
+
+
+def _month_param(request, name="month"):
+    """Parse an optional ``?name=YYYY-MM`` query param into its first day (400 on bad input)."""
+    if not request.GET.get(name):
+        return None
+    return query_param(request, name, serializers.DateField(input_formats=["%Y-%m"]))
+
+
+def _covers_whole_months(start, end) -> bool:
+    return (start is None or start.day == 1) and (end is None or (end + timedelta(days=1)).day == 1)
+
+
 @api_view(["GET"])
 @permission_classes([IsAuthenticated])
 def summary(request):
@@ -92,20 +215,42 @@ def summary(request):
     Optional query params:
         ?start=YYYY-MM-DD   – from date
         ?end=YYYY-MM-DD     – up to date
+    Whole-month windows are answered from the monthly roll-up; anything
+    else falls back to the raw (non-transfer) transactions. Responses are
+    cached per user until their data changes (see `finance.cache`).
     """
-    qs = Transaction.objects.filter(user=request.user, transfer__isnull=True)  # ← ignore transfers
-
-    start = request.GET.get("start")
-    end = request.GET.get("end")
-    if start:
-        qs = qs.filter(date__gte=start)
-    if end:
-        qs = qs.filter(date__lte=end)
-
-    income_total = qs.filter(type="IN").aggregate(t=Sum("amount"))["t"] or 0
-    expense_total = qs.filter(type="EX").aggregate(t=Sum("amount"))["t"] or 0
+    return cache.cached_response(request, "summary", lambda: Response(_summarise(request)))
+
+
+def _summarise(request) -> dict:
+    start = _date_param(request, "start")
+    end = _date_param(request, "end")
+
+    if _covers_whole_months(start, end):
+        qs = MonthlyCategoryTotal.objects.filter(rollups.month_range_q(start, end), user=request.user, count__gt=0)
+        amount = "total"
+    else:
+        qs = Transaction.objects.filter(user=request.user, transfer__isnull=True)  # ← ignore transfers
+        if start:
+            qs = qs.filter(date__gte=start)
+        if end:
+            qs = qs.filter(date__lte=end)
+        amount = "amount"
+
+    # one scan: per-category income & expense side by side, totals derived below
+    per_category = qs.values(name=F("category__name")).annotate(
+        income=Sum(amount, filter=Q(type="IN")),
+        expense=Sum(amount, filter=Q(type="EX")),
+    )
+    by_category = []
+    income_total = expense_total = 0
+    for row in per_category.order_by():
+        income, expense = row["income"] or 0, row["expense"] or 0
+        income_total += income
+        expense_total += expense
+        by_category.append({"name": row["name"], "total": income + expense})
+    by_category.sort(key=lambda row: row["total"], reverse=True)
 
-    by_category = qs.values(name=F("category__name")).annotate(total=Sum("amount")).order_by("-total")
     goal_data = [
         {
             "id": g.id,
@@ -118,24 +263,28 @@ def summary(request):
         for g in request.user.goals.all()
     ]
 
-    return Response(
-        {
-            "income_total": income_total,
-            "expense_total": expense_total,
-            "by_category": list(by_category),
-            "goals": goal_data,
-        }
-    )
+    return {
+        "income_total": income_total,
+        "expense_total": expense_total,
+        "by_category": by_category,
+        "goals": goal_data,
+    }
 
 
 # ─────────────────────────────── Budget CRUD ────────────────────────────────
+MAX_HISTORY_MONTHS = 60
+
+
 class BudgetViewSet(viewsets.ModelViewSet):
     """
     CRUD for a user-scoped `Budget`.
     The queryset is annotated with:
-      • spent        – total expenses in the current month
+      • spent        – expenses in the budget's period: the month, or the
+                       whole year for ``period="Y"``; ``?month=YYYY-MM``
+                       looks at a past (or future) period, default today
       • remaining    – limit − spent
       • percent_used – (spent / limit) × 100
+    Spend comes from one grouped join on the roll-up for the whole page.
     """
 
     serializer_class = BudgetSerializer
@@ -148,52 +297,122 @@ class BudgetViewSet(viewsets.ModelViewSet):
 
     # ------------------------------------------------------------------ #
     def get_queryset(self):
-        user = self.request.user
-        today = timezone.localdate()
-
-        # sub-query → total expenses in this category for the current month
-        monthly_total = (
-            Transaction.objects.filter(
-                user=OuterRef("user"),
-                category=OuterRef("category"),
-                type="EX",
-                transfer__isnull=True,  # ignore transfers in budgets
-                date__year=today.year,
-                date__month=today.month,
-            )
-            .values("category")
-            .annotate(total=Sum("amount"))
-            .values("total")[:1]
-        )
-
+        on = _month_param(self.request) or timezone.localdate()
+        money = DecimalField(max_digits=14, decimal_places=2)
+
+        # roll-up buckets of the budget's own category: the requested month, or its whole year for "Y"
+        in_period = Q(
+            category__monthly_totals__user=F("user"),
+            category__monthly_totals__type="EX",
+            category__monthly_totals__year=on.year,
+        ) & (Q(period="Y") | Q(category__monthly_totals__month=on.month))
         spent_expr = Coalesce(
-            Subquery(
-                monthly_total,
-                output_field=DecimalField(max_digits=10, decimal_places=2),
-            ),
-            Value(Decimal("0.00")),
+            Sum("category__monthly_totals__total", filter=in_period), Value(Decimal("0.00")), output_field=money
         )
 
-        return Budget.objects.filter(user=user).annotate(
-            amount_spent=spent_expr,  # ← add this
-            spent=spent_expr,  # ← keep alias for ordering=spent if used
-            remaining=ExpressionWrapper(
-                F("limit") - spent_expr,
-                output_field=DecimalField(max_digits=10, decimal_places=2),
-            ),
+        return Budget.objects.filter(user=self.request.user).annotate(
+            amount_spent=spent_expr,
+            spent=F("amount_spent"),  # ← keep alias for ordering=spent if used
+            remaining=ExpressionWrapper(F("limit") - F("amount_spent"), output_field=money),
             percent_used=ExpressionWrapper(
-                spent_expr * Value(Decimal("100.00")) / F("limit"),
+                F("amount_spent") * Value(Decimal("100.00")) / F("limit"),
                 output_field=FloatField(),
             ),
         )
 
+    # ------------------------------------------------------------------ #
+    def perform_update(self, serializer):
+        super().perform_update(serializer)
+        self._annotate_saved(serializer)
+
+    def _annotate_saved(self, serializer):
+        # answer with the spend of the requested ``?month=`` like GET does, not today's
+        serializer.instance = self.get_queryset().get(pk=serializer.instance.pk)
+
+    def list(self, request, *args, **kwargs):
+        return cache.cached_response(
+            request, "budgets", lambda: super(BudgetViewSet, self).list(request, *args, **kwargs)
+        )
+
+    @action(detail=False, methods=["get"])
+    def history(self, request):
+        """
+        Month-by-month spend vs. limit for every budget, ``?from=YYYY-MM&to=YYYY-MM``
+        (default: the last 12 months). Yearly budgets report year-to-date spend.
+        Answers parallel lists – one query for the budgets, one for the roll-up.
+        """
+        return cache.cached_response(request, "budget-history", lambda: Response(self._history(request)))
+
+    def _history(self, request) -> dict:
+        end = _month_param(request, "to") or timezone.localdate().replace(day=1)
+        last = end.year * 12 + end.month - 1  # month index: year × 12 + month − 1
+        start = _month_param(request, "from")
+        first = start.year * 12 + start.month - 1 if start else last - 11
+        if not 0 <= last - first < MAX_HISTORY_MONTHS:
+            raise serializers.ValidationError(
+                {"from": f"Must be before 'to' and span at most {MAX_HISTORY_MONTHS} months."}
+            )
+        first_year = first // 12
+
+        budgets = list(Budget.objects.filter(user=request.user).order_by("id"))
+        # from January of the first year on, so yearly budgets can accumulate year-to-date
+        buckets = MonthlyCategoryTotal.objects.filter(
+            rollups.month_range_q(date(first_year, 1, 1), end),
+            user=request.user,
+            type="EX",
+            category__in={b.category_id for b in budgets},
+        ).values_list("category_id", "year", "month", "total")
+        spent_by_category = defaultdict(dict)
+        for category_id, year, month, total in buckets:
+            spent_by_category[category_id][year * 12 + month - 1] = total
+
+        rows = []
+        for budget in budgets:
+            monthly = spent_by_category[budget.category_id]
+            spent, running = [], Decimal("0.00")
+            for i in range(first_year * 12, last + 1):
+                running = (running if budget.period == "Y" and i % 12 else Decimal("0.00")) + monthly.get(i, 0)
+                if i >= first:
+                    spent.append(running)
+            rows.append(
+                {
+                    "id": budget.id,
+                    "category": budget.category_id,
+                    "period": budget.period,
+                    "limit": budget.limit,
+                    "spent": spent,
+                    "percent_used": [round(float(s / budget.limit * 100), 1) for s in spent],
+                }
+            )
+
+        months = [f"{i // 12}-{i % 12 + 1:02d}" for i in range(first, last + 1)]
+        return {"months": months, "budgets": rows}
+
     # ------------------------------------------------------------------ #
     def perform_create(self, serializer):
         serializer.save(user=self.request.user)
+        self._annotate_saved(serializer)
+
+
+class BudgetAlertViewSet(viewsets.ReadOnlyModelViewSet):
+    """Feed of budget threshold crossings (newest first); ``?budget=<id>`` narrows it."""
+
+    serializer_class = BudgetAlertSerializer
+    permission_classes = [IsAuthenticated]
+    filter_backends = [DjangoFilterBackend]
+    filterset_fields = ["budget", "threshold"]
+
+    def get_queryset(self):
+        return BudgetAlert.objects.filter(user=self.request.user)
 
 
 # ─────────────────────────────── Transfer Views ────────────────────────────────
-class TransferViewSet(viewsets.ModelViewSet):
+class TransferViewSet(CursorOptInMixin, viewsets.ModelViewSet):
+    """
+    CRUD for transfers; ``?cursor=`` switches to keyset pagination on (date ↓, id ↓).
+    POSTing a JSON list creates many transfers at once (envelope rebalancing).
+    """
+
     serializer_class = TransferSerializer
     permission_classes = [IsAuthenticated, IsOwnerOrReadOnly]
     filter_backends = [DjangoFilterBackend, OrderingFilter, SearchFilter]
@@ -202,5 +421,124 @@ class TransferViewSet(viewsets.ModelViewSet):
     ordering_fields = ["date", "amount", "id"]
     ordering = ("-date", "-id")
 
+    def get_serializer(self, *args, **kwargs):
+        # a JSON list on POST → bulk create through TransferListSerializer
+        if isinstance(kwargs.get("data"), list):
+            kwargs.update(many=True, max_length=MAX_BULK_ITEMS)
+        return super().get_serializer(*args, **kwargs)
+
     def get_queryset(self):
-        return Transfer.objects.filter(user=self.request.user)
+        # one extra query for the whole page's leg ids instead of one per transfer
+        legs = Prefetch("transactions", queryset=Transaction.objects.only("id", "transfer_id").order_by("id"))
+        return Transfer.objects.filter(user=self.request.user).prefetch_related(legs)
+
+
+# ─────────────────────────────── Analytics ────────────────────────────────
+TIMESERIES_BUCKETS = {"day": TruncDay, "week": TruncWeek, "month": TruncMonth}
+MAX_TIMESERIES_POINTS = 5000
+
+
+def _bucket_start(day: date, bucket: str) -> date:
+    if bucket == "week":
+        return day - timedelta(days=day.weekday())  # ISO weeks start on Monday
+    if bucket == "month":
+        return day.replace(day=1)
+    return day
+
+
+def _next_bucket(day: date, bucket: str) -> date:
+    if bucket == "month":
+        return date(day.year + day.month // 12, day.month % 12 + 1, 1)
+    return day + timedelta(days=7 if bucket == "week" else 1)
+
+
+@api_view(["GET"])
+@permission_classes([IsAuthenticated])
+def timeseries(request):
+    """
+    Totals per day / week / month as parallel lists (``dates``, ``totals``,
+    ``counts``) with empty buckets filled in. Query params:
+      • bucket – day | week | month (default month)
+      • type   – EX | IN (default EX); transfers are never counted
+      • category – repeatable category id filter
+      • start / end – YYYY-MM-DD; default to the first / last bucket with data
+    """
+    return cache.cached_response(request, "timeseries", lambda: Response(_timeseries(request)))
+
+
+def _timeseries(request) -> dict:
+    bucket = query_param(request, "bucket", serializers.ChoiceField(list(TIMESERIES_BUCKETS)), "month")
+    type_ = query_param(request, "type", serializers.ChoiceField(Transaction.Type.choices), "EX")
+    categories = query_param(request, "category", serializers.ListField(child=serializers.IntegerField()))
+    start, end = _date_param(request, "start"), _date_param(request, "end")
+    if start and end and start > end:
+        raise serializers.ValidationError({"start": "Must not be after end."})
+
+    qs = Transaction.objects.filter(user=request.user, transfer__isnull=True, type=type_)
+    if categories:
+        qs = qs.filter(category__in=categories)
+    if start:
+        qs = qs.filter(date__gte=start)
+    if end:
+        qs = qs.filter(date__lte=end)
+    grouped = (
+        qs.annotate(period=TIMESERIES_BUCKETS[bucket]("date"))
+        .values("period")
+        .annotate(total=Sum("amount"), count=Count("id"))
+        .order_by("period")
+    )
+    found = {row["period"]: (row["total"], row["count"]) for row in grouped}
+
+    dates, totals, counts = [], [], []
+    if found or (start and end):
+        first = _bucket_start(start or min(found), bucket)
+        last = _bucket_start(end or max(found), bucket)
+        day = first
+        while True:
+            total, count = found.get(day, (Decimal("0.00"), 0))
+            dates.append(day)
+            totals.append(total)
+            counts.append(count)
+            if len(dates) > MAX_TIMESERIES_POINTS:
+                raise serializers.ValidationError(
+                    {"bucket": f"More than {MAX_TIMESERIES_POINTS} buckets; use a coarser bucket or a shorter range."}
+                )
+            if day >= last:
+                break  # stepping past the last bucket could overflow date.max
+            day = _next_bucket(day, bucket)
+
+    return {"bucket": bucket, "type": type_, "dates": dates, "totals": totals, "counts": counts}
+
+
+# ─────────────────────────────── Cache stats ────────────────────────────────
+@api_view(["GET"])
+@permission_classes([IsAdminUser])
+def cache_stats(request):
+    """Hit / miss counters of the per-user response cache (staff only)."""
+    return Response(cache.stats())
+
+
+# ─────────────────────────────── Background jobs ────────────────────────────────
+def accepted_job(job: Job) -> Response:
+    """``202 Accepted`` with the queued job and its status URL."""
+    url = reverse("finance:jobs-detail", args=[job.pk])
+    return Response(JobSerializer(job).data, status=status.HTTP_202_ACCEPTED, headers={"Location": url})
+
+
+class JobViewSet(viewsets.ReadOnlyModelViewSet):
+    """Status / progress / result of the user's background jobs (newest first)."""
+
+    serializer_class = JobSerializer
+    permission_classes = [IsAuthenticated]
+    # queuing a job doesn't bump the data version, so a cached count would go stale
+    pagination_count = "exact"
+
+    def get_queryset(self):
+        return Job.objects.filter(user=self.request.user)
+
+
+@api_view(["POST"])
+@permission_classes([IsAuthenticated])
+def rebuild_rollups(request):
+    """Queue a recomputation of the user's monthly roll-up from raw transactions."""
+    return accepted_job(jobs.enqueue(request.user, "rebuild_rollups"))
@@ -1,14 +1,26 @@
 # finance/views_debt.py
+from decimal import Decimal
+
 from django_filters.rest_framework import DjangoFilterBackend
-from rest_framework import filters, viewsets
+from rest_framework import filters, serializers, viewsets
+from rest_framework.decorators import action
 from rest_framework.permissions import IsAuthenticated
+from rest_framework.response import Response
 
+from . import payoff
 from .models import Debt, Payment
 from .permissions import IsOwnerOrReadOnly
 from .serializers import DebtSerializer, PaymentSerializer
+from .views import query_param
 
 
 class DebtViewSet(viewsets.ModelViewSet):
+    """
+    CRUD for the user's debts. `balance` and `total_paid` are stored columns
+    maintained by payment writes, so lists and ``?ordering=balance`` never
+    aggregate payments.
+    """
+
     serializer_class = DebtSerializer
     permission_classes = [IsAuthenticated, IsOwnerOrReadOnly]
 
@@ -20,6 +32,25 @@ class DebtViewSet(viewsets.ModelViewSet):
     def get_queryset(self):
         return Debt.objects.filter(user=self.request.user)
 
+    @action(detail=False, methods=["get"], url_path="payoff-plan")
+    def payoff_plan(self, request):
+        """
+        Month-by-month payoff of all open debts paying the minimums plus
+        ``?extra=`` per month; ``?strategy=avalanche|snowball`` (default: both).
+        """
+        extra = query_param(
+            request, "extra", serializers.DecimalField(max_digits=12, decimal_places=2, min_value=Decimal("0")), "0"
+        )
+        chosen = request.GET.get("strategy")
+        strategies = (
+            [query_param(request, "strategy", serializers.ChoiceField(payoff.STRATEGIES))]
+            if chosen
+            else payoff.STRATEGIES
+        )
+
+        debts = list(self.get_queryset().filter(balance__gt=0).order_by("id"))
+        return Response({name: payoff.simulate(debts, extra, name) for name in strategies})
+
 
 class PaymentViewSet(viewsets.ModelViewSet):
     serializer_class = PaymentSerializer
@@ -1,14 +1,19 @@
 # finance/views_recurring.py
 from __future__ import annotations
 
-from rest_framework import viewsets
+from datetime import timedelta
+
+from django.utils import timezone
+from rest_framework import serializers, viewsets
 from rest_framework.decorators import api_view, permission_classes
 from rest_framework.permissions import IsAuthenticated
 from rest_framework.response import Response
 
-from .models import RecurringTransaction, Transaction
+from . import forecast, jobs
+from .models import RecurringTransaction
 from .permissions import IsOwnerOrReadOnly
 from .serializers import RecurringTransactionSerializer
+from .views import accepted_job, query_param
 
 
 class RecurringTransactionViewSet(viewsets.ModelViewSet):
@@ -27,41 +32,27 @@ class RecurringTransactionViewSet(viewsets.ModelViewSet):
 @api_view(["POST"])
 @permission_classes([IsAuthenticated])
 def post_due_recurring_transactions(request):
-    from datetime import datetime
+    """
+    Queue posting of every missed occurrence of the user's due rules
+    (catch-up included); answers 202 with the job to poll.
+    """
+    return accepted_job(jobs.enqueue(request.user, "post_recurring"))
 
-    from dateutil.rrule import rrulestr
-    from django.utils import timezone
 
+@api_view(["GET"])
+@permission_classes([IsAuthenticated])
+def cash_flow_forecast(request):
+    """
+    Projected income / expense per period and running balance up to
+    ``?until=YYYY-MM-DD``, expanded from the user's active recurring rules.
+    ``?bucket=day|month`` (default month).
+    """
     today = timezone.localdate()
-    posted = 0
-
-    due = RecurringTransaction.objects.filter(user=request.user, active=True, next_occurrence__lte=today)
-
-    for r in due:
-        Transaction.objects.create(
-            user=request.user,
-            category=r.category,
-            amount=r.amount,
-            type=r.type,
-            description=r.description,
-            date=r.next_occurrence,
-        )
-        posted += 1
-
-        # compute next occurrence safely (datetime vs date)
-        dtstart = datetime.combine(r.next_occurrence, datetime.min.time())
-        rule = rrulestr(r.rrule, dtstart=dtstart)
-        next_dt = rule.after(dtstart, inc=False)
-
-        if next_dt is None:
-            r.active = False
-        else:
-            nx = next_dt.date()
-            if r.end_date and nx > r.end_date:
-                r.active = False
-            else:
-                r.next_occurrence = nx
-
-        r.save(update_fields=["next_occurrence", "active"])
-
-    return Response({"posted": posted, "date": str(today)})
+    until = query_param(request, "until", serializers.DateField())
+    bucket = query_param(request, "bucket", serializers.ChoiceField(forecast.BUCKETS), "month")
+    if until < today:
+        raise serializers.ValidationError({"until": "Must not be in the past."})
+    if until > today + timedelta(days=forecast.MAX_HORIZON_DAYS):
+        raise serializers.ValidationError({"until": f"At most {forecast.MAX_HORIZON_DAYS} days ahead."})
+
+    return Response(forecast.project(request.user, today, until, bucket))
@@ -24,6 +24,7 @@ django.setup()
 # 2.  Shared fixtures
 # --------------------------------------------------------------------------- #
 import pytest  # noqa: E402
+from django.core.cache import cache  # noqa: E402
 from rest_framework.test import APIClient  # noqa: E402
 
 from tests.factories import CategoryFactory, UserFactory  # noqa: E402
@@ -50,3 +51,9 @@ def auth_user(api_client):
 def category(auth_user):
     """A `Category` that belongs to the authenticated user."""
     return CategoryFactory(user=auth_user)
+
+
+@pytest.fixture(autouse=True)
+def _clear_cache():
+    """Test DBs reuse primary keys, so never let cached responses leak between tests."""
+    cache.clear()
@@ -0,0 +1,78 @@
+# tests/test_budget_alerts.py
+from datetime import date
+from decimal import Decimal
+
+import pytest
+from django.urls import reverse
+from freezegun import freeze_time
+
+from finance.models import BudgetAlert, Transaction
+from tests.factories import BudgetFactory, CategoryFactory, TransactionFactory, UserFactory
+
+JUNE_10 = date(2025, 6, 10)
+
+
+def _spend(user, category, amount, day=JUNE_10):
+    return TransactionFactory(user=user, category=category, type="EX", amount=Decimal(amount), date=day)
+
+
+@freeze_time("2025-06-15")
+@pytest.mark.django_db
+def test_thresholds_fire_once_per_period(api_client, auth_user):
+    cat = CategoryFactory(user=auth_user)
+    budget = BudgetFactory(user=auth_user, category=cat, limit=Decimal("500"), period="M")
+
+    _spend(auth_user, cat, "300")
+    assert not BudgetAlert.objects.exists()
+
+    _spend(auth_user, cat, "120")  # 84 %
+    _spend(auth_user, cat, "10")  # still over 80 %, no duplicate
+    assert list(BudgetAlert.objects.values_list("threshold", "spent")) == [(80, Decimal("420.00"))]
+
+    _spend(auth_user, cat, "100")  # 106 %
+    feed = api_client.get(reverse("finance:alerts-list")).data["results"]
+    assert [(a["budget"], a["threshold"], a["period_start"]) for a in feed] == [
+        (budget.id, 100, "2025-06-01"),
+        (budget.id, 80, "2025-06-01"),
+    ]
+
+
+@freeze_time("2025-06-15")
+@pytest.mark.django_db
+def test_yearly_budgets_and_past_periods():
+    user = UserFactory()
+    cat = CategoryFactory(user=user)
+    BudgetFactory(user=user, category=cat, limit=Decimal("1000"), period="Y")
+    BudgetFactory(user=user, category=cat, limit=Decimal("100"), period="M")
+
+    _spend(user, cat, "500", day=date(2024, 6, 1))  # last year → ignored
+    _spend(user, cat, "850", day=date(2025, 2, 1))  # earlier month of this year → yearly only
+    assert list(BudgetAlert.objects.values_list("budget__period", "threshold", "period_start")) == [
+        ("Y", 80, date(2025, 1, 1))
+    ]
+
+
+@freeze_time("2025-06-15")
+@pytest.mark.django_db
+def test_bulk_writes_and_updates_are_evaluated(api_client, auth_user):
+    cat = CategoryFactory(user=auth_user)
+    BudgetFactory(user=auth_user, category=cat, limit=Decimal("100"), period="M")
+    payload = [{"category_id": cat.id, "amount": "35", "type": "EX", "date": "2025-06-02"}] * 2
+
+    api_client.post(reverse("finance:transactions-list"), payload, format="json")
+    assert not BudgetAlert.objects.exists()
+
+    tx = Transaction.objects.first()
+    api_client.patch(reverse("finance:transactions-detail", args=[tx.id]), {"amount": "70"})
+    assert set(BudgetAlert.objects.values_list("threshold", flat=True)) == {80, 100}
+
+
+@pytest.mark.django_db
+def test_alert_feed_is_private(api_client, auth_user):
+    other = UserFactory()
+    cat = CategoryFactory(user=other)
+    BudgetFactory(user=other, category=cat, limit=Decimal("10"))
+    _spend(other, cat, "20", day=date.today())
+
+    assert BudgetAlert.objects.count() == 2
+    assert api_client.get(reverse("finance:alerts-list")).data["results"] == []
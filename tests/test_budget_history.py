@@ -0,0 +1,55 @@
+# tests/test_budget_history.py
+from datetime import date
+from decimal import Decimal
+
+import pytest
+from django.urls import reverse
+from freezegun import freeze_time
+
+from tests.factories import BudgetFactory, CategoryFactory, TransactionFactory
+
+URL = reverse("finance:budgets-history")
+
+
+@pytest.mark.django_db
+def test_history_returns_monthly_and_year_to_date_series(api_client, auth_user, django_assert_max_num_queries):
+    food, rent = CategoryFactory(user=auth_user), CategoryFactory(user=auth_user)
+    monthly = BudgetFactory(user=auth_user, category=food, limit=Decimal("200"), period="M")
+    yearly = BudgetFactory(user=auth_user, category=rent, limit=Decimal("1000"), period="Y")
+    for day, amount in ((date(2024, 11, 3), 50), (date(2024, 12, 9), 100), (date(2025, 2, 1), 25)):
+        TransactionFactory(user=auth_user, category=food, type="EX", amount=Decimal(amount), date=day)
+    for day in (date(2024, 10, 1), date(2024, 12, 1), date(2025, 1, 1)):
+        TransactionFactory(user=auth_user, category=rent, type="EX", amount=Decimal("300"), date=day)
+
+    with django_assert_max_num_queries(3):  # cache version, budgets, roll-up
+        data = api_client.get(URL, {"from": "2024-11", "to": "2025-02"}).data
+
+    assert data["months"] == ["2024-11", "2024-12", "2025-01", "2025-02"]
+    rows = {row["id"]: row for row in data["budgets"]}
+    assert rows[monthly.id]["spent"] == [Decimal("50"), Decimal("100"), Decimal("0"), Decimal("25")]
+    assert rows[monthly.id]["percent_used"] == [25.0, 50.0, 0.0, 12.5]
+    # year-to-date, including October (before the window) and resetting in January
+    assert rows[yearly.id]["spent"] == [Decimal("300"), Decimal("600"), Decimal("300"), Decimal("300")]
+
+
+@freeze_time("2025-06-15")
+@pytest.mark.django_db
+def test_history_defaults_to_last_twelve_months(api_client, auth_user):
+    months = api_client.get(URL).data["months"]
+    assert (months[0], months[-1], len(months)) == ("2024-07", "2025-06", 12)
+
+
+@pytest.mark.django_db
+@pytest.mark.parametrize(
+    "params, key",
+    [
+        ({"from": "2025-05", "to": "2025-01"}, "from"),
+        ({"from": "2015-01", "to": "2025-01"}, "from"),
+        ({"to": "2025-13"}, "to"),
+    ],
+)
+def test_history_rejects_bad_windows(api_client, auth_user, params, key):
+    resp = api_client.get(URL, params)
+
+    assert resp.status_code == 400
+    assert list(resp.data) == [key]
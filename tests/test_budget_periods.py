@@ -0,0 +1,80 @@
+# tests/test_budget_periods.py
+from datetime import date
+from decimal import Decimal
+
+import pytest
+from django.urls import reverse
+from freezegun import freeze_time
+
+from finance.serializers import BudgetSerializer
+from tests.factories import BudgetFactory, CategoryFactory, TransactionFactory
+
+LIST = reverse("finance:budgets-list")
+
+
+def _spend(user, category, *days):
+    for day in days:
+        TransactionFactory(user=user, category=category, type="EX", amount=Decimal("100"), date=day)
+
+
+@freeze_time("2025-06-15")
+@pytest.mark.django_db
+def test_yearly_budget_counts_the_whole_year(api_client, auth_user):
+    cat = CategoryFactory(user=auth_user)
+    monthly = BudgetFactory(user=auth_user, category=cat, limit=Decimal("1000"), period="M")
+    yearly = BudgetFactory(user=auth_user, category=cat, limit=Decimal("5000"), period="Y")
+    _spend(auth_user, cat, date(2024, 12, 31), date(2025, 1, 10), date(2025, 3, 5), date(2025, 6, 1))
+
+    rows = {b["id"]: b for b in api_client.get(LIST).data["results"]}
+
+    assert rows[monthly.id]["amount_spent"] == "100.00"
+    assert (rows[yearly.id]["amount_spent"], rows[yearly.id]["percent_used"]) == ("300.00", 6.0)
+
+
+@freeze_time("2025-06-15")
+@pytest.mark.django_db
+def test_month_param_shows_history(api_client, auth_user):
+    cat = CategoryFactory(user=auth_user)
+    budget = BudgetFactory(user=auth_user, category=cat, limit=Decimal("400"), period="M")
+    _spend(auth_user, cat, date(2025, 3, 5), date(2025, 3, 20), date(2025, 6, 1))
+
+    march = api_client.get(reverse("finance:budgets-detail", args=[budget.id]), {"month": "2025-03"}).data
+
+    assert (march["amount_spent"], march["remaining"], march["percent_used"]) == ("200.00", "200.00", 50.0)
+    bad = api_client.get(LIST, {"month": "March"})
+    assert (bad.status_code, list(bad.data)) == (400, ["month"])
+
+
+@freeze_time("2025-06-15")
+@pytest.mark.django_db
+def test_update_answers_for_the_requested_month(api_client, auth_user):
+    cat = CategoryFactory(user=auth_user)
+    budget = BudgetFactory(user=auth_user, category=cat, limit=Decimal("400"), period="M")
+    _spend(auth_user, cat, date(2025, 3, 5))
+    url = reverse("finance:budgets-detail", args=[budget.id]) + "?month=2025-03"
+
+    patched = api_client.patch(url, {"limit": "500"}, format="json").data
+
+    assert (patched["amount_spent"], patched["remaining"]) == ("100.00", "400.00")
+    assert patched["amount_spent"] == api_client.get(url).data["amount_spent"]
+
+
+@pytest.mark.django_db
+def test_budget_list_is_constant_queries(api_client, auth_user, django_assert_num_queries):
+    for _ in range(5):
+        cat = CategoryFactory(user=auth_user)
+        BudgetFactory(user=auth_user, category=cat)
+        _spend(auth_user, cat, date.today())
+
+    with django_assert_num_queries(3):  # cache version, count, page
+        resp = api_client.get(LIST)
+    assert {b["amount_spent"] for b in resp.data["results"]} == {"100.00"}
+
+
+@pytest.mark.django_db
+def test_unannotated_instance_aggregates_once(auth_user, django_assert_num_queries):
+    budget = BudgetFactory(user=auth_user, category=CategoryFactory(user=auth_user), limit=Decimal("500"))
+
+    with django_assert_num_queries(1):
+        data = BudgetSerializer(budget).data
+    assert (data["amount_spent"], data["remaining"], data["percent_used"]) == ("0.00", "500.00", 0.0)
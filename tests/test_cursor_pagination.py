@@ -0,0 +1,50 @@
+# tests/test_cursor_pagination.py
+import base64
+import datetime as _dt
+import json
+
+import pytest
+from django.urls import reverse
+
+from tests.factories import TransactionFactory, TransferFactory
+
+
+@pytest.mark.django_db
+def test_transaction_cursor_pages_are_stable_under_inserts(api_client, auth_user, django_assert_num_queries):
+    day = _dt.date(2025, 7, 1)
+    rows = [TransactionFactory(user=auth_user, date=day - _dt.timedelta(days=n % 3)) for n in range(7)]
+    expected = [t.id for t in sorted(rows, key=lambda t: (t.date, t.id), reverse=True)]
+    url = reverse("finance:transactions-list")
+
+    with django_assert_num_queries(1):  # no COUNT(*)
+        first = api_client.get(url, {"cursor": "", "page_size": 3}).data
+    assert "count" not in first
+    assert [r["id"] for r in first["results"]] == expected[:3]
+
+    TransactionFactory(user=auth_user, date=day)  # lands before the cursor → must not shift page 2
+
+    second = api_client.get(first["next"]).data
+    third = api_client.get(second["next"]).data
+    assert [r["id"] for r in second["results"] + third["results"]] == expected[3:]
+    assert third["next"] is None
+
+    assert api_client.get(url, {"cursor": "garbage"}).status_code == 404
+
+
+@pytest.mark.django_db
+def test_transfer_cursor_and_page_number_coexist(api_client, auth_user):
+    TransferFactory.create_batch(3, user=auth_user)
+    url = reverse("finance:transfers-list")
+
+    assert api_client.get(url).data["count"] == 3  # page numbers stay the default
+    page = api_client.get(url, {"cursor": "", "page_size": 2}).data
+    assert len(page["results"]) == 2 and page["next"]
+
+
+@pytest.mark.parametrize("values", [["tomorrow", 1], ["2025-07-01", "x"], [None, 1], [["2025-07-01"], 1]])
+@pytest.mark.django_db
+def test_crafted_cursor_values_are_a_404(api_client, auth_user, values):
+    TransactionFactory(user=auth_user)
+    cursor = base64.urlsafe_b64encode(json.dumps(values).encode()).decode()
+
+    assert api_client.get(reverse("finance:transactions-list"), {"cursor": cursor}).status_code == 404
@@ -0,0 +1,101 @@
+# tests/test_debt_balance.py
+from decimal import Decimal
+from io import StringIO
+
+import pytest
+from django.core.management import call_command
+from django.urls import reverse
+
+from finance.models import Debt
+from tests.factories import DebtFactory, PaymentFactory, UserFactory
+
+
+def _columns(debt):
+    debt.refresh_from_db()
+    return debt.total_paid, debt.balance
+
+
+@pytest.mark.django_db
+def test_payment_api_keeps_balance_in_step(api_client, auth_user):
+    car = DebtFactory(user=auth_user, principal=Decimal("5000"))
+    card = DebtFactory(user=auth_user, principal=Decimal("800"))
+
+    resp = api_client.post(reverse("finance:payments-list"), {"debt": car.id, "amount": "300", "date": "2025-08-01"})
+    assert resp.status_code == 201, resp.data
+    assert _columns(car) == (Decimal("300"), Decimal("4700"))
+
+    url = reverse("finance:payments-detail", args=[resp.data["id"]])
+    api_client.patch(url, {"amount": "500"})
+    assert _columns(car) == (Decimal("500"), Decimal("4500"))
+
+    api_client.patch(url, {"debt": card.id})  # moved to another debt
+    assert _columns(car) == (Decimal("0"), Decimal("5000"))
+    assert _columns(card) == (Decimal("500"), Decimal("300"))
+
+    api_client.delete(url)
+    assert _columns(card) == (Decimal("0"), Decimal("800"))
+
+
+@pytest.mark.django_db
+def test_debt_list_reads_stored_columns(api_client, auth_user, django_assert_num_queries):
+    debt = DebtFactory(user=auth_user, principal=Decimal("1000"))
+    PaymentFactory.create_batch(2, user=auth_user, debt=debt, amount=Decimal("150"))
+
+    with django_assert_num_queries(2):  # count + page
+        resp = api_client.get(reverse("finance:debts-list"))
+    assert resp.data["results"][0]["balance"] == "700.00"
+    assert resp.data["results"][0]["total_paid"] == "300.00"
+
+
+@pytest.mark.django_db
+def test_editing_principal_keeps_payments():
+    debt = DebtFactory(principal=Decimal("1000"))
+    PaymentFactory(user=debt.user, debt=debt, amount=Decimal("250"))
+    stale = Debt.objects.get(pk=debt.pk)
+    PaymentFactory(user=debt.user, debt=debt, amount=Decimal("50"))
+
+    stale.principal = Decimal("1200")
+    stale.save()  # must not write back its stale total_paid
+
+    assert _columns(debt) == (Decimal("300"), Decimal("900"))
+    assert stale.balance == Decimal("900")
+
+
+@pytest.mark.django_db
+def test_reconcile_fixes_drift_only():
+    user = UserFactory()
+    ok, drifted = DebtFactory(user=user), DebtFactory(user=user, principal=Decimal("600"))
+    PaymentFactory(user=user, debt=drifted, amount=Decimal("100"))
+    Debt.objects.filter(pk=drifted.pk).update(total_paid=0, balance=Decimal("600"))
+    out = StringIO()
+
+    call_command("reconcile_debts", stdout=out)
+
+    assert "Reconciled 1 debts" in out.getvalue()
+    assert _columns(drifted) == (Decimal("100"), Decimal("500"))
+    assert _columns(ok) == (Decimal("0"), Decimal("1000"))
+
+
+@pytest.mark.django_db
+def test_create_debt_through_api(api_client, auth_user):
+    resp = api_client.post(
+        reverse("finance:debts-list"),
+        {
+            "name": "Car loan",
+            "principal": "5000",
+            "interest_rate": "7.5",
+            "minimum_payment": "150",
+            "opened_date": "2025-01-15",
+        },
+    )
+    assert resp.status_code == 201, resp.data
+    assert resp.data["balance"] == "5000.00"
+    assert resp.data["minimum_payment"] == "150.00"
+
+    debt = Debt.objects.get(pk=resp.data["id"])
+    assert debt.user == auth_user
+    assert str(debt.opened_date) == "2025-01-15"
+
+    resp = api_client.post(reverse("finance:debts-list"), {"name": "Card", "principal": "100", "interest_rate": "20"})
+    assert resp.status_code == 400
+    assert "minimum_payment" in resp.data
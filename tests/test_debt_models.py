@@ -20,4 +20,5 @@ def test_running_balance_updates():
     Payment.objects.create(user=u, debt=debt, amount=Decimal("250"), date="2025-08-01")
     Payment.objects.create(user=u, debt=debt, amount=Decimal("1250"), date="2025-09-01")
 
+    debt.refresh_from_db()  # balance is a stored column now
     assert debt.balance == Decimal("8500")
@@ -0,0 +1,47 @@
+# tests/test_debt_queries.py
+from decimal import Decimal
+
+import pytest
+from rest_framework.test import APIRequestFactory, force_authenticate
+
+from finance.views_debt import DebtViewSet
+from tests.factories import DebtFactory, PaymentFactory, UserFactory
+
+debt_list = DebtViewSet.as_view({"get": "list"})
+
+
+def _get(user, **params):
+    request = APIRequestFactory().get("/debts/", params)
+    force_authenticate(request, user=user)
+    return debt_list(request)
+
+
+@pytest.mark.django_db
+def test_debt_list_is_constant_queries(django_assert_num_queries):
+    user = UserFactory()
+    for principal in ("1000", "2000", "3000", "4000"):
+        debt = DebtFactory(user=user, principal=Decimal(principal))
+        PaymentFactory.create_batch(3, user=user, debt=debt, amount=Decimal("100"))
+
+    with django_assert_num_queries(2):  # count + page
+        resp = _get(user)
+
+    assert sorted(Decimal(d["balance"]) for d in resp.data["results"]) == [
+        Decimal("700"),
+        Decimal("1700"),
+        Decimal("2700"),
+        Decimal("3700"),
+    ]
+
+
+@pytest.mark.django_db
+def test_ordering_by_balance_happens_in_sql():
+    user = UserFactory()
+    small = DebtFactory(user=user, principal=Decimal("500"))
+    paid_down = DebtFactory(user=user, principal=Decimal("9000"))
+    big = DebtFactory(user=user, principal=Decimal("2000"))
+    PaymentFactory(user=user, debt=paid_down, amount=Decimal("8800"))
+
+    resp = _get(user, ordering="balance")
+
+    assert [d["id"] for d in resp.data["results"]] == [paid_down.id, small.id, big.id]
@@ -0,0 +1,88 @@
+# tests/test_forecast.py
+import datetime as _dt
+from decimal import Decimal
+
+import pytest
+from freezegun import freeze_time
+from rest_framework import status
+
+from finance.models import RecurringTransaction, Transaction
+from tests.factories import CategoryFactory, TransactionFactory, UserFactory
+
+URL = "/api/finance/forecast/"
+
+
+def _rule(user, **kw):
+    return RecurringTransaction.objects.create(user=user, category=CategoryFactory(user=user), **kw)
+
+
+@freeze_time("2025-08-15")
+@pytest.mark.django_db
+def test_monthly_forecast_projects_rules_and_running_balance(api_client):
+    user = UserFactory()
+    api_client.force_authenticate(user)
+    TransactionFactory(user=user, type="IN", amount=Decimal("500"), date=_dt.date(2025, 8, 1))
+    _rule(
+        user,
+        amount="1000",
+        type="IN",
+        description="Pay",
+        rrule="FREQ=MONTHLY;BYMONTHDAY=25",
+        next_occurrence=_dt.date(2025, 8, 25),
+    )
+    _rule(user, amount="50", type="EX", description="Gym", rrule="FREQ=WEEKLY", next_occurrence=_dt.date(2025, 8, 18))
+
+    resp = api_client.get(URL, {"until": "2025-10-31"})
+
+    assert resp.status_code == status.HTTP_200_OK
+    assert resp.data["periods"] == [_dt.date(2025, 8, 1), _dt.date(2025, 9, 1), _dt.date(2025, 10, 1)]
+    assert resp.data["opening_balance"] == Decimal("500")
+    assert resp.data["income"] == [Decimal("1000")] * 3
+    # Mondays from Aug 18: 2 in Aug, 5 in Sep (1…29), 4 in Oct (6…27)
+    assert resp.data["expense"] == [Decimal("100"), Decimal("250"), Decimal("200")]
+    assert resp.data["balance"] == [Decimal("1400"), Decimal("2150"), Decimal("2950")]
+    assert Transaction.objects.count() == 1  # nothing written
+
+
+@freeze_time("2025-08-15")
+@pytest.mark.django_db
+def test_daily_forecast_folds_overdue_into_today(api_client, auth_user):
+    user = auth_user
+    _rule(
+        user,
+        amount="10",
+        type="EX",
+        description="Coffee",
+        rrule="FREQ=DAILY",
+        next_occurrence=_dt.date(2025, 8, 13),
+        end_date=_dt.date(2025, 8, 16),
+    )
+
+    resp = api_client.get(URL, {"until": "2025-08-17", "bucket": "day"})
+
+    assert resp.data["expense"] == [Decimal("30"), Decimal("10"), Decimal("0")]
+    assert resp.data["balance"] == [Decimal("-30"), Decimal("-40"), Decimal("-40")]
+
+
+@freeze_time("2025-08-15")
+@pytest.mark.parametrize(
+    "params, key",
+    [
+        ({}, "until"),
+        ({"until": "soon"}, "until"),
+        ({"until": "2025-08-01"}, "until"),
+        ({"until": "2099-01-01"}, "until"),
+        ({"until": "2025-09-01", "bucket": "hour"}, "bucket"),
+    ],
+)
+@pytest.mark.django_db
+def test_forecast_rejects_bad_params(api_client, auth_user, params, key):
+    resp = api_client.get(URL, params)
+
+    assert resp.status_code == status.HTTP_400_BAD_REQUEST
+    assert list(resp.data) == [key]
+
+
+@pytest.mark.django_db
+def test_missing_until_is_required_not_null(api_client, auth_user):
+    assert api_client.get(URL).data == {"until": ["This field is required."]}
@@ -0,0 +1,116 @@
+# tests/test_jobs.py
+from datetime import timedelta
+from io import StringIO
+
+import pytest
+from django.core.files.uploadedfile import SimpleUploadedFile
+from django.core.management import call_command
+from django.urls import reverse
+from django.utils import timezone
+
+from finance import jobs
+from finance.models import Job, MonthlyCategoryTotal, Transaction
+from tests.factories import CategoryFactory, TransactionFactory, UserFactory
+
+
+@pytest.mark.django_db
+def test_rollup_rebuild_is_queued_and_run_by_worker(api_client, auth_user):
+    tx = TransactionFactory(user=auth_user)
+    MonthlyCategoryTotal.objects.all().delete()  # drifted roll-up
+
+    resp = api_client.post(reverse("finance:rollups-rebuild"))
+    assert resp.status_code == 202
+    assert resp["Location"] == reverse("finance:jobs-detail", args=[resp.data["id"]])
+
+    out = StringIO()
+    call_command("run_jobs", "--once", stdout=out)
+
+    assert "Processed 1 jobs." in out.getvalue()
+    assert MonthlyCategoryTotal.objects.get(category=tx.category).total == tx.amount
+    job = api_client.get(resp["Location"]).data
+    assert (job["status"], job["result"]) == ("succeeded", {"rows": 1})
+
+
+@pytest.mark.django_db
+def test_failed_job_records_error_and_queue_moves_on(monkeypatch):
+    user = UserFactory()
+    monkeypatch.setitem(jobs.HANDLERS, "rebuild_rollups", lambda job: 1 / 0)
+    first = jobs.enqueue(user, "rebuild_rollups")
+    second = jobs.enqueue(user, "post_recurring")
+
+    assert jobs.run_next().pk == first.pk
+    assert jobs.run_next().pk == second.pk
+    assert jobs.run_next() is None
+
+    first.refresh_from_db()
+    assert first.status == Job.Status.FAILED
+    assert first.error.startswith("ZeroDivisionError")
+    assert Job.objects.get(pk=second.pk).status == Job.Status.SUCCEEDED
+
+
+@pytest.mark.django_db
+def test_jobs_are_private(api_client, auth_user):
+    other = jobs.enqueue(UserFactory(), "post_recurring")
+    mine = jobs.enqueue(auth_user, "post_recurring")
+
+    assert [j["id"] for j in api_client.get(reverse("finance:jobs-list")).data["results"]] == [mine.pk]
+    assert api_client.get(reverse("finance:jobs-detail", args=[other.pk])).status_code == 404
+
+
+@pytest.mark.django_db
+def test_job_of_a_lost_worker_is_reclaimed_until_out_of_attempts():
+    job = jobs.enqueue(UserFactory(), "rebuild_rollups")
+    assert jobs.claim().pk == job.pk  # the worker then dies without finishing
+    assert jobs.claim() is None  # still within its lease
+
+    stale = timezone.now() - jobs.LEASE - timedelta(seconds=1)
+    Job.objects.filter(pk=job.pk).update(started_at=stale)
+    assert jobs.run_next().pk == job.pk
+    job.refresh_from_db()
+    assert (job.status, job.attempts) == (Job.Status.SUCCEEDED, 2)
+
+    Job.objects.filter(pk=job.pk).update(status=Job.Status.RUNNING, started_at=stale, attempts=jobs.MAX_ATTEMPTS)
+    assert jobs.claim() is None
+    job.refresh_from_db()
+    assert (job.status, job.error) == (Job.Status.FAILED, "Worker lost.")
+
+
+@pytest.mark.django_db
+def test_progress_renews_the_lease():
+    job = jobs.enqueue(UserFactory(), "rebuild_rollups")
+    jobs.claim()
+    Job.objects.filter(pk=job.pk).update(started_at=timezone.now() - jobs.LEASE - timedelta(seconds=1))
+    job.refresh_from_db()
+
+    jobs.report_progress(job, 10)  # the worker is alive after all
+    assert jobs.claim() is None
+
+
+@pytest.mark.django_db
+def test_import_of_a_stale_worker_does_nothing(api_client, auth_user):
+    category = CategoryFactory(user=auth_user)
+    upload = SimpleUploadedFile("a.csv", b"date,amount\n2025-07-01,-5\n")
+    api_client.post(
+        reverse("finance:transactions-import-file"), {"file": upload, "category": category.id}, format="multipart"
+    )
+    stale = jobs.claim()
+    Job.objects.filter(pk=stale.pk).update(started_at=timezone.now() - jobs.LEASE - timedelta(seconds=1))
+    current = jobs.claim()  # lease ran out: handed to a second worker
+
+    assert jobs.run(stale).status == Job.Status.RUNNING  # the stale worker backs off, untouched
+    assert not Transaction.objects.exists()
+
+    assert jobs.run(current).status == Job.Status.SUCCEEDED
+    assert jobs.run(stale).status == Job.Status.SUCCEEDED  # a late retry can't import twice
+    assert Transaction.objects.count() == 1
+    assert Job.objects.get(pk=current.pk).result["imported"] == 1
+
+
+@pytest.mark.django_db
+def test_job_list_count_is_exact_in_cached_count_mode(api_client, auth_user, settings):
+    settings.FINANCE_PAGINATION_COUNT = "cached"
+    api_client.post(reverse("finance:rollups-rebuild"))
+    assert api_client.get(reverse("finance:jobs-list")).data["count"] == 1
+
+    api_client.post(reverse("finance:rollups-rebuild"))
+    assert api_client.get(reverse("finance:jobs-list")).data["count"] == 2
@@ -0,0 +1,48 @@
+# tests/test_pagination_counts.py
+import pytest
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+
+from finance import cache
+from finance.models import Transaction
+from finance.pagination import CountingPaginator, planner_estimate
+from tests.factories import TransactionFactory
+
+
+def _count_queries(client, url, **params):
+    with CaptureQueriesContext(connection) as ctx:
+        data = client.get(url, params).data
+    return data, sum("COUNT(" in q["sql"] for q in ctx.captured_queries)
+
+
+@pytest.mark.django_db
+def test_cached_count_until_the_user_writes(api_client, auth_user, settings):
+    settings.FINANCE_PAGINATION_COUNT = "cached"
+    TransactionFactory.create_batch(3, user=auth_user)
+    url = reverse("finance:transactions-list")
+
+    data, counts = _count_queries(api_client, url)
+    assert (data["count"], counts) == (3, 1)
+    data, counts = _count_queries(api_client, url)
+    assert (data["count"], counts) == (3, 0)
+    # different filters → different cached count
+    data, counts = _count_queries(api_client, url, type="IN")
+    assert (data["count"], counts) == (0, 1)
+
+    TransactionFactory(user=auth_user)
+    data, counts = _count_queries(api_client, url)
+    assert (data["count"], counts) == (4, 1)
+
+    # count memoisation isn't response caching
+    assert cache.stats() == {"hits": 0, "misses": 0}
+
+
+@pytest.mark.django_db
+@pytest.mark.skipif(connection.vendor == "postgresql", reason="PostgreSQL returns a real planner estimate")
+def test_estimate_mode_falls_back_to_exact_off_postgres(auth_user):
+    TransactionFactory.create_batch(2, user=auth_user)
+    queryset = Transaction.objects.order_by("id")
+
+    assert planner_estimate(queryset) is None
+    assert CountingPaginator(queryset, 20, mode="estimate", threshold=0).count == 2
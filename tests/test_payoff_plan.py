@@ -0,0 +1,58 @@
+# tests/test_payoff_plan.py
+from decimal import Decimal
+
+import pytest
+from django.urls import reverse
+
+from finance import payoff
+from tests.factories import DebtFactory
+
+URL = reverse("finance:debts-payoff-plan")
+
+
+@pytest.mark.django_db
+def test_interest_free_debt_is_paid_in_exact_months(api_client, auth_user):
+    DebtFactory(user=auth_user, principal=Decimal("1000"), interest_rate=0, minimum_payment=Decimal("100"))
+
+    plan = api_client.get(URL, {"extra": "150", "strategy": "snowball"}).data["snowball"]
+
+    assert (plan["months"], plan["paid_off"]) == (4, True)
+    assert plan["total_paid"] == Decimal("1000")
+    assert plan["schedule"]["balance"] == [Decimal("750"), Decimal("500"), Decimal("250"), Decimal("0")]
+
+
+@pytest.mark.django_db
+def test_strategies_pick_different_targets(api_client, auth_user):
+    card = DebtFactory(user=auth_user, principal=Decimal("3000"), interest_rate=24, minimum_payment=Decimal("90"))
+    loan = DebtFactory(user=auth_user, principal=Decimal("600"), interest_rate=6, minimum_payment=Decimal("30"))
+
+    plans = api_client.get(URL, {"extra": "200"}).data
+
+    snowball = {d["id"]: d["payoff_month"] for d in plans["snowball"]["debts"]}
+    avalanche = {d["id"]: d["payoff_month"] for d in plans["avalanche"]["debts"]}
+    assert snowball[loan.id] < snowball[card.id]  # smallest balance cleared first
+    assert avalanche[card.id] < snowball[card.id]  # highest rate attacked first
+    assert plans["avalanche"]["total_interest"] < plans["snowball"]["total_interest"]
+    for plan in plans.values():
+        assert plan["paid_off"] and plan["monthly_budget"] == Decimal("320")
+        assert len(plan["schedule"]["paid"]) == plan["months"]
+
+
+def test_minimums_below_interest_never_pay_off():
+    debt = DebtFactory.build(id=1, balance=Decimal("10000"), interest_rate=24, minimum_payment=Decimal("50"))
+
+    plan = payoff.simulate([debt], Decimal("0"), "avalanche")
+
+    assert (plan["months"], plan["paid_off"]) == (payoff.MAX_MONTHS, False)
+    assert plan["debts"][0]["payoff_month"] is None
+
+
+@pytest.mark.django_db
+@pytest.mark.parametrize(
+    "params, key", [({"extra": "-1"}, "extra"), ({"extra": "x"}, "extra"), ({"strategy": "random"}, "strategy")]
+)
+def test_bad_params_are_rejected(api_client, auth_user, params, key):
+    resp = api_client.get(URL, params)
+
+    assert resp.status_code == 400
+    assert list(resp.data) == [key]
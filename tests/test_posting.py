@@ -0,0 +1,164 @@
+# tests/test_posting.py
+import datetime as _dt
+from io import StringIO
+
+import pytest
+from django.core.management import CommandError, call_command
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from freezegun import freeze_time
+
+from finance import posting
+from finance.models import MonthlyCategoryTotal, RecurringTransaction, Transaction
+from tests.factories import CategoryFactory, UserFactory
+
+
+def _rule(user, **kw):
+    defaults = dict(
+        user=user,
+        category=CategoryFactory(user=user),
+        amount="10",
+        type="EX",
+        description="Sub",
+        rrule="FREQ=DAILY",
+        next_occurrence=_dt.date(2025, 8, 1),
+    )
+    defaults.update(kw)
+    return RecurringTransaction.objects.create(**defaults)
+
+
+@freeze_time("2025-08-03")
+@pytest.mark.django_db
+def test_post_due_batches_rules_and_catches_up(django_assert_num_queries):
+    users = UserFactory.create_batch(3)
+    rules = [_rule(u, description=f"Sub {i}") for u in users for i in range(2)]
+    ended = _rule(users[0], description="Trial", end_date=_dt.date(2025, 8, 2))
+
+    # 3 batches × (rules, posted check, savepoint + INSERT per 3 rows + release, UPDATE rules) = 23,
+    # empty 4th batch, roll-up (savepoint, locked read, INSERT in a savepoint, release) = 6,
+    # budgets for alerts, one cache version bump per user = 3
+    with django_assert_num_queries(33):
+        result = posting.post_due(posting.due_rules(_dt.date(2025, 8, 3)), _dt.date(2025, 8, 3), batch_size=3)
+
+    assert result == {"posted": 6 * 3 + 2, "rules": 7}
+    assert Transaction.objects.count() == 20
+    for r in rules:
+        r.refresh_from_db()
+        assert r.next_occurrence == _dt.date(2025, 8, 4)
+    ended.refresh_from_db()
+    assert ended.active is False
+
+    total = MonthlyCategoryTotal.objects.get(category=ended.category)
+    assert (total.total, total.count) == (20, 2)
+
+
+@freeze_time("2025-08-03")
+@pytest.mark.django_db
+def test_command_dry_run_writes_nothing():
+    rule = _rule(UserFactory())
+    out = StringIO()
+
+    call_command("post_recurring", "--dry-run", "--batch-size", "1", stdout=out)
+
+    assert "Posted 3 transactions for 1 rules" in out.getvalue()
+    assert not Transaction.objects.exists()
+    rule.refresh_from_db()
+    assert rule.next_occurrence == _dt.date(2025, 8, 1)
+
+
+@freeze_time("2025-08-01")
+@pytest.mark.django_db
+def test_shards_partition_users_and_isolate_failures(monkeypatch):
+    users = UserFactory.create_batch(4)
+    for u in users:
+        _rule(u)
+    broken = users[0].pk
+    real = posting.post_due
+
+    def flaky(rules, *args, **kwargs):
+        if rules.filter(user_id=broken).exists():
+            raise RuntimeError("boom")
+        return real(rules, *args, **kwargs)
+
+    monkeypatch.setattr(posting, "post_due", flaky)
+    today = _dt.date(2025, 8, 1)
+    results = [posting.post_shard(shard, 2, today) for shard in range(2)]
+
+    assert sum(r["users"] for r in results) == 3
+    assert sum(r["failed"] for r in results) == 1
+    assert Transaction.objects.count() == 3
+    assert not Transaction.objects.filter(user_id=broken).exists()
+    assert RecurringTransaction.objects.get(user_id=broken).next_occurrence == today
+
+
+@freeze_time("2025-08-03")
+@pytest.mark.django_db
+def test_reposting_after_a_crash_is_idempotent():
+    rule = _rule(UserFactory())
+    today = _dt.date(2025, 8, 3)
+    posting.post_due(posting.due_rules(today), today)
+
+    # simulate a run that wrote the rows but died before advancing the rule
+    RecurringTransaction.objects.filter(pk=rule.pk).update(next_occurrence=_dt.date(2025, 8, 1))
+    result = posting.post_due(posting.due_rules(today), today)
+
+    assert result["posted"] == 0
+    assert sorted(rule.postings.values_list("occurrence", flat=True)) == [
+        _dt.date(2025, 8, 1),
+        _dt.date(2025, 8, 2),
+        _dt.date(2025, 8, 3),
+    ]
+    assert MonthlyCategoryTotal.objects.get(category=rule.category).count == 3
+
+
+@freeze_time("2025-08-03")
+@pytest.mark.django_db
+def test_occurrences_posted_by_a_concurrent_run_are_not_counted_twice(monkeypatch):
+    rule = _rule(UserFactory())
+    today = _dt.date(2025, 8, 3)
+    posting.post_due(posting.due_rules(today), today)
+    rule.postings.get(occurrence=today).delete()  # leaves one occurrence still to post
+
+    # the other run commits between our check and our insert: the check sees nothing
+    RecurringTransaction.objects.filter(pk=rule.pk).update(next_occurrence=_dt.date(2025, 8, 1))
+    real_unposted = posting._unposted
+    calls = iter([lambda transactions, *args: transactions])
+    monkeypatch.setattr(posting, "_unposted", lambda *args: next(calls, real_unposted)(*args))
+    result = posting.post_due(posting.due_rules(today), today)
+
+    assert result["posted"] == 1
+    assert rule.postings.count() == 3
+    total = MonthlyCategoryTotal.objects.get(category=rule.category)
+    assert (total.total, total.count) == (30, 3)
+
+
+@freeze_time("2025-08-03")
+@pytest.mark.django_db
+def test_posting_queries_do_not_grow_with_rules_or_categories():
+    today = _dt.date(2025, 8, 3)
+
+    def queries_for(n):
+        user = UserFactory()
+        for i in range(n):
+            _rule(user, description=f"Sub {i}", rrule="FREQ=MONTHLY", next_occurrence=today)
+        with CaptureQueriesContext(connection) as first:  # new buckets
+            posting.post_due(posting.due_rules(today), today)
+        RecurringTransaction.objects.update(next_occurrence=_dt.date(2025, 8, 4), rrule="FREQ=DAILY")
+        tomorrow = _dt.date(2025, 8, 4)
+        with CaptureQueriesContext(connection) as steady:  # existing buckets
+            posting.post_due(posting.due_rules(tomorrow), tomorrow)
+        RecurringTransaction.objects.all().delete()
+        return len(first), len(steady)
+
+    assert queries_for(3) == queries_for(60)  # below SQLite's 999-parameter statement split
+    assert MonthlyCategoryTotal.objects.filter(count=2).count() == 63
+
+
+@pytest.mark.parametrize("command", ["post_recurring", "run_scheduler"])
+@pytest.mark.parametrize("size", ["0", "-5"])
+@pytest.mark.django_db
+def test_batch_size_below_one_is_refused(command, size):
+    _rule(UserFactory())
+
+    with pytest.raises(CommandError, match="--batch-size"):
+        call_command(command, "--once" if command == "run_scheduler" else "--dry-run", "--batch-size", size)
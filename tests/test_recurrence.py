@@ -0,0 +1,58 @@
+# tests/test_recurrence.py
+import datetime as _dt
+
+import pytest
+from freezegun import freeze_time
+
+from finance import jobs, recurrence
+from finance.models import RecurringTransaction, Transaction
+from tests.factories import CategoryFactory
+
+D = _dt.date
+
+
+def test_catch_up_expands_all_missed_occurrences_at_once():
+    recurrence._parse.cache_clear()
+
+    due, following = recurrence.due_occurrences("FREQ=MONTHLY;BYMONTHDAY=1", D(2024, 1, 1), D(2025, 3, 15))
+    assert due == [D(2024, m, 1) for m in range(1, 13)] + [D(2025, m, 1) for m in (1, 2, 3)]
+    assert following == D(2025, 4, 1)
+
+    # a second rule with the same string re-uses the parsed rule
+    recurrence.due_occurrences("FREQ=MONTHLY;BYMONTHDAY=1", D(2024, 6, 1), D(2024, 7, 1))
+    assert recurrence._parse.cache_info().misses == 1
+
+
+def test_end_date_and_not_yet_due():
+    due, following = recurrence.due_occurrences("FREQ=WEEKLY", D(2025, 1, 1), D(2025, 3, 1), end_date=D(2025, 1, 20))
+    assert due == [D(2025, 1, 1), D(2025, 1, 8), D(2025, 1, 15)]
+    assert following is None  # 22nd is past end_date → rule finished
+
+    assert recurrence.due_occurrences("FREQ=DAILY", D(2025, 5, 2), D(2025, 5, 1)) == ([], D(2025, 5, 2))
+
+
+@freeze_time("2025-08-20")
+@pytest.mark.django_db
+def test_post_recurring_endpoint_catches_up(api_client, auth_user):
+    rec = RecurringTransaction.objects.create(
+        user=auth_user,
+        category=CategoryFactory(user=auth_user),
+        amount="20",
+        type="EX",
+        description="Gym",
+        rrule="FREQ=WEEKLY",
+        next_occurrence=D(2025, 7, 30),
+    )
+
+    api_client.post("/api/finance/post-recurring/")
+    job = jobs.run_next()
+
+    assert job.result["posted"] == 4  # Jul 30, Aug 6, 13, 20
+    assert sorted(Transaction.objects.values_list("date", flat=True)) == [
+        D(2025, 7, 30),
+        D(2025, 8, 6),
+        D(2025, 8, 13),
+        D(2025, 8, 20),
+    ]
+    rec.refresh_from_db()
+    assert rec.next_occurrence == D(2025, 8, 27)
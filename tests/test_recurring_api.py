@@ -4,6 +4,7 @@ import datetime
 import pytest
 from rest_framework import status
 
+from finance import jobs
 from finance.models import RecurringTransaction, Transaction
 from tests.factories import CategoryFactory, UserFactory
 
@@ -25,6 +26,10 @@ def test_post_due_recurring_creates_transaction(api_client):
     )
 
     resp = api_client.post("/api/finance/post-recurring/")
-    assert resp.status_code == status.HTTP_200_OK
+    assert resp.status_code == status.HTTP_202_ACCEPTED
+    assert Transaction.objects.count() == 0  # queued, not posted in the request
+
+    jobs.run_next()
     assert Transaction.objects.count() == 1
-    assert resp.data["posted"] == 1
+    job = api_client.get(resp["Location"]).data
+    assert (job["status"], job["result"]["posted"]) == ("succeeded", 1)
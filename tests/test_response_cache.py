@@ -0,0 +1,71 @@
+# tests/test_response_cache.py
+from decimal import Decimal
+from unittest import mock
+
+import pytest
+from django.urls import reverse
+
+from finance import cache
+from tests.factories import BudgetFactory, CategoryFactory, TransactionFactory, UserFactory
+
+
+@pytest.mark.django_db
+def test_summary_is_cached_until_user_writes(api_client, auth_user, django_assert_num_queries):
+    cat = CategoryFactory(user=auth_user)
+    TransactionFactory(user=auth_user, category=cat, type="EX", amount=40)
+    url = reverse("finance:summary")
+
+    first = api_client.get(url)
+    assert first["X-Cache"] == "MISS"
+    with django_assert_num_queries(1):  # the shared data version only
+        second = api_client.get(url)
+    assert second["X-Cache"] == "HIT" and second.data == first.data
+
+    # someone else's write doesn't invalidate our entry …
+    TransactionFactory(user=UserFactory(), amount=10)
+    assert api_client.get(url)["X-Cache"] == "HIT"
+
+    # … but ours does
+    TransactionFactory(user=auth_user, category=cat, type="EX", amount=60)
+    fresh = api_client.get(url)
+    assert fresh["X-Cache"] == "MISS"
+    assert fresh.data["expense_total"] == Decimal("100.00")
+
+
+@pytest.mark.django_db
+def test_budget_list_cache_and_stats(api_client, auth_user):
+    budget = BudgetFactory(category=CategoryFactory(user=auth_user))
+    url = reverse("finance:budgets-list")
+
+    assert api_client.get(url)["X-Cache"] == "MISS"
+    assert api_client.get(url, {"period": "M"})["X-Cache"] == "MISS"  # params are part of the key
+    assert api_client.get(url)["X-Cache"] == "HIT"
+
+    budget.limit = Decimal("50")
+    budget.save()
+    assert api_client.get(url).data["results"][0]["limit"] == "50.00"
+
+    assert api_client.get(reverse("finance:cache-stats")).status_code == 403
+    auth_user.is_staff = True
+    auth_user.save()
+    assert api_client.get(reverse("finance:cache-stats")).data == {"hits": 1, "misses": 3}
+
+
+@pytest.mark.django_db
+def test_writes_from_another_process_invalidate(api_client, auth_user, settings):
+    """The version lives in the database, so it doesn't matter which process's cache saw the write."""
+    settings.CACHES = {
+        "default": {"BACKEND": "django.core.cache.backends.locmem.LocMemCache", "LOCATION": "web"},
+        "worker": {"BACKEND": "django.core.cache.backends.locmem.LocMemCache", "LOCATION": "worker"},
+    }
+    cat = CategoryFactory(user=auth_user)
+    url = reverse("finance:summary")
+    assert api_client.get(url)["X-Cache"] == "MISS"
+    assert api_client.get(url)["X-Cache"] == "HIT"
+
+    with mock.patch.object(cache, "CACHE_ALIAS", "worker"):  # e.g. an import in `run_jobs`
+        TransactionFactory(user=auth_user, category=cat, type="EX", amount=25)
+
+    fresh = api_client.get(url)
+    assert fresh["X-Cache"] == "MISS"
+    assert fresh.data["expense_total"] == Decimal("25.00")
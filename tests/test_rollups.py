@@ -0,0 +1,88 @@
+# tests/test_rollups.py
+import datetime as _dt
+from decimal import Decimal
+from io import StringIO
+
+import pytest
+from django.core.management import call_command
+from django.urls import reverse
+
+from finance.models import MonthlyCategoryTotal
+from tests.factories import CategoryFactory, TransactionFactory, TransferFactory, UserFactory
+
+
+def _bucket(user, cat, year, month, type_="EX"):
+    return MonthlyCategoryTotal.objects.get(user=user, category=cat, year=year, month=month, type=type_)
+
+
+@pytest.mark.django_db
+def test_rollup_follows_create_update_delete():
+    user = UserFactory()
+    food, rent = CategoryFactory(user=user), CategoryFactory(user=user)
+
+    tx = TransactionFactory(user=user, category=food, amount=Decimal("40"), date=_dt.date(2025, 3, 5))
+    TransactionFactory(user=user, category=food, amount=Decimal("10"), date=_dt.date(2025, 3, 9))
+    march = _bucket(user, food, 2025, 3)
+    assert (march.total, march.count) == (Decimal("50.00"), 2)
+
+    # move the first one to another category & month
+    tx.category = rent
+    tx.date = _dt.date(2025, 4, 1)
+    tx.save()
+    assert _bucket(user, food, 2025, 3).total == Decimal("10.00")
+    assert _bucket(user, rent, 2025, 4).count == 1
+
+    tx.delete()
+    assert _bucket(user, rent, 2025, 4).count == 0
+
+
+@pytest.mark.django_db
+def test_transfers_are_not_rolled_up_and_rebuild_matches():
+    user = UserFactory()
+    cat = CategoryFactory(user=user)
+    TransferFactory(user=user)
+    TransactionFactory(user=user, category=cat, amount=Decimal("25"), date=_dt.date(2025, 6, 1))
+    assert MonthlyCategoryTotal.objects.count() == 1
+
+    MonthlyCategoryTotal.objects.update(total=Decimal("999"))  # simulate drift
+    call_command("rebuild_rollups")
+    assert _bucket(user, cat, 2025, 6).total == Decimal("25.00")
+
+
+@pytest.mark.django_db
+def test_summary_reads_rollup_for_whole_months(api_client):
+    user = UserFactory()
+    cat = CategoryFactory(user=user)
+    api_client.force_authenticate(user)
+    TransactionFactory(user=user, category=cat, type="IN", amount=Decimal("300"), date=_dt.date(2025, 5, 2))
+    TransactionFactory(user=user, category=cat, type="EX", amount=Decimal("120"), date=_dt.date(2025, 5, 20))
+    TransactionFactory(user=user, category=cat, type="EX", amount=Decimal("80"), date=_dt.date(2025, 6, 3))
+
+    url = reverse("finance:summary")
+    whole_may = api_client.get(url, {"start": "2025-05-01", "end": "2025-05-31"}).data
+    assert whole_may["income_total"] == Decimal("300.00")
+    assert whole_may["expense_total"] == Decimal("120.00")
+
+    # a partial month falls back to the raw rows
+    partial = api_client.get(url, {"start": "2025-05-10", "end": "2025-06-30"}).data
+    assert partial["income_total"] == 0
+    assert partial["expense_total"] == Decimal("200.00")
+
+    assert api_client.get(url, {"start": "not-a-date"}).status_code == 400
+
+
+@pytest.mark.django_db
+def test_rebuild_command_drops_cached_summaries(api_client, auth_user):
+    cat = CategoryFactory(user=auth_user)
+    TransactionFactory(user=auth_user, category=cat, amount=Decimal("40"), date=_dt.date(2025, 6, 1))
+    url = reverse("finance:summary")
+    params = {"start": "2025-06-01", "end": "2025-06-30"}
+
+    MonthlyCategoryTotal.objects.update(total=Decimal("999"))  # drift, then cached
+    assert api_client.get(url, params).data["expense_total"] == Decimal("999.00")
+
+    call_command("rebuild_rollups", stdout=StringIO())
+
+    resp = api_client.get(url, params)
+    assert resp["X-Cache"] == "MISS"
+    assert resp.data["expense_total"] == Decimal("40.00")
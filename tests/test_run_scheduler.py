@@ -0,0 +1,96 @@
+# tests/test_run_scheduler.py
+import datetime as _dt
+from io import StringIO
+
+import pytest
+from django.core.management import call_command
+from freezegun import freeze_time
+
+from finance import posting
+from finance.management.commands import run_scheduler as scheduler
+from finance.management.commands.run_scheduler import Command
+from finance.models import RecurringTransaction, Transaction
+from tests.factories import CategoryFactory, UserFactory
+
+
+def _rule(next_occurrence, **kw):
+    user = UserFactory()
+    return RecurringTransaction.objects.create(
+        user=user,
+        category=CategoryFactory(user=user),
+        amount="20",
+        type="EX",
+        description="Phone",
+        rrule="FREQ=MONTHLY",
+        next_occurrence=next_occurrence,
+        **kw,
+    )
+
+
+@freeze_time("2025-08-01 10:00")
+@pytest.mark.django_db
+def test_once_posts_due_rules_and_exits():
+    rule = _rule(_dt.date(2025, 8, 1))
+    _rule(_dt.date(2025, 8, 20))
+    out = StringIO()
+
+    call_command("run_scheduler", "--once", stdout=out)
+
+    assert "Posted 1 transactions for 1 rules" in out.getvalue()
+    assert Transaction.objects.get().recurring == rule
+    rule.refresh_from_db()
+    assert rule.next_occurrence == _dt.date(2025, 9, 1)
+
+
+@freeze_time("2025-08-01 18:00")
+@pytest.mark.django_db
+def test_sleeps_until_earliest_occurrence_within_bounds():
+    assert Command.seconds_until_due(300) == 300  # nothing scheduled
+
+    _rule(_dt.date(2025, 8, 2))
+    assert Command.seconds_until_due(24 * 3600) == 3 * 3600  # local midnight in Nairobi (UTC+3)
+    assert Command.seconds_until_due(60) == 60
+
+    _rule(_dt.date(2025, 7, 1))  # still due, e.g. locked by another worker
+    assert Command.seconds_until_due(60) == 1
+
+    _rule(_dt.date(2025, 6, 1), active=False)
+    assert Command.seconds_until_due(60) == 1
+
+
+@freeze_time("2025-08-01 10:00")
+@pytest.mark.django_db
+def test_failing_user_is_retried_with_backoff(monkeypatch):
+    broken, fine = _rule(_dt.date(2025, 8, 1)), _rule(_dt.date(2025, 8, 1))
+    real = posting.post_for_user
+
+    def post_for_user(user_id, *args, **kwargs):
+        if user_id == broken.user_id:
+            raise RuntimeError("boom")
+        return real(user_id, *args, **kwargs)
+
+    monkeypatch.setattr(posting, "post_for_user", post_for_user)
+    clock = [1000.0]
+    monkeypatch.setattr(scheduler.time, "monotonic", lambda: clock[0])
+    command = Command(stdout=StringIO(), stderr=StringIO())
+    command._backoff = {}
+
+    command.run_pass(batch_size=10)
+    assert Transaction.objects.get().recurring == fine
+    assert command._backoff == {broken.user_id: (1, 1000.0 + scheduler.RETRY_BASE)}
+    # sleeps until the retry is due instead of waking every second
+    assert command.seconds_until_due(600, exclude_users=command._backoff) == 600
+
+    clock[0] += 1
+    command.run_pass(batch_size=10)  # still backing off: not attempted
+    assert command._backoff[broken.user_id][0] == 1
+
+    clock[0] += scheduler.RETRY_BASE
+    command.run_pass(batch_size=10)
+    assert command._backoff[broken.user_id] == (2, clock[0] + 2 * scheduler.RETRY_BASE)
+
+    monkeypatch.setattr(posting, "post_for_user", real)
+    clock[0] += 2 * scheduler.RETRY_BASE
+    command.run_pass(batch_size=10)
+    assert command._backoff == {}
+    assert Transaction.objects.filter(recurring=broken).count() == 1
@@ -0,0 +1,28 @@
+# tests/test_summary_queries.py
+from decimal import Decimal
+
+import pytest
+
+from finance.models import SavingsGoal
+from tests.factories import CategoryFactory, TransactionFactory
+
+
+@pytest.mark.django_db
+@pytest.mark.parametrize("window", [{}, {"start": "2025-05-03", "end": "2025-05-30"}])
+def test_summary_is_one_scan_plus_goals(api_client, auth_user, django_assert_num_queries, window):
+    food = CategoryFactory(user=auth_user, name="Food")
+    rent = CategoryFactory(user=auth_user, name="Rent")
+    for cat, type_, amount in [(food, "IN", 500), (food, "EX", 120), (rent, "EX", 300)]:
+        TransactionFactory(user=auth_user, category=cat, type=type_, amount=amount, date="2025-05-15")
+    SavingsGoal.objects.create(user=auth_user, name="Car", target_amount=1000, current_amount=250)
+
+    with django_assert_num_queries(3):  # cache version, grouped aggregate (roll-up or raw), goals
+        data = api_client.get("/api/finance/summary/", window).data
+
+    assert data["income_total"] == Decimal("500.00")
+    assert data["expense_total"] == Decimal("420.00")
+    assert data["by_category"] == [
+        {"name": "Food", "total": Decimal("620.00")},
+        {"name": "Rent", "total": Decimal("300.00")},
+    ]
+    assert data["goals"][0]["percent"] == Decimal("25.0")
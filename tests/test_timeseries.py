@@ -0,0 +1,93 @@
+# tests/test_timeseries.py
+from datetime import date
+from decimal import Decimal
+
+import pytest
+from django.urls import reverse
+
+from tests.factories import CategoryFactory, TransactionFactory, TransferFactory
+
+URL = reverse("finance:analytics-timeseries")
+
+
+@pytest.fixture
+def history(auth_user):
+    food, fuel = CategoryFactory(user=auth_user), CategoryFactory(user=auth_user)
+    for day, cat, amount in (
+        (date(2025, 1, 6), food, "10"),  # Monday
+        (date(2025, 1, 8), fuel, "30"),
+        (date(2025, 1, 27), food, "5"),
+        (date(2025, 3, 2), food, "20"),  # Sunday
+    ):
+        TransactionFactory(user=auth_user, category=cat, type="EX", amount=Decimal(amount), date=day)
+    TransactionFactory(user=auth_user, category=food, type="IN", amount=Decimal("999"), date=date(2025, 1, 6))
+    TransferFactory(user=auth_user, amount=Decimal("777"), date=date(2025, 2, 1))
+    return food, fuel
+
+
+@pytest.mark.django_db
+def test_monthly_buckets_fill_gaps_and_skip_transfers(api_client, history):
+    data = api_client.get(URL).data
+
+    assert data["dates"] == [date(2025, 1, 1), date(2025, 2, 1), date(2025, 3, 1)]
+    assert data["totals"] == [Decimal("45"), Decimal("0"), Decimal("20")]
+    assert data["counts"] == [3, 0, 1]
+
+
+@pytest.mark.django_db
+def test_weekly_buckets_with_category_and_window(api_client, history):
+    food, _ = history
+
+    data = api_client.get(
+        URL, {"bucket": "week", "category": food.id, "start": "2025-01-01", "end": "2025-01-31"}
+    ).data
+
+    # weeks start on Monday: Dec 30 … Jan 27
+    assert data["dates"][0] == date(2024, 12, 30) and data["dates"][-1] == date(2025, 1, 27)
+    assert len(data["dates"]) == 5
+    assert dict(zip(data["dates"], data["totals"])) == {
+        date(2024, 12, 30): Decimal("0"),
+        date(2025, 1, 6): Decimal("10"),
+        date(2025, 1, 13): Decimal("0"),
+        date(2025, 1, 20): Decimal("0"),
+        date(2025, 1, 27): Decimal("5"),
+    }
+
+
+@pytest.mark.django_db
+def test_daily_income_and_empty_result(api_client, history):
+    income = api_client.get(URL, {"bucket": "day", "type": "IN"}).data
+    assert (income["dates"], income["totals"]) == ([date(2025, 1, 6)], [Decimal("999")])
+
+    empty = api_client.get(URL, {"start": "2030-01-01"}).data
+    assert empty["dates"] == empty["totals"] == empty["counts"] == []
+
+
+@pytest.mark.django_db
+@pytest.mark.parametrize(
+    "params, key",
+    [
+        ({"bucket": "hour"}, "bucket"),
+        ({"type": "XX"}, "type"),
+        ({"category": "abc"}, "category"),
+        ({"start": "March"}, "start"),
+        ({"end": "2025-02-30"}, "end"),
+        ({"bucket": "day", "start": "2000-01-01"}, "bucket"),
+        ({"start": "2025-03-01", "end": "2025-02-01"}, "start"),
+    ],
+)
+def test_bad_params_are_rejected(api_client, history, params, key):
+    resp = api_client.get(URL, params)
+
+    assert resp.status_code == 400
+    assert list(resp.data) == [key]
+
+
+@pytest.mark.django_db
+@pytest.mark.parametrize("bucket, points", [("month", 12), ("week", 53), ("day", 365)])
+def test_range_ending_at_the_calendar_limit(api_client, auth_user, bucket, points):
+    resp = api_client.get(URL, {"bucket": bucket, "start": "9999-01-01", "end": "9999-12-31"})
+
+    assert resp.status_code == 200
+    assert len(resp.data["dates"]) == points
+    assert resp.data["dates"][-1] == date(9999, 12, {"month": 1, "week": 27, "day": 31}[bucket])
@@ -0,0 +1,92 @@
+# tests/test_transaction_bulk.py
+from decimal import Decimal
+
+import pytest
+from django.urls import reverse
+
+from finance.models import MonthlyCategoryTotal, Transaction
+from tests.factories import CategoryFactory, TransactionFactory, UserFactory
+
+LIST = reverse("finance:transactions-list")
+BULK = reverse("finance:transactions-bulk")
+
+
+@pytest.mark.django_db
+def test_bulk_create_is_one_insert(api_client, auth_user, django_assert_max_num_queries):
+    cat = CategoryFactory(user=auth_user)
+    rows = [{"category_id": cat.id, "type": "EX", "amount": f"{n}.00", "date": "2025-07-01"} for n in range(1, 51)]
+
+    with django_assert_max_num_queries(9):  # categories, INSERT, roll-up upsert + savepoints, cache version
+        resp = api_client.post(LIST, rows, format="json")
+
+    assert resp.status_code == 201, resp.data
+    assert len(resp.data) == 50 and all(row["id"] for row in resp.data)
+    assert MonthlyCategoryTotal.objects.get(category=cat).total == Decimal("1275.00")
+
+
+@pytest.mark.django_db
+def test_bulk_create_rejects_foreign_categories(api_client, auth_user):
+    mine, theirs = CategoryFactory(user=auth_user), CategoryFactory(user=UserFactory())
+    rows = [
+        {"category_id": mine.id, "type": "EX", "amount": "5", "date": "2025-07-01"},
+        {"category_id": theirs.id, "type": "EX", "amount": "5", "date": "2025-07-01"},
+    ]
+
+    resp = api_client.post(LIST, rows, format="json")
+
+    assert resp.status_code == 400
+    assert resp.data[1] == {"category_id": ["Unknown category."]}
+    assert not Transaction.objects.exists()
+
+
+@pytest.mark.django_db
+def test_bulk_partial_update_and_delete(api_client, auth_user):
+    cat, other = CategoryFactory(user=auth_user), CategoryFactory(user=auth_user)
+    a, b, c = TransactionFactory.create_batch(3, user=auth_user, category=cat, amount=10, date="2025-07-01")
+    stranger = TransactionFactory(amount=10)
+
+    resp = api_client.patch(
+        BULK,
+        [{"id": a.id, "amount": "25.00"}, {"id": b.id, "category_id": other.id}],
+        format="json",
+    )
+    assert resp.status_code == 200, resp.data
+    a.refresh_from_db()
+    b.refresh_from_db()
+    assert a.amount == Decimal("25.00") and b.category_id == other.id
+    assert MonthlyCategoryTotal.objects.get(category=cat).total == Decimal("35.00")
+
+    assert api_client.patch(BULK, [{"id": stranger.id, "amount": "1"}], format="json").status_code == 400
+
+    resp = api_client.delete(BULK, {"ids": [a.id, c.id, stranger.id]}, format="json")
+    assert resp.data == {"deleted": 2}
+    assert set(Transaction.objects.values_list("id", flat=True)) == {b.id, stranger.id}
+    assert MonthlyCategoryTotal.objects.get(category=cat).count == 0
+
+
+@pytest.mark.django_db
+def test_bulk_update_rejects_repeated_ids(api_client, auth_user):
+    cat = CategoryFactory(user=auth_user)
+    tx = TransactionFactory(user=auth_user, category=cat, amount=10, date="2025-07-01")
+
+    resp = api_client.patch(BULK, [{"id": tx.id, "amount": "25"}, {"id": tx.id, "amount": "50"}], format="json")
+
+    assert resp.status_code == 400
+    assert resp.data[1] == {"id": "Duplicate transaction id."}
+    assert Transaction.objects.get(pk=tx.pk).amount == Decimal("10.00")
+    assert MonthlyCategoryTotal.objects.get(category=cat).total == Decimal("10.00")
+
+
+@pytest.mark.django_db
+def test_bulk_payload_with_non_scalar_ids_is_a_400(api_client, auth_user):
+    cat = CategoryFactory(user=auth_user)
+    tx = TransactionFactory(user=auth_user, category=cat)
+
+    resp = api_client.post(
+        LIST, [{"category_id": [cat.id], "type": "EX", "amount": "5", "date": "2025-07-01"}], format="json"
+    )
+    assert resp.status_code == 400
+    assert "category_id" in resp.data[0]
+
+    resp = api_client.patch(BULK, [{"id": [tx.id], "category": {"id": cat.id}}], format="json")
+    assert resp.status_code == 400
@@ -0,0 +1,101 @@
+# tests/test_transaction_export.py
+import csv
+import io
+import json
+from datetime import date
+from decimal import Decimal
+
+import pytest
+from django.urls import reverse
+
+from finance import importers
+from tests.factories import CategoryFactory, TransactionFactory, UserFactory
+
+URL = reverse("finance:transactions-export")
+
+
+def _body(resp) -> str:
+    return b"".join(resp.streaming_content).decode()
+
+
+@pytest.fixture
+def rows(auth_user):
+    food = CategoryFactory(user=auth_user, name="Food")
+    salary = CategoryFactory(user=auth_user, name="Salary")
+    TransactionFactory(user=auth_user, category=food, type="EX", amount=Decimal("12.50"), date=date(2025, 7, 1))
+    TransactionFactory(user=auth_user, category=salary, type="IN", amount=Decimal("900"), date=date(2025, 7, 2))
+    TransactionFactory(user=auth_user, category=food, type="EX", amount=Decimal("7"), date=date(2025, 8, 1))
+    TransactionFactory(user=UserFactory(), amount=Decimal("1"))  # someone else's
+    return food, salary
+
+
+@pytest.mark.django_db
+def test_csv_export_streams_all_matching_rows(api_client, rows, django_assert_max_num_queries):
+    with django_assert_max_num_queries(1):
+        resp = api_client.get(URL, {"format": "csv", "ordering": "date"})
+        body = _body(resp)
+
+    assert resp.status_code == 200 and resp.streaming
+    assert resp["Content-Disposition"] == 'attachment; filename="transactions.csv"'
+    exported = list(csv.DictReader(io.StringIO(body)))
+    assert [(r["date"], r["type"], r["amount"], r["category"]) for r in exported] == [
+        ("2025-07-01", "EX", "12.50", "Food"),
+        ("2025-07-02", "IN", "900.00", "Salary"),
+        ("2025-08-01", "EX", "7.00", "Food"),
+    ]
+
+
+@pytest.mark.django_db
+def test_jsonl_export_honors_filters(api_client, rows):
+    food, _ = rows
+
+    resp = api_client.get(URL, {"format": "jsonl", "category": food.id, "ordering": "-date"})
+
+    assert resp["Content-Type"].startswith("application/x-ndjson")
+    lines = [json.loads(line) for line in _body(resp).splitlines()]
+    assert [(r["date"], r["amount"], r["category"]) for r in lines] == [
+        ("2025-08-01", "7.00", "Food"),
+        ("2025-07-01", "12.50", "Food"),
+    ]
+
+
+@pytest.mark.django_db
+def test_export_round_trips_through_the_importer(api_client, auth_user, rows):
+    body = _body(api_client.get(URL, {"format": "csv"}))
+    parsed = [importers.clean_row(raw) for _, raw in importers.parse_csv(io.StringIO(body))]
+
+    assert sorted((r["date"], r["type"], r["amount"], r["category"]) for r in parsed) == [
+        (date(2025, 7, 1), "EX", Decimal("12.50"), "Food"),
+        (date(2025, 7, 2), "IN", Decimal("900.00"), "Salary"),
+        (date(2025, 8, 1), "EX", Decimal("7.00"), "Food"),
+    ]
+
+
+@pytest.mark.django_db
+def test_unknown_format_is_rejected(api_client, auth_user):
+    assert api_client.get(URL, {"format": "xml"}).status_code == 404
+
+
+@pytest.mark.django_db
+@pytest.mark.parametrize(
+    "accept, content_type", [("application/json", "text/csv"), ("application/x-ndjson", "application/x-ndjson")]
+)
+def test_accept_header_without_format(api_client, rows, accept, content_type):
+    resp = api_client.get(URL, HTTP_ACCEPT=accept)
+
+    assert resp.status_code == 200
+    assert resp["Content-Type"].startswith(content_type)
+
+
+@pytest.mark.django_db
+def test_csv_cells_cannot_start_a_formula(api_client, auth_user):
+    evil = CategoryFactory(user=auth_user, name="=HYPERLINK(1)")
+    TransactionFactory(user=auth_user, category=evil, description="@SUM(A1:A9)")
+    TransactionFactory(user=auth_user, category=evil, description="-2+3")
+
+    exported = list(csv.DictReader(io.StringIO(_body(api_client.get(URL, {"format": "csv", "ordering": "id"})))))
+
+    assert [(r["category"], r["description"]) for r in exported] == [
+        ("'=HYPERLINK(1)", "'@SUM(A1:A9)"),
+        ("'=HYPERLINK(1)", "'-2+3"),
+    ]
@@ -0,0 +1,116 @@
+# tests/test_transaction_import.py
+from decimal import Decimal
+
+import pytest
+from django.core.files.uploadedfile import SimpleUploadedFile
+from django.core.management import call_command
+from django.urls import reverse
+
+from finance import importers, jobs
+from finance.models import Category, Job, JobFileChunk, MonthlyCategoryTotal, Transaction
+from tests.factories import CategoryFactory
+
+CSV = b"""Date,Amount,Category,Description
+2025-07-01,-45.50,Groceries,Market
+2025-07-02,2500,Salary,July pay
+2025-07-03,oops,Groceries,bad amount
+2025-07-04,-12.00,,uses default
+"""
+
+OFX = b"""OFXHEADER:100
+<OFX><BANKMSGSRSV1><STMTTRNRS><STMTRS><BANKTRANLIST>
+<STMTTRN><TRNTYPE>DEBIT<DTPOSTED>20250705120000<TRNAMT>-20.00<NAME>Coffee</STMTTRN>
+<STMTTRN><TRNTYPE>CREDIT<DTPOSTED>20250706<TRNAMT>15.25<NAME>Refund</STMTTRN>
+</BANKTRANLIST></STMTRS></STMTTRNRS></BANKMSGSRSV1></OFX>
+"""
+
+
+@pytest.mark.django_db
+def test_csv_import_endpoint_reports_bad_rows(api_client, auth_user):
+    misc = CategoryFactory(user=auth_user, name="Misc")
+    upload = SimpleUploadedFile("history.csv", CSV, content_type="text/csv")
+
+    resp = api_client.post(
+        reverse("finance:transactions-import-file"), {"file": upload, "category": misc.id}, format="multipart"
+    )
+
+    assert resp.status_code == 202, resp.data
+    assert resp.data["status"] == "queued"
+    assert not Transaction.objects.exists()
+    # the file travels through the database, not the web process's disk
+    job = Job.objects.get()
+    assert "content" not in job.payload
+    assert b"".join(bytes(c.data) for c in job.file_chunks.order_by("seq")) == CSV
+
+    jobs.run_next()
+    assert not JobFileChunk.objects.exists()
+    job = api_client.get(resp["Location"]).data
+    assert (job["status"], job["progress"]) == ("succeeded", 4)
+    assert job["result"]["imported"] == 3
+    assert job["result"]["errors"] == [{"row": 4, "error": "Invalid amount 'oops'."}]
+    groceries = Category.objects.get(user=auth_user, name="Groceries")  # created on the fly
+    expense = Transaction.objects.get(category=groceries)
+    assert (expense.type, expense.amount) == ("EX", Decimal("45.50"))
+    assert Transaction.objects.get(description="uses default").category == misc
+    # bulk_create bypasses signals, the importer feeds the roll-up itself
+    assert MonthlyCategoryTotal.objects.get(category=groceries).total == Decimal("45.50")
+
+
+@pytest.mark.django_db
+def test_import_command_parses_ofx(tmp_path, auth_user):
+    path = tmp_path / "statement.ofx"
+    path.write_bytes(OFX)
+
+    call_command("import_transactions", str(path), user=auth_user.email, category="Bank")
+
+    rows = Transaction.objects.filter(user=auth_user).order_by("date")
+    assert [(t.date.day, t.type, t.amount, t.description) for t in rows] == [
+        (5, "EX", Decimal("20.00"), "Coffee"),
+        (6, "IN", Decimal("15.25"), "Refund"),
+    ]
+
+
+@pytest.mark.django_db
+def test_import_rejects_unknown_format_synchronously(api_client, auth_user):
+    upload = SimpleUploadedFile("history.xlsx", b"...", content_type="application/octet-stream")
+
+    resp = api_client.post(reverse("finance:transactions-import-file"), {"file": upload}, format="multipart")
+
+    assert resp.status_code == 400
+    assert not Job.objects.exists()
+
+
+@pytest.mark.django_db
+def test_import_rejects_non_utf8_file(api_client, auth_user):
+    upload = SimpleUploadedFile("history.csv", "Date,Amount,Description\n2025-07-01,-3,Café\n".encode("latin-1"))
+
+    resp = api_client.post(reverse("finance:transactions-import-file"), {"file": upload}, format="multipart")
+
+    assert resp.status_code == 400
+    assert "UTF-8" in str(resp.data["file"])
+    assert not Job.objects.exists()
+
+
+@pytest.mark.parametrize("amount", ["12345678901", "99999999.999", "1e30"])
+def test_amount_beyond_the_column_is_a_row_error(amount):
+    with pytest.raises(ValueError):
+        importers.clean_row({"date": "2025-07-01", "amount": amount})
+
+    assert importers.clean_row({"date": "2025-07-01", "amount": "-99999999.99"})["amount"] == Decimal("99999999.99")
+
+
+@pytest.mark.django_db
+def test_file_is_streamed_back_across_chunk_boundaries(api_client, auth_user, monkeypatch):
+    monkeypatch.setattr(jobs, "FILE_CHUNK_SIZE", 7)  # splits rows and the two-byte "é"
+    content = "Date,Amount,Category,Description\n" + "".join(
+        f"2025-07-{day:02d},-{day}.00,Café,Visit {day}\n" for day in range(1, 21)
+    )
+    upload = SimpleUploadedFile("history.csv", content.encode(), content_type="text/csv")
+
+    api_client.post(reverse("finance:transactions-import-file"), {"file": upload}, format="multipart")
+    assert JobFileChunk.objects.count() == -(-len(content.encode()) // 7)
+    job = jobs.run_next()
+
+    assert (job.status, job.result["imported"]) == (Job.Status.SUCCEEDED, 20)
+    assert set(Transaction.objects.values_list("category__name", flat=True)) == {"Café"}
+    assert Transaction.objects.get(date="2025-07-20").description == "Visit 20"
@@ -0,0 +1,26 @@
+# tests/test_transaction_indexes.py
+import pytest
+from django.db import connection
+
+from finance.models import Transaction
+from tests.factories import CategoryFactory, TransactionFactory, UserFactory
+
+# Postgres happily seq-scans a near-empty table, so only pin the plans on SQLite.
+pytestmark = pytest.mark.skipif(connection.vendor != "sqlite", reason="query plans are SQLite-specific")
+
+
+@pytest.mark.django_db
+def test_hot_paths_use_composite_indexes():
+    user = UserFactory()
+    cat = CategoryFactory(user=user)
+    TransactionFactory.create_batch(5, user=user, category=cat)
+    qs = Transaction.objects.filter(user=user)
+
+    listing = qs.order_by("-date", "-id").explain()
+    budget = qs.filter(category=cat, type="EX", transfer__isnull=True, date__gte="2025-08-01").explain()
+    summary = qs.filter(transfer__isnull=True, date__gte="2025-01-01").values("category").explain()
+
+    assert "tx_user_date_idx" in listing
+    assert "TEMP B-TREE" not in listing  # ordering comes straight from the index
+    assert "tx_user_cat_type_date_idx" in budget
+    assert "tx_user_date_notr_idx" in summary
@@ -3,7 +3,7 @@ from decimal import Decimal
 
 import pytest
 from django.urls import reverse
-from factories import CategoryFactory, UserFactory  # if you have it
+from factories import CategoryFactory, TransferFactory, UserFactory  # if you have it
 
 from finance.models import Transaction
 
@@ -84,3 +84,19 @@ def test_post_transfer_validation_same_category(api_client):
     )
     assert resp.status_code == 400
     assert "non_field_errors" in resp.data or "detail" in resp.data
+
+
+@pytest.mark.django_db
+def test_transfer_list_does_not_query_per_row(api_client, django_assert_num_queries):
+    u = UserFactory()
+    api_client.force_authenticate(u)
+    TransferFactory.create_batch(15, user=u)
+
+    with django_assert_num_queries(3):  # count + page + prefetched legs
+        resp = api_client.get(reverse("finance:transfers-list"))
+
+    assert len(resp.data["results"]) == 15
+    for row in resp.data["results"]:
+        assert row["transactions"] == sorted(
+            Transaction.objects.filter(transfer_id=row["id"]).values_list("id", flat=True)
+        )
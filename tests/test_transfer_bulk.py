@@ -0,0 +1,76 @@
+# tests/test_transfer_bulk.py
+from decimal import Decimal
+
+import pytest
+from django.urls import reverse
+
+from finance.models import Transaction, Transfer
+from tests.factories import CategoryFactory, UserFactory
+
+URL = reverse("finance:transfers-list")
+
+
+@pytest.mark.django_db
+def test_bulk_transfer_create_is_constant_queries(api_client, auth_user, django_assert_max_num_queries):
+    income = CategoryFactory(user=auth_user, name="Income")
+    envelopes = CategoryFactory.create_batch(12, user=auth_user)
+    payload = [
+        {"source_category": income.id, "destination_category": c.id, "amount": "50.00", "date": "2025-09-01"}
+        for c in envelopes
+    ]
+
+    # categories + savepoint pair + 2 inserts + prefetch of the legs
+    with django_assert_max_num_queries(7):
+        resp = api_client.post(URL, payload, format="json")
+
+    assert resp.status_code == 201, resp.data
+    assert len(resp.data) == 12 and all(len(row["transactions"]) == 2 for row in resp.data)
+    assert Transaction.objects.filter(transfer__isnull=False).count() == 24
+    assert Transaction.objects.filter(category=income, type="EX").count() == 12
+
+
+@pytest.mark.django_db
+def test_bulk_transfer_rejects_foreign_categories(api_client, auth_user):
+    mine = CategoryFactory(user=auth_user)
+    theirs = CategoryFactory(user=UserFactory())
+    payload = [{"source_category": mine.id, "destination_category": theirs.id, "amount": "5", "date": "2025-09-01"}]
+
+    resp = api_client.post(URL, payload, format="json")
+
+    assert resp.status_code == 400
+    assert "destination_category" in resp.data[0]
+    assert not Transfer.objects.exists()
+
+
+@pytest.mark.django_db
+def test_update_swaps_categories_in_one_statement_and_heals(api_client, auth_user, django_assert_num_queries):
+    a, b, c = CategoryFactory.create_batch(3, user=auth_user)
+    created = api_client.post(
+        URL, {"source_category": a.id, "destination_category": b.id, "amount": "10", "date": "2025-09-01"}
+    ).data
+    url = reverse("finance:transfers-detail", args=[created["id"]])
+
+    # transfer + legs, auth user, two categories, savepoint pair around UPDATE transfer + one
+    # UPDATE of both legs + cache version bump, re-read legs for the response – independent
+    # of how many legs changed
+    with django_assert_num_queries(11):
+        api_client.patch(url, {"source_category": c.id, "amount": "12.50"})
+    legs = {t.type: t for t in Transaction.objects.filter(transfer_id=created["id"])}
+    assert (legs["EX"].category, legs["IN"].category) == (c, b)
+    assert {t.amount for t in legs.values()} == {Decimal("12.50")}
+
+    legs["IN"].delete()  # a missing side is recreated
+    api_client.patch(url, {"description": "rebalance"})
+    legs = {t.type: t for t in Transaction.objects.filter(transfer_id=created["id"])}
+    assert (legs["IN"].category, legs["IN"].amount, legs["IN"].description) == (b, Decimal("12.50"), "rebalance")
+
+
+@pytest.mark.django_db
+def test_bulk_create_with_non_scalar_category_is_a_400(api_client, auth_user):
+    a, b = CategoryFactory.create_batch(2, user=auth_user)
+    rows = [{"source_category": [a.id], "destination_category": b.id, "amount": "10", "date": "2025-09-01"}]
+
+    resp = api_client.post(URL, rows, format="json")
+
+    assert resp.status_code == 400
+    assert "source_category" in resp.data[0]